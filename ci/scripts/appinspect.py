@@ -36,27 +36,50 @@ USAGE:
 REQUIREMENTS:
     - Splunk.com account with AppInspect API access
     - SPLUNK_APPINSPECT_USERNAME and SPLUNK_APPINSPECT_PASSWORD env vars
+    - Optional: aiohttp for non-blocking status polling
+    - Optional: requests-toolbelt to stream package uploads from disk
+    - Optional: orjson for faster report (de)serialization
     - For publishing: Splunkbase developer account
 ===============================================================================
 """
 
 import argparse
+import asyncio
+import contextvars
+import functools
+import gzip
+import inspect
+import io
 import json
 import logging
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from enum import Enum
+from xml.sax.saxutils import escape
 
-try:
+if TYPE_CHECKING:
+    import aiohttp
     import requests
-    REQUESTS_AVAILABLE = True
+
+# The HTTP client libraries are only probed here and imported by the code
+# paths that use them, so --help and each client skip the others' cost
+REQUESTS_AVAILABLE = find_spec("requests") is not None
+TOOLBELT_AVAILABLE = find_spec("requests_toolbelt") is not None
+AIOHTTP_AVAILABLE = find_spec("aiohttp") is not None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    REQUESTS_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 logging.basicConfig(
     level=logging.INFO,
@@ -73,6 +96,27 @@ APPINSPECT_API_BASE = "https://appinspect.splunk.com/v1/app"
 SPLUNKBASE_API_BASE = "https://splunkbase.splunk.com/api/v1"
 AUTH_API_BASE = "https://api.splunk.com/2.0/rest/login/splunk"
 
+# Bearer tokens are reused across CLI invocations until shortly before expiry
+TOKEN_CACHE_PATH = Path("~/.cache/appinspect/token.json").expanduser()
+TOKEN_CACHE_TTL = 6 * 60 * 60  # Conservative; the login API reports no expiry
+TOKEN_CACHE_MARGIN = 60
+
+# Keep-alive pool of the shared requests session: hosts, connections per host
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 32
+
+# Concurrent connections the async client keeps per API host
+ASYNC_CONNECTIONS_PER_HOST = 8
+
+# Block size for sending streamed upload bodies
+UPLOAD_BLOCK_SIZE = 1 << 20
+
+# Read size when streaming the HTML report to disk
+HTML_CHUNK_SIZE = 1 << 16
+
+# Report artifacts AppInspectReporter can write
+REPORT_FORMATS = ("json", "html", "summary", "junit")
+
 
 class CheckResult(Enum):
     """AppInspect check result types"""
@@ -94,11 +138,25 @@ class InspectTag(Enum):
     APPINSPECT = "appinspect"
 
 
+# Plain-string views of the enums above for hot-path comparisons and
+# membership tests; report data carries the raw values
+INSPECT_TAGS = frozenset(tag.value for tag in InspectTag)
+BUCKETED_RESULTS = (
+    CheckResult.FAILED.value,
+    CheckResult.WARNING.value,
+    CheckResult.MANUAL.value,
+)
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
 
-@dataclass
+# dataclass(slots=...) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AppInspectConfig:
     """AppInspect configuration"""
     username: str
@@ -111,7 +169,8 @@ class AppInspectConfig:
     excluded_tags: List[str] = None
 
     # Timeouts
-    poll_interval: int = 10
+    poll_interval: int = 10  # Upper bound for backoff between status polls
+    long_poll_wait: int = 30  # Seconds the server may hold a status request
     max_wait_time: int = 600  # 10 minutes
 
     # Thresholds
@@ -120,8 +179,16 @@ class AppInspectConfig:
     fail_on_warning: bool = False
     fail_on_manual: bool = False
 
+    # Reports
+    report_formats: Optional[List[str]] = None  # None = all REPORT_FORMATS
+    html_only_on_failure: bool = False  # Skip the HTML download for passing runs
+    compress_json_report: bool = False  # Write the JSON report as .json.gz
+
+    # Reuse bearer tokens across invocations
+    use_token_cache: bool = True
+
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SplunkbaseConfig:
     """Splunkbase publishing configuration"""
     username: str
@@ -132,32 +199,280 @@ class SplunkbaseConfig:
     release_notes: str = ""
     visibility: str = "public"  # public, private
 
+    # Reuse bearer tokens across invocations
+    use_token_cache: bool = True
+
 
 # =============================================================================
-# AppInspect Client
+# Token Cache
 # =============================================================================
 
-class AppInspectClient:
+class TokenCache:
     """
-    Client for Splunk AppInspect API.
+    On-disk cache of Splunk.com bearer tokens keyed by username.
 
-    Handles:
-    - Authentication
-    - Package submission
-    - Status polling
-    - Report retrieval
+    The cache file is created with 0600 permissions so tokens are not
+    readable by other users.
     """
 
-    def __init__(self, config: AppInspectConfig):
+    def __init__(self, path: Path = TOKEN_CACHE_PATH):
+        self.path = path
+
+    def _load_all(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_all(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+        except OSError as e:
+            logger.debug(f"Token cache write failed (ignored): {e}")
+
+    def get(self, username: str) -> Optional[str]:
+        """Return a cached token that is not about to expire"""
+        entry = self._load_all().get(username)
+        if not entry:
+            return None
+        if entry.get("expires_at", 0) <= time.time() + TOKEN_CACHE_MARGIN:
+            return None
+        return entry.get("token")
+
+    def put(self, username: str, token: str, ttl: int = TOKEN_CACHE_TTL) -> None:
+        """Store a token for username"""
+        entries = self._load_all()
+        entries[username] = {"token": token, "expires_at": time.time() + ttl}
+        self._save_all(entries)
+
+    def invalidate(self, username: str) -> None:
+        """Drop the cached token for username"""
+        entries = self._load_all()
+        if entries.pop(username, None) is not None:
+            self._save_all(entries)
+
+
+# Set by the clients' response hooks on HTTP 401. A context variable keeps
+# the flag per thread and per asyncio task, so matrix runs sharing a client
+# only ever see their own responses.
+_UNAUTHORIZED: "contextvars.ContextVar[bool]" = contextvars.ContextVar(
+    "appinspect_unauthorized", default=False
+)
+
+
+def with_auth_retry(method):
+    """
+    Re-authenticate once and retry when a cached token is rejected.
+
+    The wrapped client's response hook flags HTTP 401 responses in
+    ``_UNAUTHORIZED``; if that happens while using a token from the cache,
+    the cache entry is dropped, a fresh token is requested and the call is
+    repeated. Re-authentication is serialized on the client's
+    ``_reauth_lock``: callers that were rejected with a token someone else
+    has already replaced just retry with the new one.
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            rejected = self._token
+            _UNAUTHORIZED.set(False)
+            result = await method(self, *args, **kwargs)
+            if not _UNAUTHORIZED.get():
+                return result
+            async with self._reauth_lock:
+                if self._token == rejected:
+                    if not self._token_cached:
+                        return result
+                    logger.info("Cached token rejected, re-authenticating")
+                    if not await self.authenticate(use_cache=False):
+                        self._token_cached = False
+                        return result
+            return await method(self, *args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        rejected = self._token
+        _UNAUTHORIZED.set(False)
+        result = method(self, *args, **kwargs)
+        if not _UNAUTHORIZED.get():
+            return result
+        with self._reauth_lock:
+            if self._token == rejected:
+                if not self._token_cached:
+                    return result
+                logger.info("Cached token rejected, re-authenticating")
+                if not self.authenticate(use_cache=False):
+                    self._token_cached = False
+                    return result
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _post_package(
+    request,
+    url: str,
+    file_field: str,
+    package_path: Path,
+    fileobj,
+    fields: Dict[str, str],
+    timeout: int
+) -> "requests.Response":
+    """
+    POST a package as multipart/form-data through ``request(method, url, ...)``.
+
+    With requests-toolbelt installed the body is streamed from disk;
+    otherwise requests builds the whole multipart body in memory.
+    """
+    if TOOLBELT_AVAILABLE:
+        from requests_toolbelt import MultipartEncoder
+
+        encoder = MultipartEncoder(fields={
+            **fields,
+            file_field: (package_path.name, fileobj, 'application/gzip'),
+        })
+        return request(
+            "POST",
+            url,
+            data=encoder,
+            headers={'Content-Type': encoder.content_type},
+            timeout=timeout
+        )
+
+    return request(
+        "POST",
+        url,
+        files={file_field: (package_path.name, fileobj, 'application/gzip')},
+        data=fields,
+        timeout=timeout
+    )
+
+
+# =============================================================================
+# HTTP Session
+# =============================================================================
+
+_SESSION: Optional["requests.Session"] = None
+
+
+def get_shared_session() -> "requests.Session":
+    """
+    Return the process-wide HTTP session shared by all Splunk.com clients.
+
+    Keeping one connection pool lets the AppInspect and Splunkbase clients
+    reuse keep-alive TLS connections to the same hosts. Authorization is
+    sent per request so tokens never leak between clients.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        class UploadAdapter(HTTPAdapter):
+            """Sends upload bodies in larger blocks than urllib3's 16 KiB default"""
+
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs.setdefault("blocksize", UPLOAD_BLOCK_SIZE)
+                super().init_poolmanager(*args, **kwargs)
+
+        session = requests.Session()
+        adapter = UploadAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            # read=False: a read timeout is raised as-is, not retried. Status
+            # long polls rely on seeing it as requests' ReadTimeout.
+            max_retries=Retry(
+                total=3,
+                read=False,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        session.mount("https://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
+class SplunkComClient:
+    """
+    Base class for clients authenticating against Splunk.com.
+
+    Handles token acquisition and caching, and attaches the bearer token
+    to each request sent through the shared session.
+    """
+
+    service_name = "Splunk.com"
+
+    def __init__(self, config, session: Optional["requests.Session"] = None):
         if not REQUESTS_AVAILABLE:
             raise ImportError("requests is required. Install: pip install requests")
 
         self.config = config
-        self._session = requests.Session()
+        self._session = session or get_shared_session()
         self._token: Optional[str] = None
+        self._token_cached = False
+        self._reauth_lock = threading.Lock()
+        self._token_cache = TokenCache()
+
+    def _on_response(self, response, *args, **kwargs):
+        if response.status_code == 401:
+            _UNAUTHORIZED.set(True)
+
+    def _request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """Send an authenticated request through the shared session"""
+        headers = kwargs.pop("headers", None) or {}
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
+
+        return self._session.request(
+            method,
+            url,
+            headers=headers,
+            hooks={"response": self._on_response},
+            **kwargs
+        )
+
+    def authenticate(self, use_cache: bool = True) -> bool:
+        """
+        Authenticate with Splunk.com.
+
+        Args:
+            use_cache: Reuse a still-valid token from the token cache
+
+        Returns:
+            True if authentication successful
+        """
+        if self.config.use_token_cache:
+            if use_cache:
+                token = self._token_cache.get(self.config.username)
+                if token:
+                    self._token = token
+                    self._token_cached = True
+                    logger.info(f"Using cached {self.service_name} token")
+                    return True
+            else:
+                self._token_cache.invalidate(self.config.username)
 
-    def authenticate(self) -> bool:
-        """Authenticate with Splunk AppInspect API"""
         try:
             response = self._session.post(
                 AUTH_API_BASE,
@@ -167,8 +482,10 @@ class AppInspectClient:
             if response.status_code == 200:
                 data = response.json()
                 self._token = data.get("data", {}).get("token")
-                self._session.headers["Authorization"] = f"Bearer {self._token}"
-                logger.info("AppInspect authentication successful")
+                self._token_cached = False
+                if self.config.use_token_cache and self._token:
+                    self._token_cache.put(self.config.username, self._token)
+                logger.info(f"{self.service_name} authentication successful")
                 return True
             else:
                 logger.error(f"Authentication failed: {response.status_code}")
@@ -178,32 +495,64 @@ class AppInspectClient:
             logger.error(f"Authentication error: {e}")
             return False
 
-    def submit_package(self) -> Tuple[bool, Optional[str]]:
+
+# =============================================================================
+# AppInspect Client
+# =============================================================================
+
+class AppInspectClient(SplunkComClient):
+    """
+    Client for Splunk AppInspect API.
+
+    Handles:
+    - Authentication
+    - Package submission
+    - Status polling
+    - Report retrieval
+    """
+
+    service_name = "AppInspect"
+
+    def __init__(self, config: AppInspectConfig, session: Optional["requests.Session"] = None):
+        super().__init__(config, session)
+
+    @with_auth_retry
+    def submit_package(self, included_tags: Optional[List[str]] = None) -> Tuple[bool, Optional[str]]:
         """
         Submit app package for inspection.
 
+        Args:
+            included_tags: Tags to include, overriding config.included_tags
+
         Returns:
             Tuple of (success, request_id)
         """
+        if included_tags is None:
+            included_tags = self.config.included_tags
+
         package_path = Path(self.config.package_path)
-        if not package_path.exists():
+        try:
+            f = open(package_path, 'rb')
+        except FileNotFoundError:
+            logger.error(f"Package not found: {package_path}")
             return False, None
 
         try:
             # Build request parameters
             params = {}
-            if self.config.included_tags:
-                params["included_tags"] = ",".join(self.config.included_tags)
+            if included_tags:
+                params["included_tags"] = ",".join(included_tags)
             if self.config.excluded_tags:
                 params["excluded_tags"] = ",".join(self.config.excluded_tags)
 
-            with open(package_path, 'rb') as f:
-                files = {'app_package': (package_path.name, f, 'application/gzip')}
-
-                response = self._session.post(
+            with f:
+                response = _post_package(
+                    self._request,
                     f"{APPINSPECT_API_BASE}/validate",
-                    files=files,
-                    data=params,
+                    'app_package',
+                    package_path,
+                    f,
+                    params,
                     timeout=120
                 )
 
@@ -220,16 +569,29 @@ class AppInspectClient:
             logger.error(f"Submission error: {e}")
             return False, None
 
-    def get_status(self, request_id: str) -> Tuple[str, Optional[Dict]]:
+    @with_auth_retry
+    def get_status(self, request_id: str, wait_seconds: int = 0) -> Tuple[str, Optional[Dict]]:
         """
         Get inspection status.
 
+        Args:
+            request_id: Inspection request ID
+            wait_seconds: Ask the server to hold the request open for up to
+                this many seconds until the status changes (long polling)
+
         Returns:
             Tuple of (status, info)
         """
+        import requests
+
+        params = {"wait": wait_seconds} if wait_seconds else None
+
         try:
-            response = self._session.get(
-                f"{APPINSPECT_API_BASE}/validate/status/{request_id}"
+            response = self._request(
+                "GET",
+                f"{APPINSPECT_API_BASE}/validate/status/{request_id}",
+                params=params,
+                timeout=wait_seconds + 5 if wait_seconds else None
             )
 
             if response.status_code == 200:
@@ -238,6 +600,10 @@ class AppInspectClient:
             else:
                 return "ERROR", None
 
+        except requests.exceptions.ReadTimeout:
+            # Long poll expired without a status change
+            return "PENDING", None
+
         except Exception as e:
             logger.error(f"Status check error: {e}")
             return "ERROR", None
@@ -246,14 +612,32 @@ class AppInspectClient:
         """
         Wait for inspection to complete.
 
+        Long-polls the status endpoint and reconnects immediately when the
+        server holds the request for the full window. If the server answers
+        early without honouring the wait, falls back to exponential backoff
+        (1s, 2s, 4s, ...) capped at poll_interval.
+
         Returns:
             Tuple of (success, final_status)
         """
-        start_time = time.time()
+        max_wait = self.config.max_wait_time
+        long_poll_wait = self.config.long_poll_wait
+        poll_interval = self.config.poll_interval
+        get_status = self.get_status
+        monotonic = time.monotonic
+
+        start_time = monotonic()
         last_status = ""
+        delay = 1
+
+        while True:
+            remaining = max_wait - (monotonic() - start_time)
+            if remaining <= 0:
+                break
 
-        while (time.time() - start_time) < self.config.max_wait_time:
-            status, info = self.get_status(request_id)
+            wait_seconds = max(1, int(min(long_poll_wait, remaining)))
+            poll_start = monotonic()
+            status, info = get_status(request_id, wait_seconds=wait_seconds)
 
             if status != last_status:
                 logger.info(f"Inspection status: {status}")
@@ -264,20 +648,26 @@ class AppInspectClient:
             elif status in ["FAILURE", "ERROR"]:
                 return False, info
 
-            time.sleep(self.config.poll_interval)
+            if monotonic() - poll_start >= wait_seconds:
+                continue
+
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, poll_interval)
 
         logger.error("Inspection timed out")
         return False, None
 
+    @with_auth_retry
     def get_report(self, request_id: str) -> Optional[Dict]:
         """Get detailed inspection report"""
         try:
-            response = self._session.get(
+            response = self._request(
+                "GET",
                 f"{APPINSPECT_API_BASE}/report/{request_id}"
             )
 
             if response.status_code == 200:
-                return response.json()
+                return _load_json(response.content)
             else:
                 logger.error(f"Report retrieval failed: {response.status_code}")
                 return None
@@ -286,18 +676,323 @@ class AppInspectClient:
             logger.error(f"Report retrieval error: {e}")
             return None
 
-    def get_html_report(self, request_id: str) -> Optional[str]:
-        """Get HTML formatted report"""
+    @with_auth_retry
+    def get_html_report(self, request_id: str, out_path: Path) -> Optional[Path]:
+        """
+        Stream the HTML formatted report to disk.
+
+        Args:
+            request_id: Inspection request ID
+            out_path: Destination file
+
+        Returns:
+            out_path on success, None otherwise
+        """
         try:
-            response = self._session.get(
+            with self._request(
+                "GET",
                 f"{APPINSPECT_API_BASE}/report/{request_id}",
-                headers={"Accept": "text/html"}
-            )
+                headers={"Accept": "text/html"},
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return None
+                with open(out_path, 'wb') as f:
+                    for chunk in response.iter_content(HTML_CHUNK_SIZE):
+                        f.write(chunk)
+            return out_path
 
-            if response.status_code == 200:
-                return response.text
+        except Exception as e:
+            logger.error(f"HTML report error: {e}")
             return None
 
+
+class AsyncAppInspectClient:
+    """
+    Asynchronous client for Splunk AppInspect API.
+
+    Mirrors AppInspectClient on top of a single aiohttp.ClientSession so
+    status polling yields to the event loop instead of blocking the thread,
+    allowing several inspections to run concurrently.
+
+    Usage:
+        async with AsyncAppInspectClient(config) as client:
+            await client.authenticate()
+            ...
+    """
+
+    def __init__(self, config: AppInspectConfig):
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required. Install: pip install aiohttp")
+
+        self.config = config
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._token: Optional[str] = None
+        self._token_cached = False
+        self._reauth_lock: Optional[asyncio.Lock] = None
+        self._token_cache = TokenCache()
+
+    async def __aenter__(self) -> "AsyncAppInspectClient":
+        import aiohttp
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_end.append(self._on_request_end)
+        # Keep a small pool of warm TLS connections so uploads, status polls
+        # and report downloads (across matrix runs) skip repeat handshakes
+        connector = aiohttp.TCPConnector(
+            limit_per_host=ASYNC_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=self.config.long_poll_wait + 15
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[trace_config]
+        )
+        # Created here rather than in __init__: on Python 3.9 a lock binds
+        # to the event loop current at creation
+        self._reauth_lock = asyncio.Lock()
+        return self
+
+    async def _on_request_end(self, session, trace_config_ctx, params) -> None:
+        if params.response.status == 401:
+            _UNAUTHORIZED.set(True)
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self._session:
+            await self._session.close()
+        self._session = None
+
+    def _headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        headers = {}
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
+        if extra:
+            headers.update(extra)
+        return headers
+
+    async def authenticate(self, use_cache: bool = True) -> bool:
+        """
+        Authenticate with Splunk AppInspect API.
+
+        Args:
+            use_cache: Reuse a still-valid token from the token cache
+
+        Returns:
+            True if authentication successful
+        """
+        if self.config.use_token_cache:
+            if use_cache:
+                token = self._token_cache.get(self.config.username)
+                if token:
+                    self._token = token
+                    self._token_cached = True
+                    logger.info("Using cached AppInspect token")
+                    return True
+            else:
+                self._token_cache.invalidate(self.config.username)
+
+        import aiohttp
+
+        try:
+            async with self._session.post(
+                AUTH_API_BASE,
+                auth=aiohttp.BasicAuth(self.config.username, self.config.password)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    self._token = data.get("data", {}).get("token")
+                    self._token_cached = False
+                    if self.config.use_token_cache and self._token:
+                        self._token_cache.put(self.config.username, self._token)
+                    logger.info("AppInspect authentication successful")
+                    return True
+                else:
+                    logger.error(f"Authentication failed: {response.status}")
+                    return False
+
+        except Exception as e:
+            logger.error(f"Authentication error: {e}")
+            return False
+
+    @with_auth_retry
+    async def submit_package(self, included_tags: Optional[List[str]] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Submit app package for inspection.
+
+        Args:
+            included_tags: Tags to include, overriding config.included_tags
+
+        Returns:
+            Tuple of (success, request_id)
+        """
+        if included_tags is None:
+            included_tags = self.config.included_tags
+
+        package_path = Path(self.config.package_path)
+        try:
+            f = open(package_path, 'rb')
+        except FileNotFoundError:
+            logger.error(f"Package not found: {package_path}")
+            return False, None
+
+        import aiohttp
+
+        try:
+            with f:
+                form = aiohttp.FormData()
+                form.add_field(
+                    'app_package', f,
+                    filename=package_path.name,
+                    content_type='application/gzip'
+                )
+                if included_tags:
+                    form.add_field("included_tags", ",".join(included_tags))
+                if self.config.excluded_tags:
+                    form.add_field("excluded_tags", ",".join(self.config.excluded_tags))
+
+                async with self._session.post(
+                    f"{APPINSPECT_API_BASE}/validate",
+                    data=form,
+                    headers=self._headers(),
+                    timeout=aiohttp.ClientTimeout(total=120)
+                ) as response:
+                    if response.status in [200, 202]:
+                        data = await response.json()
+                        request_id = data.get("request_id")
+                        logger.info(f"Package submitted, request_id: {request_id}")
+                        return True, request_id
+                    else:
+                        text = await response.text()
+                        logger.error(f"Submission failed: {response.status} - {text}")
+                        return False, None
+
+        except Exception as e:
+            logger.error(f"Submission error: {e}")
+            return False, None
+
+    @with_auth_retry
+    async def get_status(self, request_id: str, wait_seconds: int = 0) -> Tuple[str, Optional[Dict]]:
+        """
+        Get inspection status.
+
+        Args:
+            request_id: Inspection request ID
+            wait_seconds: Ask the server to hold the request open for up to
+                this many seconds until the status changes (long polling)
+
+        Returns:
+            Tuple of (status, info)
+        """
+        import aiohttp
+
+        params = {"wait": str(wait_seconds)} if wait_seconds else None
+        timeout = aiohttp.ClientTimeout(total=wait_seconds + 5) if wait_seconds else None
+
+        try:
+            async with self._session.get(
+                f"{APPINSPECT_API_BASE}/validate/status/{request_id}",
+                params=params,
+                headers=self._headers(),
+                timeout=timeout
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return data.get("status", "UNKNOWN"), data
+                else:
+                    return "ERROR", None
+
+        except asyncio.TimeoutError:
+            # Long poll expired without a status change
+            return "PENDING", None
+
+        except Exception as e:
+            logger.error(f"Status check error: {e}")
+            return "ERROR", None
+
+    async def wait_for_completion(self, request_id: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Wait for inspection to complete.
+
+        Uses the same long-poll/backoff strategy as
+        AppInspectClient.wait_for_completion.
+
+        Returns:
+            Tuple of (success, final_status)
+        """
+        max_wait = self.config.max_wait_time
+        long_poll_wait = self.config.long_poll_wait
+        poll_interval = self.config.poll_interval
+        get_status = self.get_status
+        now = asyncio.get_running_loop().time
+
+        start_time = now()
+        last_status = ""
+        delay = 1
+
+        while True:
+            remaining = max_wait - (now() - start_time)
+            if remaining <= 0:
+                break
+
+            wait_seconds = max(1, int(min(long_poll_wait, remaining)))
+            poll_start = now()
+            status, info = await get_status(request_id, wait_seconds=wait_seconds)
+
+            if status != last_status:
+                logger.info(f"Inspection status: {status}")
+                last_status = status
+
+            if status == "SUCCESS":
+                return True, info
+            elif status in ["FAILURE", "ERROR"]:
+                return False, info
+
+            if now() - poll_start >= wait_seconds:
+                continue
+
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, poll_interval)
+
+        logger.error("Inspection timed out")
+        return False, None
+
+    @with_auth_retry
+    async def get_report(self, request_id: str) -> Optional[Dict]:
+        """Get detailed inspection report"""
+        try:
+            async with self._session.get(
+                f"{APPINSPECT_API_BASE}/report/{request_id}",
+                headers=self._headers()
+            ) as response:
+                if response.status == 200:
+                    return _load_json(await response.read())
+                else:
+                    logger.error(f"Report retrieval failed: {response.status}")
+                    return None
+
+        except Exception as e:
+            logger.error(f"Report retrieval error: {e}")
+            return None
+
+    @with_auth_retry
+    async def get_html_report(self, request_id: str, out_path: Path) -> Optional[Path]:
+        """Stream the HTML formatted report to disk (see AppInspectClient)"""
+        try:
+            async with self._session.get(
+                f"{APPINSPECT_API_BASE}/report/{request_id}",
+                headers=self._headers({"Accept": "text/html"})
+            ) as response:
+                if response.status != 200:
+                    return None
+                with open(out_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(HTML_CHUNK_SIZE):
+                        f.write(chunk)
+                return out_path
+
         except Exception as e:
             logger.error(f"HTML report error: {e}")
             return None
@@ -307,64 +1002,143 @@ class AppInspectClient:
 # Report Generator
 # =============================================================================
 
+def _xml_attr(value: Any) -> str:
+    """Escape a value for use inside a double-quoted XML attribute"""
+    return escape(str(value), {'"': "&quot;"})
+
+
+# JUnit <testcase> fragments, filled in with str.format per check
+_TC_OPEN = '  <testcase name="{name}" classname="appinspect.{group}">\n'
+_TC_FAIL = '    <failure message="{description}">{messages}</failure>\n'
+_TC_ERR = '    <error message="{description}"/>\n'
+_TC_SKIP = '    <skipped/>\n'
+_TC_CLOSE = '  </testcase>\n'
+
+
 class AppInspectReporter:
     """Generates AppInspect reports in various formats"""
 
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, compress_json: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.compress_json = compress_json
+
+    def new_prefix(self) -> Path:
+        """Return the timestamped path prefix shared by one run's report files"""
+        timestamp = f"{datetime.now(timezone.utc):%Y%m%d_%H%M%S}"
+        return self.output_dir / f"appinspect_{timestamp}"
 
     def generate_reports(
         self,
         report_data: Dict,
         request_id: str,
-        html_report: Optional[str] = None
+        html_report: Optional[Union[str, Path]] = None,
+        formats: Optional[List[str]] = None,
+        prefix: Optional[Path] = None
     ) -> Dict[str, str]:
         """
         Generate reports in multiple formats.
 
+        Args:
+            report_data: Full AppInspect JSON report
+            request_id: Inspection request ID
+            html_report: HTML report body, or the path it was already
+                streamed to
+            formats: Subset of REPORT_FORMATS to write (default: all)
+            prefix: Path prefix from new_prefix() (default: a fresh one)
+
         Returns:
             Dict mapping format to file path
         """
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        files = {}
+        formats = REPORT_FORMATS if formats is None else formats
+        prefix = prefix or self.new_prefix()
+        categorized = self._categorize(report_data)
+        outputs: Dict[str, Tuple[Path, Union[str, bytes]]] = {}
 
         # JSON report
-        json_path = self.output_dir / f"appinspect_{timestamp}.json"
-        with open(json_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
-        files["json"] = str(json_path)
+        if "json" not in formats:
+            pass
+        elif self.compress_json:
+            # Level 1 is fast and still shrinks the repetitive report several-fold
+            json_path = prefix.with_suffix(".json.gz")
+            outputs["json"] = (json_path, gzip.compress(_dump_json(report_data), compresslevel=1))
+        else:
+            json_path = prefix.with_suffix(".json")
+            outputs["json"] = (json_path, _dump_json(report_data))
 
         # HTML report
-        if html_report:
-            html_path = self.output_dir / f"appinspect_{timestamp}.html"
-            with open(html_path, 'w') as f:
-                f.write(html_report)
-            files["html"] = str(html_path)
+        streamed: Dict[str, Path] = {}
+        if isinstance(html_report, Path):
+            streamed["html"] = html_report
+        elif html_report and "html" in formats:
+            html_path = prefix.with_suffix(".html")
+            outputs["html"] = (html_path, html_report)
 
         # Summary report (Markdown)
-        summary = self._generate_summary(report_data)
-        summary_path = self.output_dir / f"appinspect_{timestamp}.md"
-        with open(summary_path, 'w') as f:
-            f.write(summary)
-        files["summary"] = str(summary_path)
+        if "summary" in formats:
+            summary = self._generate_summary(report_data, categorized)
+            summary_path = prefix.with_suffix(".md")
+            outputs["summary"] = (summary_path, summary)
 
         # JUnit XML for CI integration
-        junit = self._generate_junit(report_data)
-        junit_path = self.output_dir / f"appinspect_{timestamp}.xml"
-        with open(junit_path, 'w') as f:
-            f.write(junit)
-        files["junit"] = str(junit_path)
+        if "junit" in formats:
+            junit = self._generate_junit(report_data, categorized)
+            junit_path = prefix.with_suffix(".xml")
+            outputs["junit"] = (junit_path, junit)
+
+        # The files are independent; overlap the writes
+        with ThreadPoolExecutor(max_workers=max(1, len(outputs))) as executor:
+            futures = {
+                fmt: executor.submit(
+                    path.write_bytes if isinstance(content, bytes) else path.write_text,
+                    content
+                )
+                for fmt, (path, content) in outputs.items()
+            }
+            for future in futures.values():
+                future.result()
+
+        files = {fmt: str(path) for fmt, (path, _) in outputs.items()}
+        files.update((fmt, str(path)) for fmt, path in streamed.items())
 
         logger.info(f"Reports generated in {self.output_dir}")
         return files
 
-    def _generate_summary(self, report_data: Dict) -> str:
+    def _categorize(self, report_data: Dict) -> Dict[str, List[Tuple[str, Dict]]]:
+        """
+        Walk the report once and bucket checks by result.
+
+        Returns:
+            Dict with "checks" holding every (group_name, check) pair in
+            report order, plus one list per result type
+        """
+        checks: List[Tuple[str, Dict]] = []
+        buckets: Dict[str, List[Tuple[str, Dict]]] = {result: [] for result in BUCKETED_RESULTS}
+
+        for report in report_data.get("reports", []):
+            for group in report.get("groups", []):
+                group_name = group.get("name", "default")
+                for check in group.get("checks", []):
+                    entry = (group_name, check)
+                    checks.append(entry)
+                    bucket = buckets.get(check.get("result", ""))
+                    if bucket is not None:
+                        bucket.append(entry)
+
+        return {"checks": checks, **buckets}
+
+    def _generate_summary(
+        self,
+        report_data: Dict,
+        categorized: Optional[Dict[str, List[Tuple[str, Dict]]]] = None
+    ) -> str:
         """Generate markdown summary"""
         summary = report_data.get("summary", {})
-        reports = report_data.get("reports", [])
+        if categorized is None:
+            categorized = self._categorize(report_data)
 
-        md = f"""# AppInspect Report
+        buf = io.StringIO()
+        buf.write(f"""# AppInspect Report
 
 ## Summary
 
@@ -378,129 +1152,94 @@ class AppInspectReporter:
 
 ## Details
 
-"""
-        # Group by result type
-        failures = []
-        warnings = []
-        manual_checks = []
-
-        for report in reports:
-            for group in report.get("groups", []):
-                for check in group.get("checks", []):
-                    result = check.get("result", "")
-                    if result == "failure":
-                        failures.append({
-                            "name": check.get("name"),
-                            "description": check.get("description"),
-                            "messages": check.get("messages", [])
-                        })
-                    elif result == "warning":
-                        warnings.append({
-                            "name": check.get("name"),
-                            "description": check.get("description"),
-                            "messages": check.get("messages", [])
-                        })
-                    elif result == "manual_check":
-                        manual_checks.append({
-                            "name": check.get("name"),
-                            "description": check.get("description"),
-                        })
+""")
+        failures = categorized["failure"]
+        warnings = categorized["warning"]
+        manual_checks = categorized["manual_check"]
 
         if failures:
-            md += "### Failures\n\n"
-            for f in failures:
-                md += f"#### {f['name']}\n\n"
-                md += f"{f['description']}\n\n"
-                for msg in f['messages']:
-                    md += f"- {msg.get('message', '')}\n"
-                md += "\n"
+            buf.write("### Failures\n\n")
+            for _, f in failures:
+                buf.write(f"#### {f.get('name')}\n\n")
+                buf.write(f"{f.get('description')}\n\n")
+                for msg in f.get('messages', []):
+                    buf.write(f"- {msg.get('message', '')}\n")
+                buf.write("\n")
 
         if warnings:
-            md += "### Warnings\n\n"
-            for w in warnings:
-                md += f"- **{w['name']}**: {w['description']}\n"
+            buf.write("### Warnings\n\n")
+            for _, w in warnings:
+                buf.write(f"- **{w.get('name')}**: {w.get('description')}\n")
 
         if manual_checks:
-            md += "### Manual Checks Required\n\n"
-            for m in manual_checks:
-                md += f"- **{m['name']}**: {m['description']}\n"
+            buf.write("### Manual Checks Required\n\n")
+            for _, m in manual_checks:
+                buf.write(f"- **{m.get('name')}**: {m.get('description')}\n")
 
-        return md
+        return buf.getvalue()
 
-    def _generate_junit(self, report_data: Dict) -> str:
+    def _generate_junit(
+        self,
+        report_data: Dict,
+        categorized: Optional[Dict[str, List[Tuple[str, Dict]]]] = None
+    ) -> str:
         """Generate JUnit XML for CI integration"""
         summary = report_data.get("summary", {})
-        reports = report_data.get("reports", [])
+        if categorized is None:
+            categorized = self._categorize(report_data)
 
         total = sum(summary.values())
         failures = summary.get("failure", 0)
         errors = summary.get("error", 0)
 
-        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<testsuite name="AppInspect" tests="{total}" failures="{failures}" errors="{errors}">
-'''
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<testsuite name="AppInspect" tests="{total}" failures="{failures}" errors="{errors}">\n'
+        ]
 
-        for report in reports:
-            for group in report.get("groups", []):
-                for check in group.get("checks", []):
-                    name = check.get("name", "unknown")
-                    result = check.get("result", "")
-                    description = check.get("description", "")
+        append = parts.append
+        open_fmt, fail_fmt, err_fmt = _TC_OPEN.format, _TC_FAIL.format, _TC_ERR.format
 
-                    xml += f'  <testcase name="{name}" classname="appinspect.{group.get("name", "default")}">\n'
+        for group_name, check in categorized["checks"]:
+            append(open_fmt(
+                name=_xml_attr(check.get("name", "unknown")),
+                group=_xml_attr(group_name)
+            ))
 
-                    if result == "failure":
-                        messages = " ".join(m.get("message", "") for m in check.get("messages", []))
-                        xml += f'    <failure message="{description}">{messages}</failure>\n'
-                    elif result == "error":
-                        xml += f'    <error message="{description}"/>\n'
-                    elif result == "skipped":
-                        xml += '    <skipped/>\n'
+            result = check.get("result", "")
+            if result == "failure":
+                append(fail_fmt(
+                    description=_xml_attr(check.get("description", "")),
+                    messages=escape(" ".join(m.get("message", "") for m in check.get("messages", [])))
+                ))
+            elif result == "error":
+                append(err_fmt(description=_xml_attr(check.get("description", ""))))
+            elif result == "skipped":
+                append(_TC_SKIP)
 
-                    xml += '  </testcase>\n'
+            append(_TC_CLOSE)
 
-        xml += '</testsuite>'
-        return xml
+        parts.append('</testsuite>')
+        return "".join(parts)
 
 
 # =============================================================================
 # Splunkbase Publisher
 # =============================================================================
 
-class SplunkbasePublisher:
+class SplunkbasePublisher(SplunkComClient):
     """
     Client for publishing to Splunkbase.
 
     Note: Requires approved AppInspect report and Splunkbase developer account.
     """
 
-    def __init__(self, config: SplunkbaseConfig):
-        self.config = config
-        self._session = requests.Session()
-        self._token: Optional[str] = None
-
-    def authenticate(self) -> bool:
-        """Authenticate with Splunk.com"""
-        try:
-            response = self._session.post(
-                AUTH_API_BASE,
-                auth=(self.config.username, self.config.password)
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                self._token = data.get("data", {}).get("token")
-                self._session.headers["Authorization"] = f"Bearer {self._token}"
-                logger.info("Splunkbase authentication successful")
-                return True
-            else:
-                logger.error(f"Authentication failed: {response.status_code}")
-                return False
+    service_name = "Splunkbase"
 
-        except Exception as e:
-            logger.error(f"Authentication error: {e}")
-            return False
+    def __init__(self, config: SplunkbaseConfig, session: Optional["requests.Session"] = None):
+        super().__init__(config, session)
 
+    @with_auth_retry
     def publish(self) -> Tuple[bool, str]:
         """
         Publish app to Splunkbase.
@@ -509,15 +1248,16 @@ class SplunkbasePublisher:
             Tuple of (success, message)
         """
         package_path = Path(self.config.package_path)
-        if not package_path.exists():
+        try:
+            f = open(package_path, 'rb')
+        except FileNotFoundError:
             return False, f"Package not found: {package_path}"
 
         try:
             # Build request
             url = f"{SPLUNKBASE_API_BASE}/apps/{self.config.app_id}/releases"
 
-            with open(package_path, 'rb') as f:
-                files = {'filename': (package_path.name, f, 'application/gzip')}
+            with f:
                 data = {
                     'version': self.config.version,
                     'visibility': self.config.visibility,
@@ -525,10 +1265,13 @@ class SplunkbasePublisher:
                 if self.config.release_notes:
                     data['release_notes'] = self.config.release_notes
 
-                response = self._session.post(
+                response = _post_package(
+                    self._request,
                     url,
-                    files=files,
-                    data=data,
+                    'filename',
+                    package_path,
+                    f,
+                    data,
                     timeout=300
                 )
 
@@ -541,10 +1284,12 @@ class SplunkbasePublisher:
         except Exception as e:
             return False, str(e)
 
+    @with_auth_retry
     def get_app_info(self) -> Optional[Dict]:
         """Get app information from Splunkbase"""
         try:
-            response = self._session.get(
+            response = self._request(
+                "GET",
                 f"{SPLUNKBASE_API_BASE}/apps/{self.config.app_id}"
             )
 
@@ -561,6 +1306,201 @@ class SplunkbasePublisher:
 # Workflow
 # =============================================================================
 
+def _passes_thresholds(config: AppInspectConfig, summary: Dict) -> bool:
+    """Apply the configured failure thresholds to a result summary"""
+    if config.fail_on_failure and summary.get("failure", 0) > 0:
+        return False
+    if config.fail_on_warning and summary.get("warning", 0) > 0:
+        return False
+    return True
+
+
+def _report_plan(config: AppInspectConfig, status: Optional[Dict]) -> Tuple[bool, bool]:
+    """
+    Decide which reports to download once an inspection has finished.
+
+    The status response already carries the result counts under "info"
+    (the same keys as the report's "summary"), so the thresholds can be
+    checked before fetching the (large) reports.
+
+    Returns:
+        Tuple of (fetch_json_report, fetch_html_report)
+    """
+    formats = config.report_formats or REPORT_FORMATS
+    summary = (status or {}).get("info")
+
+    fetch_json = bool({"json", "summary", "junit"} & set(formats)) or summary is None
+    fetch_html = "html" in formats
+    if fetch_html and config.html_only_on_failure and summary is not None:
+        fetch_html = not _passes_thresholds(config, summary)
+
+    return fetch_json, fetch_html
+
+
+def _evaluate_report(
+    config: AppInspectConfig,
+    reporter: "AppInspectReporter",
+    request_id: str,
+    report: Optional[Dict],
+    html_report: Optional[Path],
+    status: Optional[Dict] = None,
+    prefix: Optional[Path] = None,
+    report_requested: bool = True
+) -> Tuple[bool, Dict]:
+    """
+    Write output reports and apply the configured failure thresholds.
+
+    The status "info" counts stand in for the JSON report only when
+    report_requested is False, i.e. _report_plan skipped the download;
+    a requested report that could not be retrieved is an error.
+    """
+    if report is not None:
+        summary = report.get("summary", {})
+    elif not report_requested and status and "info" in status:
+        summary = status["info"]
+    else:
+        return False, {"error": "Failed to retrieve report"}
+
+    # Generate output reports
+    files = reporter.generate_reports(
+        report or {}, request_id, html_report, config.report_formats, prefix
+    )
+
+    # Check results
+    passed = _passes_thresholds(config, summary)
+
+    return passed, {
+        "request_id": request_id,
+        "summary": summary,
+        "files": files,
+        "passed": passed
+    }
+
+
+async def _none() -> None:
+    """Awaitable placeholder for a skipped download"""
+    return None
+
+
+async def _inspect_async(
+    client: AsyncAppInspectClient,
+    config: AppInspectConfig,
+    reporter: AppInspectReporter,
+    tags: Optional[List[str]] = None
+) -> Tuple[bool, Dict]:
+    """Submit, wait for and report on one inspection with an authenticated client"""
+    # Submit package
+    success, request_id = await client.submit_package(tags)
+    if not success:
+        return False, {"error": "Package submission failed"}
+
+    # Wait for completion
+    success, status = await client.wait_for_completion(request_id)
+    if not success:
+        return False, {"error": "Inspection failed", "status": status}
+
+    # Get reports
+    fetch_json, fetch_html = _report_plan(config, status)
+    # The downloads are independent; run them concurrently
+    prefix = reporter.new_prefix()
+    report, html_report = await asyncio.gather(
+        client.get_report(request_id) if fetch_json else _none(),
+        client.get_html_report(request_id, prefix.with_suffix(".html"))
+        if fetch_html else _none()
+    )
+
+    return _evaluate_report(
+        config, reporter, request_id, report, html_report, status, prefix,
+        report_requested=fetch_json
+    )
+
+
+def _inspect(
+    client: AppInspectClient,
+    config: AppInspectConfig,
+    reporter: AppInspectReporter,
+    tags: Optional[List[str]] = None
+) -> Tuple[bool, Dict]:
+    """Blocking counterpart of _inspect_async"""
+    # Submit package
+    success, request_id = client.submit_package(tags)
+    if not success:
+        return False, {"error": "Package submission failed"}
+
+    # Wait for completion
+    success, status = client.wait_for_completion(request_id)
+    if not success:
+        return False, {"error": "Inspection failed", "status": status}
+
+    # Get reports
+    fetch_json, fetch_html = _report_plan(config, status)
+    # The downloads are independent; run them concurrently
+    prefix = reporter.new_prefix()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        report_future = executor.submit(client.get_report, request_id) if fetch_json else None
+        html_future = (
+            executor.submit(client.get_html_report, request_id, prefix.with_suffix(".html"))
+            if fetch_html else None
+        )
+        report = report_future.result() if report_future else None
+        html_report = html_future.result() if html_future else None
+
+    return _evaluate_report(
+        config, reporter, request_id, report, html_report, status, prefix,
+        report_requested=fetch_json
+    )
+
+
+def _matrix_reporter(config: AppInspectConfig, tags: List[str]) -> AppInspectReporter:
+    """Reporter writing into a per-tag-set subdirectory of the output dir"""
+    subdir = "_".join(tags) or "all"
+    return AppInspectReporter(
+        str(Path(config.output_dir) / subdir),
+        config.compress_json_report
+    )
+
+
+async def run_appinspect_async(config: AppInspectConfig) -> Tuple[bool, Dict]:
+    """
+    Run complete AppInspect workflow without blocking the event loop.
+
+    Several packages can be inspected concurrently with asyncio.gather.
+
+    Returns:
+        Tuple of (passed, results)
+    """
+    reporter = AppInspectReporter(config.output_dir, config.compress_json_report)
+
+    async with AsyncAppInspectClient(config) as client:
+        # Authenticate
+        if not await client.authenticate():
+            return False, {"error": "Authentication failed"}
+
+        return await _inspect_async(client, config, reporter)
+
+
+async def run_appinspect_matrix_async(
+    config: AppInspectConfig,
+    tag_sets: List[List[str]]
+) -> Dict[Tuple[str, ...], Tuple[bool, Dict]]:
+    """
+    Inspect the package once per tag set, concurrently, over one session.
+
+    Returns:
+        Dict mapping tag set to (passed, results)
+    """
+    async with AsyncAppInspectClient(config) as client:
+        if not await client.authenticate():
+            return {tuple(tags): (False, {"error": "Authentication failed"}) for tags in tag_sets}
+
+        outcomes = await asyncio.gather(*[
+            _inspect_async(client, config, _matrix_reporter(config, tags), tags)
+            for tags in tag_sets
+        ])
+
+    return {tuple(tags): outcome for tags, outcome in zip(tag_sets, outcomes)}
+
+
 def run_appinspect(
     package_path: str,
     username: str,
@@ -568,11 +1508,17 @@ def run_appinspect(
     output_dir: str = "reports/appinspect",
     tags: Optional[List[str]] = None,
     fail_on_failure: bool = True,
-    fail_on_warning: bool = False
+    fail_on_warning: bool = False,
+    compress_json: bool = False,
+    report_formats: Optional[List[str]] = None,
+    html_only_on_failure: bool = False
 ) -> Tuple[bool, Dict]:
     """
     Run complete AppInspect workflow.
 
+    Uses the asynchronous client when aiohttp is installed and falls back
+    to the blocking requests-based client otherwise.
+
     Returns:
         Tuple of (passed, results)
     """
@@ -583,51 +1529,74 @@ def run_appinspect(
         output_dir=output_dir,
         included_tags=tags,
         fail_on_failure=fail_on_failure,
-        fail_on_warning=fail_on_warning
+        fail_on_warning=fail_on_warning,
+        compress_json_report=compress_json,
+        report_formats=report_formats,
+        html_only_on_failure=html_only_on_failure
     )
 
+    if AIOHTTP_AVAILABLE:
+        return asyncio.run(run_appinspect_async(config))
+
     client = AppInspectClient(config)
-    reporter = AppInspectReporter(output_dir)
+    reporter = AppInspectReporter(output_dir, config.compress_json_report)
 
     # Authenticate
     if not client.authenticate():
         return False, {"error": "Authentication failed"}
 
-    # Submit package
-    success, request_id = client.submit_package()
-    if not success:
-        return False, {"error": "Package submission failed"}
+    return _inspect(client, config, reporter)
 
-    # Wait for completion
-    success, status = client.wait_for_completion(request_id)
-    if not success:
-        return False, {"error": "Inspection failed", "status": status}
 
-    # Get reports
-    report = client.get_report(request_id)
-    html_report = client.get_html_report(request_id)
+def run_appinspect_matrix(
+    package_path: str,
+    username: str,
+    password: str,
+    tag_sets: List[List[str]],
+    output_dir: str = "reports/appinspect",
+    fail_on_failure: bool = True,
+    fail_on_warning: bool = False,
+    compress_json: bool = False,
+    report_formats: Optional[List[str]] = None,
+    html_only_on_failure: bool = False
+) -> Dict[Tuple[str, ...], Tuple[bool, Dict]]:
+    """
+    Run the AppInspect workflow once per tag set, concurrently.
 
-    if not report:
-        return False, {"error": "Failed to retrieve report"}
+    Authenticates once and submits every tag set in parallel, so total
+    wall time is that of the slowest inspection rather than the sum.
+    Reports for each tag set go to a subdirectory of output_dir.
 
-    # Generate output reports
-    files = reporter.generate_reports(report, request_id, html_report)
+    Returns:
+        Dict mapping tag set to (passed, results)
+    """
+    config = AppInspectConfig(
+        username=username,
+        password=password,
+        package_path=package_path,
+        output_dir=output_dir,
+        fail_on_failure=fail_on_failure,
+        fail_on_warning=fail_on_warning,
+        compress_json_report=compress_json,
+        report_formats=report_formats,
+        html_only_on_failure=html_only_on_failure
+    )
 
-    # Check results
-    summary = report.get("summary", {})
-    passed = True
+    if AIOHTTP_AVAILABLE:
+        return asyncio.run(run_appinspect_matrix_async(config, tag_sets))
 
-    if config.fail_on_failure and summary.get("failure", 0) > 0:
-        passed = False
-    if config.fail_on_warning and summary.get("warning", 0) > 0:
-        passed = False
+    client = AppInspectClient(config)
+    if not client.authenticate():
+        return {tuple(tags): (False, {"error": "Authentication failed"}) for tags in tag_sets}
 
-    return passed, {
-        "request_id": request_id,
-        "summary": summary,
-        "files": files,
-        "passed": passed
-    }
+    with ThreadPoolExecutor(max_workers=max(1, len(tag_sets))) as executor:
+        futures = {
+            tuple(tags): executor.submit(
+                _inspect, client, config, _matrix_reporter(config, tags), tags
+            )
+            for tags in tag_sets
+        }
+        return {tags: future.result() for tags, future in futures.items()}
 
 
 # =============================================================================
@@ -636,15 +1605,28 @@ def run_appinspect(
 
 def main():
     parser = argparse.ArgumentParser(description="Splunk AppInspect and Splunkbase CLI")
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    subparsers = parser.add_subparsers(dest="command", required=True, help="Command to run")
 
     # Check command
     check_parser = subparsers.add_parser("check", help="Run AppInspect checks")
     check_parser.add_argument("--package", required=True, help="Path to app package")
     check_parser.add_argument("--output", default="reports/appinspect", help="Output directory")
     check_parser.add_argument("--tags", nargs="+", help="AppInspect tags to include")
+    check_parser.add_argument(
+        "--tag-matrix", nargs="+", metavar="TAGS",
+        help="Run one inspection per comma-separated tag set, in parallel "
+             "(e.g. --tag-matrix cloud,security private_victoria)"
+    )
     check_parser.add_argument("--fail-on-warning", action="store_true")
     check_parser.add_argument("--json", action="store_true", help="Output JSON")
+    check_parser.add_argument("--compress-json", action="store_true",
+                              help="Write the JSON report as .json.gz")
+    check_parser.add_argument(
+        "--report-formats", default=",".join(REPORT_FORMATS),
+        help=f"Comma-separated reports to write (default: {','.join(REPORT_FORMATS)})"
+    )
+    check_parser.add_argument("--html-on-failure", action="store_true",
+                              help="Only download the HTML report when checks fail")
 
     # Publish command
     publish_parser = subparsers.add_parser("publish", help="Publish to Splunkbase")
@@ -655,6 +1637,24 @@ def main():
 
     args = parser.parse_args()
 
+    # Reject bad options before anything is uploaded
+    report_formats = None
+    tag_sets = None
+    if args.command == "check":
+        report_formats = [f for f in args.report_formats.split(",") if f]
+        unknown = set(report_formats) - set(REPORT_FORMATS)
+        if unknown:
+            parser.error(f"Unknown report formats: {', '.join(sorted(unknown))}")
+
+        if args.tag_matrix:
+            tag_sets = [[t for t in spec.split(",") if t] for spec in args.tag_matrix]
+        invalid = set(args.tags or []).union(*(tag_sets or [])) - INSPECT_TAGS
+        if invalid:
+            parser.error(
+                f"Invalid tags: {', '.join(sorted(invalid))} "
+                f"(valid: {', '.join(sorted(INSPECT_TAGS))})"
+            )
+
     # Get credentials from environment
     username = os.environ.get("SPLUNK_APPINSPECT_USERNAME")
     password = os.environ.get("SPLUNK_APPINSPECT_PASSWORD")
@@ -663,14 +1663,45 @@ def main():
         logger.error("SPLUNK_APPINSPECT_USERNAME and SPLUNK_APPINSPECT_PASSWORD required")
         sys.exit(1)
 
-    if args.command == "check":
+    if args.command == "check" and tag_sets:
+        matrix = run_appinspect_matrix(
+            args.package,
+            username,
+            password,
+            tag_sets,
+            args.output,
+            fail_on_warning=args.fail_on_warning,
+            compress_json=args.compress_json,
+            report_formats=report_formats,
+            html_only_on_failure=args.html_on_failure
+        )
+        passed = all(ok for ok, _ in matrix.values())
+
+        if args.json:
+            print(json.dumps({",".join(tags): results for tags, (_, results) in matrix.items()}, indent=2))
+        else:
+            for tags, (ok, results) in matrix.items():
+                summary = results.get("summary", {})
+                print(f"\nAppInspect Results [{','.join(tags) or 'all'}]:")
+                print(f"  Passed: {summary.get('success', 0)}")
+                print(f"  Failed: {summary.get('failure', 0)}")
+                print(f"  Warnings: {summary.get('warning', 0)}")
+                print(f"  Reports: {results.get('files', {})}")
+                print(f"  Overall: {'PASSED' if ok else 'FAILED'}")
+
+        sys.exit(0 if passed else 1)
+
+    elif args.command == "check":
         passed, results = run_appinspect(
             args.package,
             username,
             password,
             args.output,
             args.tags,
-            fail_on_warning=args.fail_on_warning
+            fail_on_warning=args.fail_on_warning,
+            compress_json=args.compress_json,
+            report_formats=report_formats,
+            html_only_on_failure=args.html_on_failure
         )
 
         if args.json:
@@ -706,10 +1737,6 @@ def main():
         print(message)
         sys.exit(0 if success else 1)
 
-    else:
-        parser.print_help()
-        sys.exit(1)
-
 
 if __name__ == "__main__":
     main()
@@ -34,6 +34,7 @@ USAGE:
 REQUIREMENTS:
     - splunk-sdk (pip install splunk-sdk)
     - requests (pip install requests)
+    - requests-toolbelt (optional, streams uploads from disk)
     - Target HF must have REST API enabled (port 8089)
     - Valid authentication token with admin capabilities
 ===============================================================================
@@ -41,27 +42,27 @@ REQUIREMENTS:
 
 import argparse
 import hashlib
+import io
 import json
 import logging
-import os
+import socket
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-# SDK Imports
-try:
+if TYPE_CHECKING:
+    import requests
     import splunklib.client as splunk_client
-    SPLUNK_SDK_AVAILABLE = True
-except ImportError:
-    SPLUNK_SDK_AVAILABLE = False
 
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+# SDK availability; the (heavy) imports happen in SplunkDeploymentClient.connect
+SPLUNK_SDK_AVAILABLE = find_spec("splunklib") is not None
+REQUESTS_AVAILABLE = find_spec("requests") is not None
+TOOLBELT_AVAILABLE = find_spec("requests_toolbelt") is not None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -69,6 +70,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Read size for streaming package I/O
+CHUNK_SIZE = 1 << 20
+
+# Keep-alive pool shared by splunk-sdk calls and uploads
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+
+# Backoff between readiness probes while waiting for a restart
+RESTART_POLL_INITIAL_DELAY = 1.0
+RESTART_POLL_MAX_DELAY = 10.0
+
+# Seconds a cached REST read (server info, apps, confs, messages) stays valid
+CACHE_TTL = 10
+
+
+class HashingReader:
+    """
+    Read-through file wrapper that hashes bytes as they are consumed.
+
+    Lets an upload and its checksum share a single pass over the file.
+    """
+
+    def __init__(self, fileobj, algorithm: str = "sha256"):
+        self._file = fileobj
+        self.digest = hashlib.new(algorithm)
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        self.digest.update(chunk)
+        return chunk
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
 
 # =============================================================================
 # Configuration
@@ -93,6 +128,7 @@ class DeploymentConfig:
     update_if_exists: bool = True
     restart_required: bool = False
     check_for_updates: bool = True
+    log_checksum: bool = False  # Log the package SHA-256 (hashed during upload)
 
     # Timeouts
     upload_timeout: int = 300
@@ -122,16 +158,25 @@ class SplunkDeploymentClient:
             )
 
         self.config = config
-        self._service: Optional[splunk_client.Service] = None
-        self._session: Optional[requests.Session] = None
+        self._service: Optional["splunk_client.Service"] = None
+        self._session: Optional["requests.Session"] = None
+        self._cache: Dict[Any, Tuple[float, Any]] = {}
 
     def connect(self) -> bool:
         """Connect to Splunk using splunk-sdk"""
+        import splunklib.client as splunk_client
+
         try:
+            # One keep-alive session carries both uploads and splunk-sdk
+            # calls; it survives reconnects (e.g. after a restart)
+            if self._session is None:
+                self._session = self._create_session()
+
             connect_kwargs = {
                 "host": self.config.host,
                 "port": self.config.port,
                 "scheme": "https" if self.config.use_ssl else "http",
+                "handler": self._sdk_request,
             }
 
             if self.config.token:
@@ -143,15 +188,10 @@ class SplunkDeploymentClient:
                 raise ValueError("Token or username/password required")
 
             self._service = splunk_client.connect(**connect_kwargs)
-
-            # Create requests session for file uploads
-            self._session = requests.Session()
-            self._session.verify = self.config.verify_ssl
-            if self.config.token:
-                self._session.headers["Authorization"] = f"Bearer {self.config.token}"
+            self._invalidate()
 
             # Verify connection
-            info = self._service.info
+            info = self._server_info()
             version = info.get("version", "unknown")
             server_name = info.get("serverName", "unknown")
 
@@ -168,6 +208,110 @@ class SplunkDeploymentClient:
             logger.error(f"Connection failed: {e}")
             return False
 
+    def _create_session(self) -> "requests.Session":
+        """Create the pooled HTTP session used for all REST calls"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.verify = self.config.verify_ssl
+        if self.config.token:
+            session.headers["Authorization"] = f"Bearer {self.config.token}"
+
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        # Stream upload bodies in CHUNK_SIZE blocks instead of urllib3's
+        # 16 KiB default, cutting read()/send() calls and filling TLS records
+        adapter.init_poolmanager(HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, blocksize=CHUNK_SIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _sdk_request(self, url: str, message: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """
+        splunk-sdk HTTP handler that sends requests through the pooled session.
+
+        The SDK's default handler opens (and closes) a new connection for
+        every call; routing it through requests keeps connections alive.
+        """
+        from splunklib.binding import ResponseReader
+
+        response = self._session.request(
+            message.get("method", "GET"),
+            url,
+            data=message.get("body") or None,
+            headers=dict(message.get("headers", [])),
+            timeout=kwargs.get("timeout")
+        )
+        return {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": list(response.headers.items()),
+            "body": ResponseReader(io.BytesIO(response.content)),
+        }
+
+    # -------------------------------------------------------------------------
+    # Cached REST reads
+    # -------------------------------------------------------------------------
+
+    def _cached(self, key: Any, fetcher: Callable[[], Any]) -> Any:
+        """Return a recent result for key, calling fetcher on a miss"""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < CACHE_TTL:
+            return hit[1]
+
+        value = fetcher()
+        self._cache[key] = (now, value)
+        return value
+
+    def _invalidate(self, *keys: Any) -> None:
+        """
+        Drop cached reads after a state change (all of them if no keys).
+
+        A plain string key also drops tuple keys it prefixes, e.g.
+        "messages" covers ("messages", "*restart*").
+        """
+        if not keys:
+            self._cache.clear()
+        for key in list(self._cache):
+            if key in keys or (isinstance(key, tuple) and key[0] in keys):
+                del self._cache[key]
+
+    def _server_info(self) -> Dict[str, Any]:
+        return self._cached("info", lambda: self._service.info)
+
+    def _get_app(self, app_name: str) -> Optional["splunk_client.Application"]:
+        def fetch():
+            try:
+                return self._service.apps[app_name]
+            except KeyError:
+                return None
+
+        return self._cached(("app", app_name), fetch)
+
+    def _messages(self, name_pattern: str) -> List[Dict[str, Any]]:
+        """
+        Fetch system messages whose name matches a wildcard pattern.
+
+        Filters server-side in a single request rather than paging through
+        the whole messages collection.
+        """
+        def fetch():
+            response = self._service.get(
+                "/services/messages",
+                search=f"name={name_pattern}",
+                output_mode="json",
+                count=0
+            )
+            return json.loads(response.body.read()).get("entry", [])
+
+        return self._cached(("messages", name_pattern), fetch)
+
     def disconnect(self) -> None:
         """Disconnect from Splunk"""
         if self._service:
@@ -175,15 +319,18 @@ class SplunkDeploymentClient:
                 self._service.logout()
             except Exception:
                 pass
+        if self._session:
+            self._session.close()
         self._service = None
         self._session = None
+        self._invalidate()
 
     def get_server_info(self) -> Dict[str, Any]:
         """Get detailed server information"""
         if not self._service:
             return {}
 
-        info = self._service.info
+        info = self._server_info()
         return {
             "version": info.get("version"),
             "build": info.get("build"),
@@ -207,9 +354,8 @@ class SplunkDeploymentClient:
             return False, None
 
         try:
-            apps = self._service.apps
-            if app_name in apps:
-                app = apps[app_name]
+            app = self._get_app(app_name)
+            if app is not None:
                 return True, {
                     "name": app.name,
                     "version": app.content.get("version", "unknown"),
@@ -230,7 +376,8 @@ class SplunkDeploymentClient:
         """
         Upload and install an app package via REST API.
 
-        Uses /services/apps/local endpoint for installation.
+        Uses the /services/apps/local endpoint, which overwrites an existing
+        app in place when update=true is sent.
 
         Args:
             package_path: Path to .tar.gz or .spl package
@@ -247,20 +394,14 @@ class SplunkDeploymentClient:
             return False, f"Package not found: {package_path}"
 
         try:
-            # Calculate checksum for verification
-            with open(package_path, 'rb') as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
-            logger.info(f"Package checksum: sha256:{file_hash}")
-
             # Build upload URL
             base_url = f"{'https' if self.config.use_ssl else 'http'}://{self.config.host}:{self.config.port}"
             upload_url = f"{base_url}/services/apps/local"
 
-            # Prepare multipart upload
+            # Prepare multipart upload; if requested, the checksum is
+            # computed from the same reads that feed the request body
             with open(package_path, 'rb') as f:
-                files = {
-                    'appfile': (package_path.name, f, 'application/gzip')
-                }
+                reader = HashingReader(f) if self.config.log_checksum else f
                 data = {
                     'name': package_path.stem.replace('.tar', ''),
                     'filename': 'true',
@@ -269,24 +410,42 @@ class SplunkDeploymentClient:
 
                 logger.info(f"Uploading {package_path.name} to {self.config.host}...")
 
-                response = self._session.post(
-                    upload_url,
-                    files=files,
-                    data=data,
-                    timeout=self.config.upload_timeout
-                )
+                if TOOLBELT_AVAILABLE:
+                    from requests_toolbelt import MultipartEncoder
+
+                    # Streams the body from disk instead of building it in memory
+                    encoder = MultipartEncoder(fields={
+                        **data,
+                        'appfile': (package_path.name, reader, 'application/gzip'),
+                    })
+                    response = self._session.post(
+                        upload_url,
+                        data=encoder,
+                        headers={'Content-Type': encoder.content_type},
+                        timeout=self.config.upload_timeout
+                    )
+                else:
+                    response = self._session.post(
+                        upload_url,
+                        files={'appfile': (package_path.name, reader, 'application/gzip')},
+                        data=data,
+                        timeout=self.config.upload_timeout
+                    )
+
+            if self.config.log_checksum:
+                logger.info(f"Package checksum: sha256:{reader.digest.hexdigest()}")
 
             if response.status_code in [200, 201]:
                 logger.info("App uploaded successfully")
+                self._invalidate()
                 return True, "App installed successfully"
 
             elif response.status_code == 409:
-                # App already exists
+                # App already exists; with update=true the POST above
+                # overwrites it in place, so no second upload is attempted
                 if update:
-                    logger.info("App exists, attempting update...")
-                    return self._update_app(package_path)
-                else:
-                    return False, "App already exists and update=False"
+                    return False, f"Upload conflict: {response.text}"
+                return False, "App already exists and update=False"
 
             else:
                 return False, f"Upload failed: {response.status_code} - {response.text}"
@@ -295,44 +454,18 @@ class SplunkDeploymentClient:
             logger.error(f"Upload error: {e}")
             return False, str(e)
 
-    def _update_app(self, package_path: Path) -> Tuple[bool, str]:
-        """Update an existing app"""
-        # Get app name from package
-        app_name = package_path.stem.replace('.tar', '').replace('.spl', '')
-
-        base_url = f"{'https' if self.config.use_ssl else 'http'}://{self.config.host}:{self.config.port}"
-        update_url = f"{base_url}/services/apps/local/{app_name}"
-
-        try:
-            with open(package_path, 'rb') as f:
-                files = {'appfile': (package_path.name, f, 'application/gzip')}
-
-                response = self._session.post(
-                    update_url,
-                    files=files,
-                    timeout=self.config.upload_timeout
-                )
-
-            if response.status_code in [200, 201]:
-                return True, "App updated successfully"
-            else:
-                return False, f"Update failed: {response.status_code} - {response.text}"
-
-        except Exception as e:
-            return False, str(e)
-
     def enable_app(self, app_name: str) -> Tuple[bool, str]:
         """Enable an app"""
         if not self._service:
             return False, "Not connected"
 
         try:
-            apps = self._service.apps
-            if app_name not in apps:
+            app = self._get_app(app_name)
+            if app is None:
                 return False, f"App not found: {app_name}"
 
-            app = apps[app_name]
             app.enable()
+            self._invalidate(("app", app_name), "messages")
             logger.info(f"App {app_name} enabled")
             return True, "App enabled"
 
@@ -345,12 +478,12 @@ class SplunkDeploymentClient:
             return False, "Not connected"
 
         try:
-            apps = self._service.apps
-            if app_name not in apps:
+            app = self._get_app(app_name)
+            if app is None:
                 return False, f"App not found: {app_name}"
 
-            app = apps[app_name]
             app.disable()
+            self._invalidate(("app", app_name), "messages")
             logger.info(f"App {app_name} disabled")
             return True, "App disabled"
 
@@ -373,20 +506,29 @@ class SplunkDeploymentClient:
         try:
             logger.info("Initiating Splunk restart...")
             self._service.restart(timeout=self.config.restart_timeout)
+            self._invalidate()
 
             if wait:
                 logger.info("Waiting for Splunk to restart...")
-                time.sleep(30)  # Initial wait
+                deadline = time.monotonic() + self.config.restart_timeout
+                delay = RESTART_POLL_INITIAL_DELAY
 
-                # Reconnect
-                for attempt in range(10):
+                # Probe with exponential backoff instead of fixed sleeps
+                while True:
                     try:
-                        if self.connect():
+                        if (self._port_open()
+                                and self.connect()
+                                and not self.check_restart_required()):
                             logger.info("Splunk restarted successfully")
                             return True, "Restart complete"
                     except Exception:
                         pass
-                    time.sleep(10)
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    time.sleep(min(delay, remaining))
+                    delay = min(delay * 1.5, RESTART_POLL_MAX_DELAY)
 
                 return False, "Restart timeout - Splunk may still be starting"
 
@@ -395,17 +537,21 @@ class SplunkDeploymentClient:
         except Exception as e:
             return False, str(e)
 
+    def _port_open(self) -> bool:
+        """Cheap readiness probe: can a TCP connection be made to splunkd?"""
+        try:
+            with socket.create_connection((self.config.host, self.config.port), timeout=2):
+                return True
+        except OSError:
+            return False
+
     def check_restart_required(self) -> bool:
         """Check if a restart is required"""
         if not self._service:
             return False
 
         try:
-            messages = self._service.messages
-            for msg in messages:
-                if "restart" in msg.name.lower():
-                    return True
-            return False
+            return bool(self._messages("*restart*"))
         except Exception:
             return False
 
@@ -414,7 +560,7 @@ class SplunkDeploymentClient:
         if not self._service:
             return {}
 
-        try:
+        def fetch():
             # Use the confs endpoint
             confs = self._service.confs
             if conf_file in confs:
@@ -424,6 +570,9 @@ class SplunkDeploymentClient:
                     for stanza in conf
                 }
             return {}
+
+        try:
+            return self._cached(("conf", conf_file), fetch)
         except Exception as e:
             logger.error(f"Error reading config: {e}")
             return {}
@@ -453,53 +602,66 @@ class SplunkDeploymentClient:
                 # Create new stanza
                 conf.create(stanza, **settings)
 
+            self._invalidate(("conf", conf_file), "messages")
             logger.info(f"Updated {conf_file}/{stanza}")
             return True, "Configuration updated"
 
         except Exception as e:
             return False, str(e)
 
-    def validate_deployment(self, app_name: str) -> Tuple[bool, List[str]]:
+    def validate_deployment(self, app_name: str) -> Tuple[bool, List[str], Optional[Dict]]:
         """
         Validate that app is properly deployed.
 
         Returns:
-            Tuple of (valid, issues)
+            Tuple of (valid, issues, app_info); app_info is the installed
+            app's details as returned by check_app_installed
         """
         issues = []
 
         if not self._service:
-            return False, ["Not connected"]
+            return False, ["Not connected"], None
+
+        # The probes are independent REST round trips; run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            installed_future = executor.submit(self.check_app_installed, app_name)
+            # Required configuration is specific to kvstore_syncthing
+            conf_future = (
+                executor.submit(self.get_app_config, app_name, "app")
+                if app_name == "kvstore_syncthing" else None
+            )
+            messages_future = executor.submit(self._app_error_messages, app_name)
 
-        # Check app installed
-        installed, app_info = self.check_app_installed(app_name)
-        if not installed:
-            issues.append("App is not installed")
-            return False, issues
+            # Check app installed
+            installed, app_info = installed_future.result()
+            if not installed:
+                issues.append("App is not installed")
+                return False, issues, None
 
-        # Check app enabled
-        if app_info and app_info.get("disabled"):
-            issues.append("App is disabled")
+            # Check app enabled
+            if app_info and app_info.get("disabled"):
+                issues.append("App is disabled")
 
-        # Check for required configurations
-        # This is specific to kvstore_syncthing
-        if app_name == "kvstore_syncthing":
             # Check if app.conf exists
-            app_conf = self.get_app_config(app_name, "app")
-            if not app_conf:
+            if conf_future and not conf_future.result():
                 issues.append("app.conf not found or empty")
 
-        # Check for error messages
+            # Check for error messages
+            issues.extend(messages_future.result())
+
+        return len(issues) == 0, issues, app_info
+
+    def _app_error_messages(self, app_name: str) -> List[str]:
+        """Collect error-severity system messages mentioning an app"""
+        errors = []
         try:
-            messages = self._service.messages
-            for msg in messages:
-                if app_name.lower() in msg.name.lower():
-                    if "error" in msg.content.get("severity", "").lower():
-                        issues.append(f"Error message: {msg.content.get('value', '')}")
+            for msg in self._messages(f"*{app_name}*"):
+                content = msg.get("content", {})
+                if "error" in content.get("severity", "").lower():
+                    errors.append(f"Error message: {content.get('value', '')}")
         except Exception:
             pass
-
-        return len(issues) == 0, issues
+        return errors
 
 
 # =============================================================================
@@ -632,7 +794,7 @@ class HFDeploymentWorkflow:
 
             # Step 7: Validate deployment
             logger.info("Step 7: Validating deployment...")
-            valid, issues = self.client.validate_deployment(self.config.app_name)
+            valid, issues, deployed_app = self.client.validate_deployment(self.config.app_name)
             report["steps"].append({
                 "step": "validate",
                 "success": valid,
@@ -646,9 +808,8 @@ class HFDeploymentWorkflow:
             else:
                 logger.warning(f"Deployment completed with issues: {issues}")
 
-            # Get final app info
-            _, final_info = self.client.check_app_installed(self.config.app_name)
-            report["deployed_app"] = final_info
+            # Final app info, as fetched during validation
+            report["deployed_app"] = deployed_app
 
             return valid, report
 
@@ -685,6 +846,7 @@ def main():
     parser.add_argument("--app-name", default="kvstore_syncthing", help="App name")
     parser.add_argument("--no-update", action="store_true", help="Don't update if app exists")
     parser.add_argument("--restart", action="store_true", help="Restart Splunk after deployment")
+    parser.add_argument("--log-checksum", action="store_true", help="Log the package SHA-256")
 
     # Output arguments
     parser.add_argument("--json", action="store_true", help="Output report as JSON")
@@ -709,6 +871,7 @@ def main():
         app_package=args.package,
         update_if_exists=not args.no_update,
         restart_required=args.restart,
+        log_checksum=args.log_checksum,
     )
 
     # Execute deployment
@@ -717,15 +880,20 @@ def main():
 
     # Output report
     if args.json or args.output:
-        report_json = json.dumps(report, indent=2, default=str)
+        # Encode once, streaming chunks to every destination
+        with open(args.output, 'w') if args.output else nullcontext() as out_file:
+            sinks = [out_file.write] if out_file else []
+            if args.json:
+                sinks.append(sys.stdout.write)
 
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(report_json)
-            logger.info(f"Report written to: {args.output}")
+            for chunk in json.JSONEncoder(indent=2, default=str).iterencode(report):
+                for write in sinks:
+                    write(chunk)
 
         if args.json:
-            print(report_json)
+            sys.stdout.write("\n")
+        if args.output:
+            logger.info(f"Report written to: {args.output}")
     else:
         # Human-readable output
         print("\n" + "=" * 60)
@@ -35,6 +35,10 @@ TOOLS INTEGRATED:
 - pip-audit: Python package audit
 - detect-secrets: Secret detection
 
+REQUIREMENTS:
+    - Optional: orjson for faster scanner output parsing and report writing
+    - Optional: ijson to stream large scanner output instead of loading it whole
+
 USAGE:
     python security_scan.py --all --output reports/security/
     python security_scan.py --bandit --semgrep --output reports/security/
@@ -42,18 +46,42 @@ USAGE:
 """
 
 import argparse
+import fnmatch
+import functools
 import json
 import logging
 import os
+import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import IO, Any, Callable, Dict, Iterator, List, Mapping, Optional, Pattern, Tuple
 from enum import Enum
 import hashlib
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Raised for truncated or malformed tool output (orjson's error subclasses ValueError)
+JSON_ERRORS = (ValueError, ijson.JSONError) if IJSON_AVAILABLE else (ValueError,)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -73,6 +101,13 @@ class Severity(Enum):
     INFO = "info"
 
 
+# Precomputed so per-report loops don't re-iterate the enum
+_SEVERITIES: Tuple[Severity, ...] = tuple(Severity)
+_SEVERITY_VALUES: Tuple[str, ...] = tuple(s.value for s in _SEVERITIES)
+# Severities that get their own markdown section
+_MD_SEVERITIES = (Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW)
+
+
 class ScanType(Enum):
     SAST = "sast"  # Static Application Security Testing
     SCA = "sca"   # Software Composition Analysis
@@ -80,10 +115,122 @@ class ScanType(Enum):
     DAST = "dast"  # Dynamic (placeholder)
 
 
+def _severity_map(labels: Dict[str, Severity]) -> Mapping[str, Severity]:
+    """Freeze a tool's label -> Severity table, pre-expanded to UPPER/lower/Title casing"""
+    expanded = {}
+    for label, severity in labels.items():
+        for variant in (label.upper(), label.lower(), label.capitalize()):
+            expanded[variant] = severity
+    return MappingProxyType(expanded)
+
+
+# Per-file result cache for the SAST scanners
+CACHE_DIR_NAME = ".scan_cache"
+CACHE_TTL_SECONDS = 24 * 3600
+CACHE_MAX_ENTRIES = 2000
+
+# Argument bytes of scan targets per scanner invocation, well below ARG_MAX
+TARGET_ARGS_MAX_BYTES = 128 * 1024
+
+# Read buffer for scanner stdout pipes; keeps large JSON reads to few syscalls
+PIPE_BUFFER_SIZE = 1 << 20
+
+# Successful `<tool> --version` probes, keyed by resolved binary and its mtime
+TOOL_PROBE_CACHE_PATH = Path("~/.cache/kvstore-syncthing/tool_probe.json").expanduser()
+
+
+def _chunk_targets(targets: List[str], max_bytes: int = TARGET_ARGS_MAX_BYTES) -> Iterator[List[str]]:
+    """Split command-line targets into runs whose argument bytes fit max_bytes"""
+    chunk: List[str] = []
+    size = 0
+    for target in targets:
+        arg_size = len(os.fsencode(target)) + 1
+        if chunk and size + arg_size > max_bytes:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(target)
+        size += arg_size
+    if chunk:
+        yield chunk
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse tool output, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temp sibling and rename, so readers never see it half-written"""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _iter_json_items(stream: IO[bytes], *prefixes: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (prefix, item) for each array element under the given ijson-style
+    prefixes, e.g. "results.item" or "item" for a top-level array.
+
+    With ijson each item is built as it streams in, so peak memory is one
+    item rather than the whole document; otherwise the stream is parsed whole.
+    """
+    if not IJSON_AVAILABLE:
+        data = _load_json(stream.read())
+        for prefix in prefixes:
+            node = data
+            for key in prefix.split(".")[:-1]:
+                node = node.get(key) if isinstance(node, dict) else None
+            if isinstance(node, list):
+                for item in node:
+                    yield prefix, item
+        return
+
+    events = ijson.parse(stream, use_float=True)
+    for path, event, value in events:
+        if path not in prefixes:
+            continue
+        if event not in ("start_map", "start_array"):
+            yield path, value
+            continue
+
+        builder = ijson.ObjectBuilder()
+        depth = 0
+        while True:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+                if not depth:
+                    break
+            _, event, value = next(events)
+        yield path, builder.value
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
 
+# dataclass(slots=...) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _glob_regex(patterns: List[str]) -> Optional[Pattern]:
+    """Compile shell globs into one alternation regex (None if no patterns)"""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
 @dataclass
 class ScanConfig:
     """Security scan configuration"""
@@ -102,8 +249,42 @@ class ScanConfig:
     fail_on_high: bool = True
     fail_on_medium: bool = False
 
+    # Reuse per-file results for unchanged files (disabled by --force-reindex)
+    use_cache: bool = True
+
+    # Compiled from the glob lists above
+    include_regex: Optional[Pattern] = field(init=False, repr=False, compare=False)
+    exclude_regex: Optional[Pattern] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.include_regex = _glob_regex(self.include_patterns)
+        self.exclude_regex = _glob_regex(self.exclude_patterns)
+
+    def matches(self, path: str) -> bool:
+        """Whether a path is selected by include_patterns and not excluded"""
+        if self.exclude_regex and self.exclude_regex.match(path):
+            return False
+        return self.include_regex is None or bool(self.include_regex.match(path))
+
+    def source_files(self) -> List[str]:
+        """Selected files under source_dir, as normalized relative paths"""
+        files = []
+        for root, dirs, names in os.walk(self.source_dir):
+            rel_root = os.path.relpath(root, self.source_dir)
+            if self.exclude_regex:
+                dirs[:] = [
+                    d for d in dirs
+                    if not self.exclude_regex.match(os.path.normpath(os.path.join(rel_root, d)))
+                ]
+            dirs.sort()
+            for name in sorted(names):
+                rel = os.path.normpath(os.path.join(rel_root, name))
+                if self.matches(rel):
+                    files.append(rel)
+        return files
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Finding:
     """Security finding"""
     tool: str
@@ -133,6 +314,14 @@ class Finding:
             "references": self.references
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Finding":
+        return cls(**{
+            **data,
+            "scan_type": ScanType(data["scan_type"]),
+            "severity": Severity(data["severity"])
+        })
+
 
 @dataclass
 class ScanResult:
@@ -142,15 +331,167 @@ class ScanResult:
     timestamp: str
     duration_seconds: float
     findings: List[Finding]
-    raw_output: Optional[str] = None
+    raw_output: Optional[str] = None  # Not retained by the built-in scanners
     error: Optional[str] = None
 
     @property
     def finding_counts(self) -> Dict[str, int]:
-        counts = {s.value: 0 for s in Severity}
-        for f in self.findings:
-            counts[f.severity.value] += 1
-        return counts
+        counts = Counter(f.severity for f in self.findings)
+        return {v: counts[s] for s, v in zip(_SEVERITIES, _SEVERITY_VALUES)}
+
+
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+def _config_digest(path: str) -> str:
+    """BLAKE2 digest of a tool configuration file, or "" if it doesn't exist"""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+class ScanCache:
+    """
+    Per-file findings from previous runs of one tool.
+
+    Stored as JSON under output_dir/.scan_cache/<tool>.json and discarded
+    wholesale when the tool version, command options or configuration files
+    change. A file is unchanged if its (mtime, size) match, or failing that
+    its BLAKE2 digest.
+    """
+
+    def __init__(self, config: ScanConfig, tool: str, options: List[str]):
+        self.config = config
+        self.path = Path(config.output_dir) / CACHE_DIR_NAME / f"{tool}.json"
+        self.key = hashlib.blake2b(json.dumps(options).encode()).hexdigest()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+        if config.use_cache:
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if data.get("key") == self.key:
+                    self.entries = data.get("entries", {})
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable scan cache {self.path}: {e}")
+
+    def _stat(self, rel: str) -> Tuple[int, int]:
+        st = os.stat(os.path.join(self.config.source_dir, rel))
+        return st.st_mtime_ns, st.st_size
+
+    def _digest(self, rel: str) -> str:
+        with open(os.path.join(self.config.source_dir, rel), "rb") as f:
+            return hashlib.blake2b(f.read()).hexdigest()
+
+    def lookup(self, rel: str) -> Optional[List[Finding]]:
+        """Cached findings for an unchanged file, or None if it must be rescanned"""
+        entry = self.entries.get(rel)
+        if entry is None or time.time() - entry["stored"] > CACHE_TTL_SECONDS:
+            return None
+
+        try:
+            mtime_ns, size = self._stat(rel)
+            if (mtime_ns, size) != (entry["mtime_ns"], entry["size"]):
+                if size != entry["size"] or self._digest(rel) != entry["digest"]:
+                    return None
+                entry["mtime_ns"] = mtime_ns  # Touched but not modified
+        except OSError:
+            return None
+
+        return [Finding.from_dict(f) for f in entry["findings"]]
+
+    def store(self, rel: str, findings: List[Finding]) -> None:
+        try:
+            mtime_ns, size = self._stat(rel)
+            digest = self._digest(rel)
+        except OSError:
+            return
+
+        self.entries[rel] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "digest": digest,
+            "stored": time.time(),
+            "findings": [f.to_dict() for f in findings]
+        }
+
+    def save(self, files: List[str]) -> None:
+        """Persist entries for the given (still existing) files, newest first"""
+        present = set(files)
+        entries = sorted(
+            ((rel, e) for rel, e in self.entries.items() if rel in present),
+            key=lambda item: item[1]["stored"],
+            reverse=True
+        )[:CACHE_MAX_ENTRIES]
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self.path, json.dumps({"key": self.key, "entries": dict(entries)}).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not write scan cache {self.path}: {e}")
+
+
+# =============================================================================
+# Tool Probes
+# =============================================================================
+
+_probe_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_tool(cmd: Tuple[str, ...]) -> Tuple[bool, str]:
+    """
+    Run a tool's version command; returns (available, version output).
+
+    Results are memoized for the process, and successful probes are also
+    persisted to TOOL_PROBE_CACHE_PATH so later runs skip the subprocess
+    until the binary on PATH is replaced or upgraded.
+    """
+    binary = shutil.which(cmd[0])
+    if binary is None:
+        return False, ""
+    prefix = f"{' '.join(cmd)}|{binary}|"
+    try:
+        key = f"{prefix}{os.stat(binary).st_mtime_ns}"
+    except OSError:
+        return False, ""
+
+    with _probe_cache_lock:
+        entries = _load_probe_cache()
+    if key in entries:
+        return True, entries[key]
+
+    try:
+        result = subprocess.run(list(cmd), capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired):
+        return False, ""
+    if result.returncode != 0:
+        return False, ""
+
+    version = result.stdout.strip()
+    with _probe_cache_lock:
+        entries = {k: v for k, v in _load_probe_cache().items() if not k.startswith(prefix)}
+        entries[key] = version
+        try:
+            TOOL_PROBE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(TOOL_PROBE_CACHE_PATH, json.dumps(entries).encode("utf-8"))
+        except OSError as e:
+            logger.debug(f"Tool probe cache write failed (ignored): {e}")
+    return True, version
+
+
+def _load_probe_cache() -> Dict[str, str]:
+    try:
+        with open(TOOL_PROBE_CACHE_PATH) as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
 
 
 # =============================================================================
@@ -160,15 +501,26 @@ class ScanResult:
 class SecurityScanner:
     """Base class for security scanners"""
 
+    # Tool severity label -> Severity, and the fallback for unknown labels
+    _SEV_MAP: Mapping[str, Severity] = _severity_map({})
+    _SEV_DEFAULT = Severity.INFO
+
     def __init__(self, config: ScanConfig):
         self.config = config
         self.name = "base"
         self.scan_type = ScanType.SAST
+        self.version = ""
 
     def is_available(self) -> bool:
         """Check if scanner tool is available"""
         raise NotImplementedError
 
+    def _map_severity(self, level: str) -> Severity:
+        severity = self._SEV_MAP.get(level)
+        if severity is None:  # Unusual casing or unknown label
+            severity = self._SEV_MAP.get(level.upper(), self._SEV_DEFAULT)
+        return severity
+
     def run(self) -> ScanResult:
         """Run the scan"""
         raise NotImplementedError
@@ -189,6 +541,148 @@ class SecurityScanner:
         except Exception as e:
             return -1, "", str(e)
 
+    def _run_json_command(
+        self,
+        cmd: List[str],
+        timeout: int = 300,
+        consume: Optional[Callable[[IO[bytes]], Any]] = None
+    ) -> Tuple[int, Any, str]:
+        """
+        Run a command that prints a JSON document and parse it from the pipe.
+
+        The raw bytes from stdout are parsed directly, without first being
+        decoded into a str. consume, if given, reads the stdout pipe itself
+        (e.g. streaming it through _iter_json_items) and its return value
+        becomes data. Returns (returncode, data, stderr); data is None when
+        the tool printed nothing or invalid JSON.
+        """
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=PIPE_BUFFER_SIZE,
+                cwd=self.config.source_dir
+            )
+        except Exception as e:
+            return -1, None, str(e)
+
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        # Drain stderr concurrently so a chatty tool can't block on a full pipe
+        stderr_chunks: List[bytes] = []
+        drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()))
+        timer = threading.Timer(timeout, kill)
+        drain.start()
+        timer.start()
+
+        try:
+            with proc.stdout:
+                try:
+                    if consume is not None:
+                        data = consume(proc.stdout)
+                    else:
+                        raw = proc.stdout.read()
+                        data = _load_json(raw) if raw.strip() else None
+                except JSON_ERRORS:
+                    data = None
+                proc.stdout.read()  # Discard anything the consumer left unread
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            drain.join()
+            proc.stderr.close()
+
+        if timed_out.is_set():
+            return -1, None, "Command timed out"
+        return returncode, data, b"".join(stderr_chunks).decode(errors="replace")
+
+    def _parse_result(self, result: Dict[str, Any]) -> Finding:
+        """Convert one entry of the tool's "results" array into a finding"""
+        raise NotImplementedError
+
+    def _parse_results(self, stream: IO[bytes]) -> Tuple[List[Finding], set]:
+        """Stream "results" into findings; also returns the paths the tool reported errors for"""
+        findings = []
+        failed = set()
+        for prefix, item in _iter_json_items(stream, "results.item", "errors.item"):
+            if prefix == "errors.item":
+                if isinstance(item, dict):
+                    failed.add(os.path.normpath(item.get("filename") or item.get("path") or ""))
+            else:
+                findings.append(self._parse_result(item))
+        return findings, failed
+
+    def _run_incremental(
+        self,
+        cmd: List[str],
+        timeout: int = 300,
+        config_files: Tuple[str, ...] = ()
+    ) -> Tuple[List[Finding], str]:
+        """
+        Run a per-file scanner over only the files changed since the last run.
+
+        cmd is the command without targets; the dirty files are appended to
+        it, split over several invocations when there are too many for one
+        command line. config_files (relative to source_dir) are the tool's
+        configuration; editing one invalidates the cache like changing cmd.
+        Returns (findings, stderr) with findings in source-tree order.
+        """
+        files = self.config.source_files()
+        options = cmd + [self.version]
+        for path in config_files:
+            options += [path, _config_digest(os.path.join(self.config.source_dir, path))]
+        cache = ScanCache(self.config, self.name, options)
+
+        by_file: Dict[str, List[Finding]] = {}
+        dirty = []
+        for rel in files:
+            cached = cache.lookup(rel)
+            if cached is None:
+                dirty.append(rel)
+            else:
+                by_file[rel] = cached
+
+        stderr = ""
+        extra: List[Finding] = []
+        if dirty:
+            logger.info(f"{self.name}: scanning {len(dirty)} of {len(files)} files")
+            fresh: Dict[str, List[Finding]] = {rel: [] for rel in dirty}
+            failed: set = set()
+            stderr_parts = []
+            for targets in _chunk_targets([os.path.join(".", rel) for rel in dirty]):
+                _, parsed, chunk_stderr = self._run_json_command(
+                    cmd + targets,
+                    timeout=timeout,
+                    consume=self._parse_results
+                )
+                if chunk_stderr:
+                    stderr_parts.append(chunk_stderr)
+                if parsed is None:
+                    return [], "".join(stderr_parts)
+
+                parsed_findings, chunk_failed = parsed
+                failed |= chunk_failed
+                for finding in parsed_findings:
+                    rel = os.path.normpath(finding.file_path or "")
+                    (fresh[rel] if rel in fresh else extra).append(finding)
+            stderr = "".join(stderr_parts)
+
+            for rel, found in fresh.items():
+                if rel not in failed:
+                    cache.store(rel, found)
+            by_file.update(fresh)
+            cache.save(files)
+        else:
+            logger.info(f"{self.name}: all {len(files)} files unchanged, using cached results")
+
+        findings = [f for rel in files for f in by_file.get(rel, [])]
+        return findings + extra, stderr
+
 
 # =============================================================================
 # Bandit Scanner (Python SAST)
@@ -197,73 +691,65 @@ class SecurityScanner:
 class BanditScanner(SecurityScanner):
     """Bandit - Python security linter"""
 
+    _SEV_MAP = _severity_map({
+        "HIGH": Severity.HIGH,
+        "MEDIUM": Severity.MEDIUM,
+        "LOW": Severity.LOW
+    })
+
     def __init__(self, config: ScanConfig):
         super().__init__(config)
         self.name = "bandit"
         self.scan_type = ScanType.SAST
 
     def is_available(self) -> bool:
-        code, _, _ = self._run_command(["bandit", "--version"])
-        return code == 0
+        available, self.version = _probe_tool(("bandit", "--version"))
+        return available
 
     def run(self) -> ScanResult:
         start_time = datetime.utcnow()
-        findings = []
 
         cmd = [
             "bandit",
-            "-r", ".",
             "-f", "json",
             "-ll",  # Low and above
             "--exclude", ",".join(self.config.exclude_patterns)
         ]
 
+        # Bandit can also pick up a .bandit file from the scanned tree
+        config_files: Tuple[str, ...] = (".bandit",)
         if self.config.bandit_config:
             cmd.extend(["-c", self.config.bandit_config])
+            config_files += (self.config.bandit_config,)
 
-        code, stdout, stderr = self._run_command(cmd)
+        findings, stderr = self._run_incremental(cmd, config_files=config_files)
         duration = (datetime.utcnow() - start_time).total_seconds()
 
         if stderr and "No issues identified" not in stderr:
             logger.warning(f"Bandit stderr: {stderr}")
 
-        try:
-            if stdout:
-                data = json.loads(stdout)
-                for result in data.get("results", []):
-                    severity = self._map_severity(result.get("issue_severity", ""))
-                    findings.append(Finding(
-                        tool="bandit",
-                        scan_type=ScanType.SAST,
-                        severity=severity,
-                        title=result.get("issue_text", ""),
-                        description=result.get("issue_text", ""),
-                        file_path=result.get("filename"),
-                        line_number=result.get("line_number"),
-                        code_snippet=result.get("code"),
-                        cwe=f"CWE-{result.get('issue_cwe', {}).get('id', '')}" if result.get('issue_cwe') else None,
-                        recommendation=result.get("more_info"),
-                        references=[result.get("more_info", "")] if result.get("more_info") else []
-                    ))
-        except json.JSONDecodeError:
-            pass
-
         return ScanResult(
             tool="bandit",
             scan_type=ScanType.SAST,
             timestamp=start_time.isoformat(),
             duration_seconds=duration,
-            findings=findings,
-            raw_output=stdout
+            findings=findings
         )
 
-    def _map_severity(self, level: str) -> Severity:
-        mapping = {
-            "HIGH": Severity.HIGH,
-            "MEDIUM": Severity.MEDIUM,
-            "LOW": Severity.LOW
-        }
-        return mapping.get(level.upper(), Severity.INFO)
+    def _parse_result(self, result: Dict[str, Any]) -> Finding:
+        return Finding(
+            tool="bandit",
+            scan_type=ScanType.SAST,
+            severity=self._map_severity(result.get("issue_severity", "")),
+            title=result.get("issue_text", ""),
+            description=result.get("issue_text", ""),
+            file_path=result.get("filename"),
+            line_number=result.get("line_number"),
+            code_snippet=result.get("code"),
+            cwe=f"CWE-{result.get('issue_cwe', {}).get('id', '')}" if result.get('issue_cwe') else None,
+            recommendation=result.get("more_info"),
+            references=[result.get("more_info", "")] if result.get("more_info") else []
+        )
 
 
 # =============================================================================
@@ -273,18 +759,23 @@ class BanditScanner(SecurityScanner):
 class SemgrepScanner(SecurityScanner):
     """Semgrep - Multi-language static analysis"""
 
+    _SEV_MAP = _severity_map({
+        "ERROR": Severity.HIGH,
+        "WARNING": Severity.MEDIUM,
+        "INFO": Severity.LOW
+    })
+
     def __init__(self, config: ScanConfig):
         super().__init__(config)
         self.name = "semgrep"
         self.scan_type = ScanType.SAST
 
     def is_available(self) -> bool:
-        code, _, _ = self._run_command(["semgrep", "--version"])
-        return code == 0
+        available, self.version = _probe_tool(("semgrep", "--version"))
+        return available
 
     def run(self) -> ScanResult:
         start_time = datetime.utcnow()
-        findings = []
 
         cmd = [
             "semgrep",
@@ -295,47 +786,35 @@ class SemgrepScanner(SecurityScanner):
         for rule in self.config.semgrep_rules:
             cmd.extend(["--config", rule])
 
+        # Semgrep scans the whole tree in every language it supports, so it
+        # isn't limited to ScanConfig.source_files() through _run_incremental
         cmd.append(".")
 
-        code, stdout, stderr = self._run_command(cmd, timeout=600)
+        _, parsed, _ = self._run_json_command(cmd, timeout=600, consume=self._parse_results)
+        findings = parsed[0] if parsed else []
         duration = (datetime.utcnow() - start_time).total_seconds()
 
-        try:
-            if stdout:
-                data = json.loads(stdout)
-                for result in data.get("results", []):
-                    severity = self._map_severity(result.get("extra", {}).get("severity", ""))
-                    findings.append(Finding(
-                        tool="semgrep",
-                        scan_type=ScanType.SAST,
-                        severity=severity,
-                        title=result.get("check_id", ""),
-                        description=result.get("extra", {}).get("message", ""),
-                        file_path=result.get("path"),
-                        line_number=result.get("start", {}).get("line"),
-                        code_snippet=result.get("extra", {}).get("lines"),
-                        cwe=result.get("extra", {}).get("metadata", {}).get("cwe"),
-                        references=result.get("extra", {}).get("metadata", {}).get("references", [])
-                    ))
-        except json.JSONDecodeError:
-            pass
-
         return ScanResult(
             tool="semgrep",
             scan_type=ScanType.SAST,
             timestamp=start_time.isoformat(),
             duration_seconds=duration,
-            findings=findings,
-            raw_output=stdout
+            findings=findings
         )
 
-    def _map_severity(self, level: str) -> Severity:
-        mapping = {
-            "ERROR": Severity.HIGH,
-            "WARNING": Severity.MEDIUM,
-            "INFO": Severity.LOW
-        }
-        return mapping.get(level.upper(), Severity.INFO)
+    def _parse_result(self, result: Dict[str, Any]) -> Finding:
+        return Finding(
+            tool="semgrep",
+            scan_type=ScanType.SAST,
+            severity=self._map_severity(result.get("extra", {}).get("severity", "")),
+            title=result.get("check_id", ""),
+            description=result.get("extra", {}).get("message", ""),
+            file_path=result.get("path"),
+            line_number=result.get("start", {}).get("line"),
+            code_snippet=result.get("extra", {}).get("lines"),
+            cwe=result.get("extra", {}).get("metadata", {}).get("cwe"),
+            references=result.get("extra", {}).get("metadata", {}).get("references", [])
+        )
 
 
 # =============================================================================
@@ -345,83 +824,81 @@ class SemgrepScanner(SecurityScanner):
 class SafetyScanner(SecurityScanner):
     """Safety - Python dependency vulnerability scanner"""
 
+    _SEV_MAP = _severity_map({
+        "critical": Severity.CRITICAL,
+        "high": Severity.HIGH,
+        "medium": Severity.MEDIUM,
+        "low": Severity.LOW
+    })
+    _SEV_DEFAULT = Severity.MEDIUM
+
     def __init__(self, config: ScanConfig):
         super().__init__(config)
         self.name = "safety"
         self.scan_type = ScanType.SCA
 
     def is_available(self) -> bool:
-        code, _, _ = self._run_command(["safety", "--version"])
-        return code == 0
+        return _probe_tool(("safety", "--version"))[0]
 
     def run(self) -> ScanResult:
         start_time = datetime.utcnow()
-        findings = []
 
         cmd = ["safety", "check", "--json"]
 
         if self.config.safety_policy:
             cmd.extend(["--policy-file", self.config.safety_policy])
 
-        # Check for requirements file
+        # Check for requirements files with one directory listing
         req_files = ["requirements.txt", "requirements-dev.txt"]
+        try:
+            with os.scandir(self.config.source_dir) as entries:
+                present = {e.name for e in entries if e.is_file()}
+        except OSError:
+            present = set()
         for req_file in req_files:
-            req_path = Path(self.config.source_dir) / req_file
-            if req_path.exists():
-                cmd.extend(["-r", str(req_path)])
+            if req_file in present:
+                cmd.extend(["-r", str(Path(self.config.source_dir) / req_file)])
 
-        code, stdout, stderr = self._run_command(cmd)
+        code, findings, stderr = self._run_json_command(cmd, consume=self._parse_results)
         duration = (datetime.utcnow() - start_time).total_seconds()
 
-        try:
-            if stdout:
-                # Safety JSON format varies by version
-                data = json.loads(stdout)
-                vulnerabilities = data if isinstance(data, list) else data.get("vulnerabilities", [])
-
-                for vuln in vulnerabilities:
-                    if isinstance(vuln, list):
-                        # Older format: [package, affected, installed, description, id]
-                        findings.append(Finding(
-                            tool="safety",
-                            scan_type=ScanType.SCA,
-                            severity=Severity.HIGH,  # Safety doesn't provide severity
-                            title=f"Vulnerable dependency: {vuln[0]}",
-                            description=vuln[3] if len(vuln) > 3 else "",
-                            recommendation=f"Update {vuln[0]} from {vuln[2]} (affected: {vuln[1]})",
-                            references=[f"https://pyup.io/vulnerabilities/CVE-{vuln[4]}/"] if len(vuln) > 4 else []
-                        ))
-                    elif isinstance(vuln, dict):
-                        findings.append(Finding(
-                            tool="safety",
-                            scan_type=ScanType.SCA,
-                            severity=self._map_severity(vuln.get("severity", "")),
-                            title=f"Vulnerable dependency: {vuln.get('package_name', '')}",
-                            description=vuln.get("vulnerability_description", ""),
-                            cwe=vuln.get("cwe"),
-                            recommendation=vuln.get("recommendation", ""),
-                            references=vuln.get("references", [])
-                        ))
-        except json.JSONDecodeError:
-            pass
-
         return ScanResult(
             tool="safety",
             scan_type=ScanType.SCA,
             timestamp=start_time.isoformat(),
             duration_seconds=duration,
-            findings=findings,
-            raw_output=stdout
+            findings=findings or []
         )
 
-    def _map_severity(self, level: str) -> Severity:
-        mapping = {
-            "critical": Severity.CRITICAL,
-            "high": Severity.HIGH,
-            "medium": Severity.MEDIUM,
-            "low": Severity.LOW
-        }
-        return mapping.get(level.lower(), Severity.MEDIUM)
+    def _parse_results(self, stream: IO[bytes]) -> List[Finding]:
+        findings = []
+
+        # Safety JSON format varies by version: a bare list or {"vulnerabilities": [...]}
+        for _, vuln in _iter_json_items(stream, "item", "vulnerabilities.item"):
+            if isinstance(vuln, list):
+                # Older format: [package, affected, installed, description, id]
+                findings.append(Finding(
+                    tool="safety",
+                    scan_type=ScanType.SCA,
+                    severity=Severity.HIGH,  # Safety doesn't provide severity
+                    title=f"Vulnerable dependency: {vuln[0]}",
+                    description=vuln[3] if len(vuln) > 3 else "",
+                    recommendation=f"Update {vuln[0]} from {vuln[2]} (affected: {vuln[1]})",
+                    references=[f"https://pyup.io/vulnerabilities/CVE-{vuln[4]}/"] if len(vuln) > 4 else []
+                ))
+            elif isinstance(vuln, dict):
+                findings.append(Finding(
+                    tool="safety",
+                    scan_type=ScanType.SCA,
+                    severity=self._map_severity(vuln.get("severity", "")),
+                    title=f"Vulnerable dependency: {vuln.get('package_name', '')}",
+                    description=vuln.get("vulnerability_description", ""),
+                    cwe=vuln.get("cwe"),
+                    recommendation=vuln.get("recommendation", ""),
+                    references=vuln.get("references", [])
+                ))
+
+        return findings
 
 
 # =============================================================================
@@ -437,44 +914,39 @@ class PipAuditScanner(SecurityScanner):
         self.scan_type = ScanType.SCA
 
     def is_available(self) -> bool:
-        code, _, _ = self._run_command(["pip-audit", "--version"])
-        return code == 0
+        return _probe_tool(("pip-audit", "--version"))[0]
 
     def run(self) -> ScanResult:
         start_time = datetime.utcnow()
-        findings = []
 
         cmd = ["pip-audit", "--format", "json"]
 
-        code, stdout, stderr = self._run_command(cmd, timeout=300)
+        code, findings, stderr = self._run_json_command(cmd, timeout=300, consume=self._parse_results)
         duration = (datetime.utcnow() - start_time).total_seconds()
 
-        try:
-            if stdout:
-                data = json.loads(stdout)
-                for dep in data.get("dependencies", []):
-                    for vuln in dep.get("vulns", []):
-                        findings.append(Finding(
-                            tool="pip-audit",
-                            scan_type=ScanType.SCA,
-                            severity=Severity.HIGH,
-                            title=f"{vuln.get('id', '')}: {dep.get('name', '')}",
-                            description=vuln.get("description", ""),
-                            recommendation=f"Update {dep.get('name')} from {dep.get('version')} to {vuln.get('fix_versions', ['latest'])[0] if vuln.get('fix_versions') else 'latest'}",
-                            references=vuln.get("aliases", [])
-                        ))
-        except json.JSONDecodeError:
-            pass
-
         return ScanResult(
             tool="pip-audit",
             scan_type=ScanType.SCA,
             timestamp=start_time.isoformat(),
             duration_seconds=duration,
-            findings=findings,
-            raw_output=stdout
+            findings=findings or []
         )
 
+    def _parse_results(self, stream: IO[bytes]) -> List[Finding]:
+        findings = []
+        for _, dep in _iter_json_items(stream, "dependencies.item"):
+            for vuln in dep.get("vulns", []):
+                findings.append(Finding(
+                    tool="pip-audit",
+                    scan_type=ScanType.SCA,
+                    severity=Severity.HIGH,
+                    title=f"{vuln.get('id', '')}: {dep.get('name', '')}",
+                    description=vuln.get("description", ""),
+                    recommendation=f"Update {dep.get('name')} from {dep.get('version')} to {vuln.get('fix_versions', ['latest'])[0] if vuln.get('fix_versions') else 'latest'}",
+                    references=vuln.get("aliases", [])
+                ))
+        return findings
+
 
 # =============================================================================
 # detect-secrets Scanner
@@ -489,8 +961,7 @@ class DetectSecretsScanner(SecurityScanner):
         self.scan_type = ScanType.SECRET
 
     def is_available(self) -> bool:
-        code, _, _ = self._run_command(["detect-secrets", "--version"])
-        return code == 0
+        return _probe_tool(("detect-secrets", "--version"))[0]
 
     def run(self) -> ScanResult:
         start_time = datetime.utcnow()
@@ -498,34 +969,29 @@ class DetectSecretsScanner(SecurityScanner):
 
         cmd = ["detect-secrets", "scan", "--all-files"]
 
-        code, stdout, stderr = self._run_command(cmd)
+        code, data, stderr = self._run_json_command(cmd)
         duration = (datetime.utcnow() - start_time).total_seconds()
 
-        try:
-            if stdout:
-                data = json.loads(stdout)
-                for file_path, secrets in data.get("results", {}).items():
-                    for secret in secrets:
-                        findings.append(Finding(
-                            tool="detect-secrets",
-                            scan_type=ScanType.SECRET,
-                            severity=Severity.CRITICAL,
-                            title=f"Potential secret: {secret.get('type', 'Unknown')}",
-                            description=f"Detected {secret.get('type', 'secret')} in file",
-                            file_path=file_path,
-                            line_number=secret.get("line_number"),
-                            recommendation="Remove secret from code and rotate credentials"
-                        ))
-        except json.JSONDecodeError:
-            pass
+        if isinstance(data, dict):
+            for file_path, secrets in data.get("results", {}).items():
+                for secret in secrets:
+                    findings.append(Finding(
+                        tool="detect-secrets",
+                        scan_type=ScanType.SECRET,
+                        severity=Severity.CRITICAL,
+                        title=f"Potential secret: {secret.get('type', 'Unknown')}",
+                        description=f"Detected {secret.get('type', 'secret')} in file",
+                        file_path=file_path,
+                        line_number=secret.get("line_number"),
+                        recommendation="Remove secret from code and rotate credentials"
+                    ))
 
         return ScanResult(
             tool="detect-secrets",
             scan_type=ScanType.SECRET,
             timestamp=start_time.isoformat(),
             duration_seconds=duration,
-            findings=findings,
-            raw_output=stdout
+            findings=findings
         )
 
 
@@ -533,9 +999,36 @@ class DetectSecretsScanner(SecurityScanner):
 # Report Generator
 # =============================================================================
 
+def _finding_md_template(has_location: bool, has_recommendation: bool):
+    return (
+        "### {title}\n\n"
+        "**Tool:** {tool}  \n"
+        + ("**Location:** {file_path}:{line_number}  \n" if has_location else "")
+        + "\n{description}\n\n"
+        + ("**Recommendation:** {recommendation}\n\n" if has_recommendation else "")
+        + "---\n\n"
+    ).format_map
+
+
+# Markdown formatter for a finding dict, keyed by (has file_path, has recommendation)
+_FINDING_MD = {
+    (loc, rec): _finding_md_template(loc, rec)
+    for loc in (False, True)
+    for rec in (False, True)
+}
+
+
 class SecurityReportGenerator:
     """Generates security reports in various formats"""
 
+    _SARIF_LEVEL: Dict[Severity, str] = {
+        Severity.CRITICAL: "error",
+        Severity.HIGH: "error",
+        Severity.MEDIUM: "warning",
+        Severity.LOW: "note",
+        Severity.INFO: "note"
+    }
+
     def __init__(self, output_dir: str):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -550,63 +1043,68 @@ class SecurityReportGenerator:
         name = report_name or f"security_scan_{timestamp}"
         files = {}
 
-        # Aggregate data
+        # Aggregate data; overall counts are summed from the per-tool counts
         all_findings = []
         scan_summary = {}
+        by_severity = Counter()
 
         for result in results:
             all_findings.extend(result.findings)
+            counts = result.finding_counts
+            by_severity.update(counts)
             scan_summary[result.tool] = {
                 "duration": result.duration_seconds,
-                "findings": result.finding_counts,
+                "findings": counts,
                 "error": result.error
             }
 
+        # Serialize each finding once, grouping the dicts for the markdown report
+        finding_dicts = []
+        groups: Dict[str, List[Dict]] = {v: [] for v in _SEVERITY_VALUES}
+        for f in all_findings:
+            d = f.to_dict()
+            finding_dicts.append(d)
+            groups[d["severity"]].append(d)
+
         # JSON report
         json_data = {
             "timestamp": timestamp,
             "summary": {
                 "total_findings": len(all_findings),
-                "by_severity": self._count_by_severity(all_findings),
+                "by_severity": {v: by_severity[v] for v in _SEVERITY_VALUES},
                 "by_tool": scan_summary
             },
-            "findings": [f.to_dict() for f in all_findings]
+            "findings": finding_dicts
         }
 
         json_path = self.output_dir / f"{name}.json"
-        with open(json_path, 'w') as f:
-            json.dump(json_data, f, indent=2)
+        _write_atomic(json_path, _dump_json(json_data))
         files["json"] = str(json_path)
 
         # Markdown report
-        md_content = self._generate_markdown(json_data)
+        md_content = self._generate_markdown(json_data, groups)
         md_path = self.output_dir / f"{name}.md"
-        with open(md_path, 'w') as f:
-            f.write(md_content)
+        _write_atomic(md_path, md_content.encode("utf-8"))
         files["markdown"] = str(md_path)
 
         # SARIF report (GitHub/IDE compatible)
         sarif = self._generate_sarif(all_findings)
         sarif_path = self.output_dir / f"{name}.sarif"
-        with open(sarif_path, 'w') as f:
-            json.dump(sarif, f, indent=2)
+        _write_atomic(sarif_path, _dump_json(sarif))
         files["sarif"] = str(sarif_path)
 
         logger.info(f"Security reports generated in {self.output_dir}")
         return files
 
-    def _count_by_severity(self, findings: List[Finding]) -> Dict[str, int]:
-        counts = {s.value: 0 for s in Severity}
-        for f in findings:
-            counts[f.severity.value] += 1
-        return counts
-
-    def _generate_markdown(self, data: Dict) -> str:
-        """Generate markdown report"""
+    def _generate_markdown(
+        self,
+        data: Dict,
+        by_severity: Optional[Dict[str, List[Dict]]] = None
+    ) -> str:
+        """Generate markdown report; by_severity is data["findings"] pre-grouped by severity"""
         summary = data.get("summary", {})
-        findings = data.get("findings", [])
 
-        md = f"""# Security Scan Report
+        parts: List[str] = [f"""# Security Scan Report
 
 **Generated:** {data.get('timestamp')}
 
@@ -623,39 +1121,45 @@ class SecurityReportGenerator:
 
 ## Findings by Tool
 
-"""
+"""]
         for tool, info in summary.get("by_tool", {}).items():
-            md += f"### {tool}\n\n"
-            md += f"- Duration: {info.get('duration', 0):.2f}s\n"
+            parts.append(f"### {tool}\n\n")
+            parts.append(f"- Duration: {info.get('duration', 0):.2f}s\n")
             for sev, count in info.get("findings", {}).items():
                 if count > 0:
-                    md += f"- {sev}: {count}\n"
-            md += "\n"
-
-        # Group findings by severity
-        for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]:
-            sev_findings = [f for f in findings if f.get("severity") == severity.value]
+                    parts.append(f"- {sev}: {count}\n")
+            parts.append("\n")
+
+        if by_severity is None:
+            by_severity = {v: [] for v in _SEVERITY_VALUES}
+            for f in data.get("findings", []):
+                group = by_severity.get(f.get("severity"))
+                if group is not None:
+                    group.append(f)
+
+        for severity in _MD_SEVERITIES:
+            sev_findings = by_severity[severity.value]
             if sev_findings:
-                md += f"## {severity.value.upper()} Severity Findings\n\n"
+                parts.append(f"## {severity.value.upper()} Severity Findings\n\n")
                 for f in sev_findings:
-                    md += f"### {f.get('title')}\n\n"
-                    md += f"**Tool:** {f.get('tool')}  \n"
-                    if f.get('file_path'):
-                        md += f"**Location:** {f.get('file_path')}:{f.get('line_number', '')}  \n"
-                    md += f"\n{f.get('description')}\n\n"
-                    if f.get('recommendation'):
-                        md += f"**Recommendation:** {f.get('recommendation')}\n\n"
-                    md += "---\n\n"
+                    fmt = _FINDING_MD[bool(f.get("file_path")), bool(f.get("recommendation"))]
+                    parts.append(fmt(f))
 
-        return md
+        return "".join(parts)
 
     def _generate_sarif(self, findings: List[Finding]) -> Dict:
         """Generate SARIF format for GitHub/IDE integration"""
         rules = {}
         results = []
+        rule_ids: Dict[str, str] = {}  # title -> rule id; titles repeat heavily
 
         for f in findings:
-            rule_id = hashlib.md5(f.title.encode()).hexdigest()[:8]
+            rule_id = rule_ids.get(f.title)
+            if rule_id is None:
+                # Not a security use: the id only has to be stable across runs
+                digest = hashlib.md5(f.title.encode(), usedforsecurity=False)
+                rule_id = rule_ids[f.title] = digest.hexdigest()[:8]
+            level = self._SARIF_LEVEL.get(f.severity, "note")
 
             if rule_id not in rules:
                 rules[rule_id] = {
@@ -664,13 +1168,13 @@ class SecurityReportGenerator:
                     "shortDescription": {"text": f.title},
                     "fullDescription": {"text": f.description},
                     "defaultConfiguration": {
-                        "level": self._severity_to_sarif_level(f.severity)
+                        "level": level
                     }
                 }
 
             result = {
                 "ruleId": rule_id,
-                "level": self._severity_to_sarif_level(f.severity),
+                "level": level,
                 "message": {"text": f.description}
             }
 
@@ -699,16 +1203,6 @@ class SecurityReportGenerator:
             }]
         }
 
-    def _severity_to_sarif_level(self, severity: Severity) -> str:
-        mapping = {
-            Severity.CRITICAL: "error",
-            Severity.HIGH: "error",
-            Severity.MEDIUM: "warning",
-            Severity.LOW: "note",
-            Severity.INFO: "note"
-        }
-        return mapping.get(severity, "note")
-
 
 # =============================================================================
 # Main Scanner Orchestrator
@@ -741,7 +1235,7 @@ class SecurityScanOrchestrator:
             Tuple of (passed, report_files)
         """
         scanner_names = scanners or list(self.SCANNERS.keys())
-        results = []
+        selected = []
 
         for name in scanner_names:
             scanner_class = self.SCANNERS.get(name)
@@ -749,49 +1243,52 @@ class SecurityScanOrchestrator:
                 logger.warning(f"Unknown scanner: {name}")
                 continue
 
-            scanner = scanner_class(self.config)
-
-            if not scanner.is_available():
-                logger.warning(f"Scanner not available: {name}")
-                continue
-
-            logger.info(f"Running {name}...")
-            result = scanner.run()
-            results.append(result)
+            selected.append(scanner_class(self.config))
 
-            logger.info(
-                f"{name} complete: {len(result.findings)} findings in "
-                f"{result.duration_seconds:.2f}s"
-            )
+        # Each scanner (including its --version probe) is an independent
+        # subprocess; run them concurrently
+        results = []
+        if selected:
+            with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+                outcomes = executor.map(self._run_scanner, selected)
+                results = [result for result in outcomes if result is not None]
 
         # Generate reports
         files = self.reporter.generate(results, report_name)
 
-        # Check thresholds
-        all_findings = []
+        # Check thresholds against one count of all findings by severity
+        counts = Counter()
         for r in results:
-            all_findings.extend(r.findings)
+            counts.update(f.severity for f in r.findings)
 
         passed = True
-        if self.config.fail_on_critical:
-            critical = [f for f in all_findings if f.severity == Severity.CRITICAL]
-            if critical:
-                passed = False
-                logger.error(f"Found {len(critical)} CRITICAL findings")
-
-        if self.config.fail_on_high:
-            high = [f for f in all_findings if f.severity == Severity.HIGH]
-            if high:
-                passed = False
-                logger.error(f"Found {len(high)} HIGH findings")
-
-        if self.config.fail_on_medium:
-            medium = [f for f in all_findings if f.severity == Severity.MEDIUM]
-            if medium:
-                passed = False
+        if self.config.fail_on_critical and counts[Severity.CRITICAL]:
+            passed = False
+            logger.error(f"Found {counts[Severity.CRITICAL]} CRITICAL findings")
+
+        if self.config.fail_on_high and counts[Severity.HIGH]:
+            passed = False
+            logger.error(f"Found {counts[Severity.HIGH]} HIGH findings")
+
+        if self.config.fail_on_medium and counts[Severity.MEDIUM]:
+            passed = False
 
         return passed, files
 
+    def _run_scanner(self, scanner: SecurityScanner) -> Optional[ScanResult]:
+        if not scanner.is_available():
+            logger.warning(f"Scanner not available: {scanner.name}")
+            return None
+
+        logger.info(f"Running {scanner.name}...")
+        result = scanner.run()
+
+        logger.info(
+            f"{scanner.name} complete: {len(result.findings)} findings in "
+            f"{result.duration_seconds:.2f}s"
+        )
+        return result
+
 
 # =============================================================================
 # CLI
@@ -811,6 +1308,8 @@ def main():
     parser.add_argument("--fail-on-medium", action="store_true", help="Fail on medium findings")
     parser.add_argument("--json", action="store_true", help="Output JSON summary")
     parser.add_argument("--report-name", help="Custom report name")
+    parser.add_argument("--force-reindex", action="store_true",
+                        help="Ignore cached per-file results and rescan everything")
 
     args = parser.parse_args()
 
@@ -836,7 +1335,8 @@ def main():
     config = ScanConfig(
         source_dir=args.source,
         output_dir=args.output,
-        fail_on_medium=args.fail_on_medium
+        fail_on_medium=args.fail_on_medium,
+        use_cache=not args.force_reindex
     )
 
     orchestrator = SecurityScanOrchestrator(config)
@@ -24,20 +24,91 @@ License: MIT
 ===============================================================================
 """
 
+import hashlib
 import json
 import logging
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
-# Use requests for Vault API (not Splunk, so allowed)
-import requests
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent secret reads in read_secrets_batch
+MAX_PARALLEL_READS = 16
+
+# Connection pooling; pool_maxsize covers every concurrent batch read so
+# each one reuses a kept-alive connection instead of opening a new one
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = MAX_PARALLEL_READS
+
+# Tokens are reused across CLI invocations until this close to expiry
+TOKEN_CACHE_PATH = Path("~/.cache/kvstore-syncthing/vault-token.json").expanduser()
+TOKEN_CACHE_MARGIN = 60
+
+# Background renewal fires after this fraction of the token TTL; tokens
+# with less than TOKEN_RENEW_MIN_TTL left are not worth a renewal thread
+TOKEN_RENEW_FRACTION = 0.66
+TOKEN_RENEW_MIN_TTL = 60
+
+# Upper bound on how long read_secret reuses a secret it already fetched
+SECRET_CACHE_TTL = 30
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class VaultError(Exception):
+    """Vault was unreachable (after transport retries) or sent a malformed response"""
+
+
+def _response_json(response, what: str) -> Dict[str, Any]:
+    """Parse a successful Vault response, raising VaultError unless it is a JSON object"""
+    try:
+        data = _load_json(response.content)
+    except ValueError as e:
+        raise VaultError(f"{what}: malformed response: {e}") from e
+    if not isinstance(data, dict):
+        raise VaultError(f"{what}: malformed response: expected a JSON object")
+    return data
+
+
+def _field(data: Dict[str, Any], *keys: str) -> Any:
+    """Look up a nested response field, or None if any level is missing"""
+    value: Any = data
+    for key in keys:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
 
 # =============================================================================
 # Vault Configuration
@@ -53,6 +124,8 @@ class VaultConfig:
     namespace: Optional[str] = None
     verify_ssl: bool = True
     timeout: int = 30
+    use_token_cache: bool = True
+    use_http2: bool = False
 
     @classmethod
     def from_environment(cls) -> "VaultConfig":
@@ -64,9 +137,66 @@ class VaultConfig:
             secret_id=os.environ.get("VAULT_SECRET_ID"),
             namespace=os.environ.get("VAULT_NAMESPACE"),
             verify_ssl=os.environ.get("VAULT_SKIP_VERIFY", "").lower() != "true",
+            use_http2=os.environ.get("VAULT_USE_HTTP2", "").lower() in ("1", "true"),
         )
 
 
+# =============================================================================
+# Token Cache
+# =============================================================================
+
+class TokenCache:
+    """
+    On-disk cache of Vault token expiry, keyed per Vault address and identity.
+
+    AppRole entries hold the issued client token. Entries for a supplied
+    VAULT_TOKEN only record that it was verified, and never store the token
+    itself. The file is created with 0600 permissions.
+    """
+
+    def __init__(self, path: Path = TOKEN_CACHE_PATH):
+        self.path = path
+
+    def _load_all(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_all(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+        except OSError as e:
+            logger.debug(f"Token cache write failed (ignored): {e}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for key if it is not about to expire"""
+        entry = self._load_all().get(key)
+        if not entry or entry.get("expires_at", 0) <= time.time() + TOKEN_CACHE_MARGIN:
+            return None
+        return entry
+
+    def put(self, key: str, ttl: int, token: Optional[str] = None) -> None:
+        """Record a token valid for ttl more seconds"""
+        entries = self._load_all()
+        entry: Dict[str, Any] = {"expires_at": time.time() + ttl}
+        if token:
+            entry["token"] = token
+        entries[key] = entry
+        self._save_all(entries)
+
+    def invalidate(self, key: str) -> None:
+        """Drop the cached entry for key"""
+        entries = self._load_all()
+        if entries.pop(key, None) is not None:
+            self._save_all(entries)
+
+
 # =============================================================================
 # Vault Client
 # =============================================================================
@@ -80,6 +210,7 @@ class VaultClient:
     - AppRole authentication
     - Automatic token renewal
     - KV v1 and v2 secrets engines
+    - HTTP/2 via httpx (opt-in, VAULT_USE_HTTP2=1)
     """
 
     def __init__(self, config: VaultConfig):
@@ -90,101 +221,247 @@ class VaultClient:
             config: Vault configuration
         """
         self.config = config
-        self.session = requests.Session()
-        self.session.verify = config.verify_ssl
+        # Transport exception types of the chosen backend; _request turns
+        # them into VaultError
+        self.session, self._transport_errors = (
+            (config.use_http2 and self._http2_session()) or self._http1_session()
+        )
 
         if config.namespace:
             self.session.headers["X-Vault-Namespace"] = config.namespace
 
         self._token: Optional[str] = config.token
         self._token_ttl: int = 0
+        self._token_cache = TokenCache()
+        self._token_cached = False
+        # Guards token/TTL updates made by the renewal thread
+        self._token_lock = threading.Lock()
+        self._renewal_stop = threading.Event()
+        self._renewal_thread: Optional[threading.Thread] = None
+        # (path, kv version) -> (monotonic expiry, secret data)
+        self._secret_cache: Dict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = {}
+
+    def _http1_session(self) -> Tuple["requests.Session", Tuple[type, ...]]:
+        """requests session with a pooled, retrying adapter"""
+        # Imported here so argument errors and --help don't pay for
+        # requests/urllib3. Use requests for Vault API (not Splunk, so allowed)
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.verify = self.config.verify_ssl
+
+        # Retries also cover connections an idle-timeout LB closed under us;
+        # 429s wait out Vault's Retry-After rather than the fixed backoff
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                respect_retry_after_header=True,
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session, (requests.RequestException,)
+
+    def _http2_session(self) -> Optional[Tuple["httpx.Client", Tuple[type, ...]]]:
+        """
+        httpx client speaking HTTP/2, or None if httpx[http2] isn't installed.
+
+        Concurrent batch reads share one TLS connection as multiplexed
+        streams instead of one pooled connection each. Only connection
+        failures are retried; status retries need the requests backend.
+        """
+        try:
+            import h2  # noqa: F401  (httpx's HTTP/2 support)
+            import httpx
+        except ImportError:
+            logger.warning("VAULT_USE_HTTP2 set but httpx[http2] is not installed, using HTTP/1.1")
+            return None
+
+        # httpx logs every request at INFO, which basicConfig above would show
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        transport = httpx.HTTPTransport(
+            http2=True,
+            verify=self.config.verify_ssl,
+            retries=3,
+            limits=httpx.Limits(max_connections=HTTP_POOL_MAXSIZE),
+        )
+        return httpx.Client(transport=transport, timeout=self.config.timeout), (httpx.HTTPError,)
+
+    def _cache_key(self) -> str:
+        """Token cache key: Vault address, namespace and the supplied token's digest or role_id"""
+        if self.config.token:
+            identity = "token:" + hashlib.sha256(self.config.token.encode()).hexdigest()
+        else:
+            identity = f"approle:{self.config.role_id}"
+        return f"{self.config.url}|{self.config.namespace or ''}|{identity}"
 
     def authenticate(self) -> bool:
         """
         Authenticate to Vault.
 
-        Uses token if provided, otherwise tries AppRole.
+        Uses token if provided, otherwise tries AppRole. A token verified or
+        issued by an earlier run is reused from the token cache while it is
+        still valid, skipping the lookup or login round-trips. Once
+        authenticated, the token is renewed in the background before it
+        expires, except for a supplied VAULT_TOKEN taken from the cache:
+        its cache entry holds no token, so renewals could not be recorded.
 
         Returns:
             True if authentication successful
+
+        Raises:
+            VaultError: Vault could not be reached or sent a malformed response
         """
+        if self.config.use_token_cache and (self._token or self.config.role_id):
+            entry = self._token_cache.get(self._cache_key())
+            if entry and (self._token or entry.get("token")):
+                self._token = self._token or entry["token"]
+                self._token_ttl = int(entry["expires_at"] - time.time())
+                self._token_cached = True
+                logger.info(f"Using cached Vault token, TTL: {self._token_ttl}s")
+                if entry.get("token"):
+                    self._start_renewal()
+                return True
+
         if self._token:
             # Verify token is valid
-            return self._verify_token()
-
-        if self.config.role_id and self.config.secret_id:
-            return self._approle_login()
+            authenticated = self._verify_token()
+        elif self.config.role_id and self.config.secret_id:
+            authenticated = self._approle_login()
+        else:
+            logger.error("No authentication method available")
+            return False
 
-        logger.error("No authentication method available")
-        return False
+        if authenticated and self.config.use_token_cache and self._token_ttl > TOKEN_CACHE_MARGIN:
+            # Only AppRole-issued tokens are written to disk
+            issued = None if self.config.token else self._token
+            self._token_cache.put(self._cache_key(), self._token_ttl, issued)
+        if authenticated:
+            self._start_renewal()
+        return authenticated
 
     def _verify_token(self) -> bool:
         """Verify current token is valid"""
-        try:
-            response = self._request("GET", "/v1/auth/token/lookup-self")
-            if response.status_code == 200:
-                data = response.json()
-                self._token_ttl = data.get("data", {}).get("ttl", 0)
-                logger.info(f"Token valid, TTL: {self._token_ttl}s")
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"Token verification failed: {e}")
-            return False
+        response = self._request("GET", "/v1/auth/token/lookup-self")
+        if response.status_code == 200:
+            data = _response_json(response, "Token lookup")
+            self._token_ttl = _field(data, "data", "ttl") or 0
+            logger.info(f"Token valid, TTL: {self._token_ttl}s")
+            return True
+
+        logger.error(f"Token verification failed: HTTP {response.status_code}")
+        return False
 
     def _approle_login(self) -> bool:
         """Authenticate using AppRole"""
-        try:
-            response = self.session.post(
-                urljoin(self.config.url, "/v1/auth/approle/login"),
-                json={
-                    "role_id": self.config.role_id,
-                    "secret_id": self.config.secret_id,
-                },
-                timeout=self.config.timeout,
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                self._token = data["auth"]["client_token"]
-                self._token_ttl = data["auth"]["lease_duration"]
-                logger.info(f"AppRole login successful, TTL: {self._token_ttl}s")
-                return True
+        # No token is set yet, so _request sends the login unauthenticated
+        response = self._request(
+            "POST",
+            "/v1/auth/approle/login",
+            json={
+                "role_id": self.config.role_id,
+                "secret_id": self.config.secret_id,
+            },
+        )
 
-            logger.error(f"AppRole login failed: {response.text}")
-            return False
+        if response.status_code == 200:
+            data = _response_json(response, "AppRole login")
+            token = _field(data, "auth", "client_token")
+            if not token:
+                raise VaultError("AppRole login: response has no client token")
+            self._token = token
+            self._token_ttl = _field(data, "auth", "lease_duration") or 0
+            logger.info(f"AppRole login successful, TTL: {self._token_ttl}s")
+            return True
+
+        logger.error(f"AppRole login failed: {response.text}")
+        return False
 
-        except Exception as e:
-            logger.error(f"AppRole login error: {e}")
-            return False
+    def _request(self, method: str, path: str, **kwargs) -> "requests.Response":
+        """
+        Make authenticated request to Vault.
 
-    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
-        """Make authenticated request to Vault"""
+        Transient failures are retried by the transport; whatever still
+        fails is raised as VaultError for the caller's boundary to handle.
+        """
         headers = kwargs.pop("headers", {})
         if self._token:
             headers["X-Vault-Token"] = self._token
 
-        return self.session.request(
-            method,
-            urljoin(self.config.url, path),
-            headers=headers,
-            timeout=self.config.timeout,
-            **kwargs,
-        )
+        try:
+            response = self.session.request(
+                method,
+                urljoin(self.config.url, path),
+                headers=headers,
+                timeout=self.config.timeout,
+                **kwargs,
+            )
+        except self._transport_errors as e:
+            raise VaultError(f"{method} {path}: {e}") from e
+
+        if response.status_code == 403 and self._token_cached:
+            # Revoked before its TTL ran out; make the next run authenticate again
+            self._token_cache.invalidate(self._cache_key())
+            self._token_cached = False
+        return response
 
     def renew_token(self) -> bool:
         """Renew the current token"""
-        try:
-            response = self._request("POST", "/v1/auth/token/renew-self")
-            if response.status_code == 200:
-                data = response.json()
-                self._token_ttl = data.get("auth", {}).get("lease_duration", 0)
-                logger.info(f"Token renewed, new TTL: {self._token_ttl}s")
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"Token renewal failed: {e}")
-            return False
+        response = self._request("POST", "/v1/auth/token/renew-self")
+        if response.status_code == 200:
+            data = _response_json(response, "Token renewal")
+            with self._token_lock:
+                self._token_ttl = _field(data, "auth", "lease_duration") or 0
+            logger.info(f"Token renewed, new TTL: {self._token_ttl}s")
+            if self.config.use_token_cache and not self.config.token:
+                # Keep the cached AppRole token's expiry in step with Vault
+                self._token_cache.put(self._cache_key(), self._token_ttl, self._token)
+            return True
+
+        logger.error(f"Token renewal failed: HTTP {response.status_code}")
+        return False
+
+    def _start_renewal(self):
+        """Start the background renewal thread if the token is long-lived enough"""
+        if self._token_ttl <= TOKEN_RENEW_MIN_TTL:
+            return
+        if self._renewal_thread and self._renewal_thread.is_alive():
+            return
+        self._renewal_stop.clear()
+        self._renewal_thread = threading.Thread(
+            target=self._renewal_loop, name="vault-token-renewal", daemon=True
+        )
+        self._renewal_thread.start()
+
+    def _renewal_loop(self):
+        """Renew the token after each TOKEN_RENEW_FRACTION of its TTL until stopped"""
+        while True:
+            with self._token_lock:
+                ttl = self._token_ttl
+            if ttl <= TOKEN_RENEW_MIN_TTL:
+                return
+            if self._renewal_stop.wait(ttl * TOKEN_RENEW_FRACTION):
+                return
+            try:
+                if not self.renew_token():
+                    return
+            except VaultError as e:
+                logger.error(f"Token renewal failed: {e}")
+                return
+
+    def close(self):
+        """Stop background token renewal and close the HTTP session"""
+        self._renewal_stop.set()
+        if self._renewal_thread:
+            self._renewal_thread.join()
+            self._renewal_thread = None
+        self.session.close()
 
     def read_secret(self, path: str, version: int = 2) -> Optional[Dict[str, Any]]:
         """
@@ -196,54 +473,64 @@ class VaultClient:
 
         Returns:
             Secret data or None
+
+        Raises:
+            VaultError: Vault could not be reached or sent a malformed response
         """
-        try:
-            if version == 2:
-                # KV v2 has /data/ in path
-                parts = path.split("/", 1)
-                if len(parts) == 2:
-                    api_path = f"/v1/{parts[0]}/data/{parts[1]}"
-                else:
-                    api_path = f"/v1/{path}"
+        cached = self._secret_cache.get((path, version))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        if version == 2:
+            # KV v2 has /data/ in path
+            parts = path.split("/", 1)
+            if len(parts) == 2:
+                api_path = f"/v1/{parts[0]}/data/{parts[1]}"
             else:
                 api_path = f"/v1/{path}"
+        else:
+            api_path = f"/v1/{path}"
 
-            response = self._request("GET", api_path)
+        response = self._request("GET", api_path)
 
-            if response.status_code == 200:
-                data = response.json()
-                if version == 2:
-                    return data.get("data", {}).get("data", {})
-                return data.get("data", {})
+        if response.status_code == 200:
+            data = _response_json(response, f"Read {path}")
+            if version == 2:
+                secret = _field(data, "data", "data") or {}
+            else:
+                secret = _field(data, "data") or {}
 
-            elif response.status_code == 404:
-                logger.warning(f"Secret not found: {path}")
-                return None
+            # KV reports lease_duration 0 (v2) or a refresh hint (v1)
+            lease = data.get("lease_duration") or SECRET_CACHE_TTL
+            ttl = min(lease, SECRET_CACHE_TTL)
+            self._secret_cache[(path, version)] = (time.monotonic() + ttl, secret)
+            return secret
 
-            else:
-                logger.error(f"Failed to read secret: {response.text}")
-                return None
+        elif response.status_code == 404:
+            logger.warning(f"Secret not found: {path}")
+            return None
 
-        except Exception as e:
-            logger.error(f"Error reading secret: {e}")
+        else:
+            logger.error(f"Failed to read secret: {response.text}")
             return None
 
     def read_secrets_batch(self, paths: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Read multiple secrets.
+        Read multiple secrets concurrently.
 
         Args:
             paths: List of secret paths
 
         Returns:
-            Dict mapping paths to secret data
+            Dict mapping paths to secret data, in the order given
         """
-        results = {}
-        for path in paths:
-            secret = self.read_secret(path)
-            if secret:
-                results[path] = secret
-        return results
+        unique = list(dict.fromkeys(paths))
+        if not unique:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_READS, len(unique))) as executor:
+            secrets = executor.map(self.read_secret, unique)
+            return {path: secret for path, secret in zip(unique, secrets) if secret}
 
 
 # =============================================================================
@@ -291,6 +578,9 @@ class CISecretsManager:
         self.vault = vault_client
         self.secrets: Dict[str, Dict[str, Any]] = {}
         self._masked_values: set = set()
+        # Replaces _masked_values in a string; rebuilt by mask_string when dirty
+        self._masker: Optional[Callable[[str], str]] = None
+        self._mask_dirty = False
 
     def load_secrets(self, secret_names: Optional[List[str]] = None) -> bool:
         """
@@ -305,19 +595,29 @@ class CISecretsManager:
         names = secret_names or list(self.SECRET_PATHS.keys())
         success = True
 
+        paths = {}
         for name in names:
             path = self.SECRET_PATHS.get(name)
             if not path:
                 logger.warning(f"Unknown secret: {name}")
                 continue
+            paths[name] = path
+
+        try:
+            loaded = self.vault.read_secrets_batch(list(paths.values()))
+        except VaultError as e:
+            logger.error(f"Failed to load secrets: {e}")
+            return False
 
-            secret = self.vault.read_secret(path)
+        for name, path in paths.items():
+            secret = loaded.get(path)
             if secret:
                 self.secrets[name] = secret
                 # Track values for masking
                 for value in secret.values():
                     if isinstance(value, str) and len(value) > 3:
                         self._masked_values.add(value)
+                        self._mask_dirty = True
                 logger.info(f"Loaded secret: {name}")
             else:
                 logger.error(f"Failed to load secret: {name}")
@@ -343,11 +643,11 @@ class CISecretsManager:
                 errors.append(f"Secret '{name}' not loaded")
                 continue
 
-            required = self.REQUIRED_KEYS.get(name, [])
-            secret = self.secrets[name]
+            # Keys with a non-empty value; one pass over the secret
+            present = {key for key, value in self.secrets[name].items() if value}
 
-            for key in required:
-                if key not in secret or not secret[key]:
+            for key in self.REQUIRED_KEYS.get(name, []):
+                if key not in present:
                     errors.append(f"Secret '{name}' missing required key: {key}")
 
         return errors
@@ -367,15 +667,13 @@ class CISecretsManager:
             logger.error(f"Secret not loaded: {secret_name}")
             return {}
 
-        exported = {}
-        secret = self.secrets[secret_name]
-
-        for key, value in secret.items():
-            if value is not None:
-                env_name = f"{prefix}{key.upper()}" if prefix else key.upper()
-                os.environ[env_name] = str(value)
-                exported[env_name] = str(value)
-                logger.info(f"Exported: {env_name}=***")
+        exported = {
+            f"{prefix}{key.upper()}": str(value)
+            for key, value in self.secrets[secret_name].items()
+            if value is not None
+        }
+        os.environ.update(exported)
+        logger.info(f"Exported {len(exported)} vars for {secret_name}")
 
         return exported
 
@@ -403,11 +701,49 @@ class CISecretsManager:
         Returns:
             Text with secrets replaced by ***
         """
-        result = text
+        if self._mask_dirty:
+            self._masker = self._build_masker()
+            self._mask_dirty = False
+
+        if self._masker is None:
+            return text
+        return self._masker(text)
+
+    def _build_masker(self) -> Optional[Callable[[str], str]]:
+        """
+        Build a single-pass replacer for _masked_values.
+
+        Matches are leftmost-longest, so a secret containing another is
+        masked whole. Uses an Aho-Corasick automaton (pyahocorasick) when
+        available, whose scan cost doesn't grow with the number of
+        secrets; otherwise a regex alternation.
+        """
+        if not self._masked_values:
+            return None
+
+        if not AHOCORASICK_AVAILABLE:
+            values = sorted(self._masked_values, key=len, reverse=True)
+            pattern = re.compile("|".join(map(re.escape, values)))
+            return lambda text: pattern.sub("***", text)
+
+        automaton = ahocorasick.Automaton()
         for value in self._masked_values:
-            if value in result:
-                result = result.replace(value, "***")
-        return result
+            automaton.add_word(value, len(value))
+        automaton.make_automaton()
+
+        def mask(text: str) -> str:
+            parts = []
+            last = 0
+            for end, length in automaton.iter_long(text):
+                parts.append(text[last:end - length + 1])
+                parts.append("***")
+                last = end + 1
+            if not parts:
+                return text
+            parts.append(text[last:])
+            return "".join(parts)
+
+        return mask
 
     def write_env_file(self, filepath: str, secret_names: Optional[List[str]] = None):
         """
@@ -418,24 +754,27 @@ class CISecretsManager:
             secret_names: Specific secrets to include
         """
         names = secret_names or list(self.secrets.keys())
+        parts = [
+            "# Auto-generated secrets - DO NOT COMMIT\n",
+            "# Generated by vault_integration.py\n\n",
+        ]
 
-        with open(filepath, "w") as f:
-            f.write("# Auto-generated secrets - DO NOT COMMIT\n")
-            f.write("# Generated by vault_integration.py\n\n")
+        for name in names:
+            if name not in self.secrets:
+                continue
 
-            for name in names:
-                if name not in self.secrets:
-                    continue
+            parts.append(f"# {name}\n")
+            secret = self.secrets[name]
 
-                f.write(f"# {name}\n")
-                secret = self.secrets[name]
+            for key, value in secret.items():
+                if value is not None:
+                    env_name = f"{name.upper()}_{key.upper()}"
+                    parts.append(f"{env_name}={value}\n")
 
-                for key, value in secret.items():
-                    if value is not None:
-                        env_name = f"{name.upper()}_{key.upper()}"
-                        f.write(f"{env_name}={value}\n")
+            parts.append("\n")
 
-                f.write("\n")
+        with open(filepath, "w") as f:
+            f.write("".join(parts))
 
         logger.info(f"Wrote env file: {filepath}")
 
@@ -454,60 +793,73 @@ def main():
     parser.add_argument("--prefix", default="", help="Environment variable prefix")
     parser.add_argument("--env-file", default=".env.secrets", help="Output .env file path")
     parser.add_argument("--output", choices=["json", "env", "masked"], default="masked")
+    parser.add_argument("--no-token-cache", action="store_true",
+                        help="Always authenticate instead of reusing a cached token")
 
     args = parser.parse_args()
 
     # Initialize Vault client
     config = VaultConfig.from_environment()
+    config.use_token_cache = not args.no_token_cache
     client = VaultClient(config)
 
-    if not client.authenticate():
-        logger.error("Vault authentication failed")
-        sys.exit(1)
-
-    # Initialize secrets manager
-    manager = CISecretsManager(client)
-
-    # Execute action
-    if args.action == "load":
-        if manager.load_secrets(args.secrets):
-            if args.output == "json":
-                # Output JSON (masked)
-                masked = {
-                    name: {k: "***" for k in secret.keys()}
-                    for name, secret in manager.secrets.items()
-                }
-                print(json.dumps(masked, indent=2))
-            else:
-                print("Secrets loaded successfully")
-        else:
+    try:
+        try:
+            authenticated = client.authenticate()
+        except VaultError as e:
+            logger.error(f"Vault unreachable: {e}")
+            authenticated = False
+        if not authenticated:
+            logger.error("Vault authentication failed")
             sys.exit(1)
 
-    elif args.action == "validate":
-        if not manager.load_secrets(args.secrets):
-            sys.exit(1)
+        # Initialize secrets manager
+        manager = CISecretsManager(client)
+
+        # Execute action
+        if args.action == "load":
+            if manager.load_secrets(args.secrets):
+                if args.output == "json":
+                    # Output JSON (masked)
+                    masked = {
+                        name: {k: "***" for k in secret.keys()}
+                        for name, secret in manager.secrets.items()
+                    }
+                    print(json.dumps(masked, indent=2))
+                else:
+                    print("Secrets loaded successfully")
+            else:
+                sys.exit(1)
 
-        errors = manager.validate_secrets(args.secrets)
-        if errors:
-            for error in errors:
-                logger.error(error)
-            sys.exit(1)
-        print("All secrets valid")
+        elif args.action == "validate":
+            if not manager.load_secrets(args.secrets):
+                sys.exit(1)
 
-    elif args.action == "export":
-        if not manager.load_secrets(args.secrets):
-            sys.exit(1)
+            errors = manager.validate_secrets(args.secrets)
+            if errors:
+                for error in errors:
+                    logger.error(error)
+                sys.exit(1)
+            print("All secrets valid")
 
-        for name in args.secrets or manager.secrets.keys():
-            manager.export_to_environment(name, args.prefix)
+        elif args.action == "export":
+            if not manager.load_secrets(args.secrets):
+                sys.exit(1)
 
-        print("Secrets exported to environment")
+            for name in args.secrets or manager.secrets.keys():
+                manager.export_to_environment(name, args.prefix)
 
-    elif args.action == "env-file":
-        if not manager.load_secrets(args.secrets):
-            sys.exit(1)
+            print("Secrets exported to environment")
+
+        elif args.action == "env-file":
+            if not manager.load_secrets(args.secrets):
+                sys.exit(1)
+
+            manager.write_env_file(args.env_file, args.secrets)
 
-        manager.write_env_file(args.env_file, args.secrets)
+    finally:
+        # Stops the token renewal thread started by authenticate()
+        client.close()
 
 
 if __name__ == "__main__":
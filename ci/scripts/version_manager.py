@@ -51,22 +51,34 @@ USAGE:
 ===============================================================================
 """
 
-import argparse
+import functools
 import json
 import os
 import re
 import sys
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+# Shared by every _print_json call instead of json.dumps building one each
+# time; default options, so --json output is formatted exactly as json.dumps
+_JSON_ENCODER = json.JSONEncoder()
+
+
+def _print_json(data: Any) -> None:
+    """Write data to stdout as a line of JSON"""
+    sys.stdout.write(_JSON_ENCODER.encode(data) + "\n")
 
 
 # =============================================================================
 # Semantic Version Class
 # =============================================================================
 
-@dataclass
+# dataclass(slots=...) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SemanticVersion:
     """
     Semantic version following SemVer 2.0.0 specification.
@@ -86,6 +98,8 @@ class SemanticVersion:
     prerelease: Optional[str] = None
     prerelease_num: Optional[int] = None
     build: Optional[str] = None
+    # Memoized __str__; instances are immutable so it never goes stale
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     VERSION_PATTERN = re.compile(
         r'^(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)'
@@ -94,24 +108,32 @@ class SemanticVersion:
     )
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def parse(cls, version_string: str) -> "SemanticVersion":
-        """Parse a version string into SemanticVersion"""
+        """
+        Parse a version string into SemanticVersion.
+
+        Results are memoized; sharing them is safe since they're frozen.
+        """
         match = cls.VERSION_PATTERN.match(version_string.strip())
         if not match:
             raise ValueError(f"Invalid version format: {version_string}")
 
-        groups = match.groupdict()
+        major, minor, patch, prerelease, prerelease_num, build = match.groups()
         return cls(
-            major=int(groups['major']),
-            minor=int(groups['minor']),
-            patch=int(groups['patch']),
-            prerelease=groups.get('prerelease'),
-            prerelease_num=int(groups['prerelease_num']) if groups.get('prerelease_num') else None,
-            build=groups.get('build')
+            major=int(major),
+            minor=int(minor),
+            patch=int(patch),
+            prerelease=prerelease,
+            prerelease_num=int(prerelease_num) if prerelease_num else None,
+            build=build
         )
 
     def __str__(self) -> str:
         """Format version as string"""
+        if self._str is not None:
+            return self._str
+
         version = f"{self.major}.{self.minor}.{self.patch}"
 
         if self.prerelease:
@@ -122,6 +144,8 @@ class SemanticVersion:
         if self.build:
             version += f"+{self.build}"
 
+        # Frozen dataclass; bypass its __setattr__ to fill the memo
+        object.__setattr__(self, "_str", version)
         return version
 
     def bump_major(self) -> "SemanticVersion":
@@ -206,6 +230,18 @@ class SemanticVersion:
         """Get core version without pre-release or build"""
         return f"{self.major}.{self.minor}.{self.patch}"
 
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Fields reported by `show --json`, in output order"""
+        return {
+            "version": str(self),
+            "major": self.major,
+            "minor": self.minor,
+            "patch": self.patch,
+            "prerelease": self.prerelease,
+            "prerelease_num": self.prerelease_num,
+            "is_prerelease": self.prerelease is not None,
+        }
+
 
 # =============================================================================
 # Version File Handlers
@@ -216,6 +252,48 @@ class VersionFileHandler:
 
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
+        # ((mtime_ns, size), parsed content) from the last read or write
+        self._cache: Optional[Tuple[Tuple[int, int], Any]] = None
+
+    def _parse(self, content: str) -> Any:
+        """Convert file text into the form read/write_version work on"""
+        return content
+
+    def _load(self) -> Any:
+        """
+        Parsed file content, or None if the file does not exist.
+
+        The parse is reused until the file's mtime or size changes, so a
+        read_version followed by write_version reads the file only once.
+        """
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            self._cache = None
+            return None
+
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cache is None or self._cache[0] != key:
+            self._cache = (key, self._parse(self.file_path.read_text()))
+        return self._cache[1]
+
+    def _save(self, text: str, parsed: Any) -> None:
+        """
+        Write text to the file and cache parsed as its content.
+
+        The text goes to a temp sibling that is renamed over the file, so a
+        crash mid-write never leaves it truncated.
+        """
+        self._cache = None
+        tmp = self.file_path.with_suffix(self.file_path.suffix + ".tmp")
+        tmp.write_text(text)
+        try:
+            os.chmod(tmp, os.stat(self.file_path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, self.file_path)
+        st = os.stat(self.file_path)
+        self._cache = ((st.st_mtime_ns, st.st_size), parsed)
 
     def read_version(self) -> Optional[str]:
         """Read version from file"""
@@ -233,13 +311,14 @@ class JSONVersionHandler(VersionFileHandler):
         super().__init__(file_path)
         self.version_key = version_key
 
+    def _parse(self, content: str) -> Any:
+        return json.loads(content)
+
     def read_version(self) -> Optional[str]:
-        if not self.file_path.exists():
+        data = self._load()
+        if data is None:
             return None
 
-        with open(self.file_path, 'r') as f:
-            data = json.load(f)
-
         # Handle nested keys like "meta.version"
         keys = self.version_key.split('.')
         value = data
@@ -252,12 +331,10 @@ class JSONVersionHandler(VersionFileHandler):
         return str(value)
 
     def write_version(self, version: str) -> bool:
-        if not self.file_path.exists():
+        data = self._load()
+        if data is None:
             return False
 
-        with open(self.file_path, 'r') as f:
-            data = json.load(f)
-
         # Handle nested keys
         keys = self.version_key.split('.')
         target = data
@@ -265,8 +342,7 @@ class JSONVersionHandler(VersionFileHandler):
             target = target[key]
         target[keys[-1]] = version
 
-        with open(self.file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+        self._save(json.dumps(data, indent=4), data)
 
         return True
 
@@ -274,18 +350,19 @@ class JSONVersionHandler(VersionFileHandler):
 class AppConfHandler(VersionFileHandler):
     """Handler for Splunk app.conf files"""
 
+    VERSION_PATTERN = re.compile(r'^version\s*=\s*(.+)$', re.MULTILINE)
+
     def read_version(self) -> Optional[str]:
-        if not self.file_path.exists():
+        content = self._load()
+        if content is None:
             return None
 
-        with open(self.file_path, 'r') as f:
-            content = f.read()
-
-        match = re.search(r'^version\s*=\s*(.+)$', content, re.MULTILINE)
+        match = self.VERSION_PATTERN.search(content)
         return match.group(1).strip() if match else None
 
     def write_version(self, version: str) -> bool:
-        if not self.file_path.exists():
+        content = self._load()
+        if content is None:
             # Create new app.conf
             content = f"""[install]
 is_configured = false
@@ -303,31 +380,28 @@ version = {version}
 id = kvstore_syncthing
 """
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.file_path, 'w') as f:
-                f.write(content)
+            self._save(content, content)
             return True
 
-        with open(self.file_path, 'r') as f:
-            content = f.read()
-
-        # Update version line
-        if re.search(r'^version\s*=', content, re.MULTILINE):
-            content = re.sub(
-                r'^version\s*=\s*.+$',
-                f'version = {version}',
-                content,
-                flags=re.MULTILINE
-            )
-        else:
+        # Update version lines in one pass, noting [launcher] in case there are none
+        lines = content.splitlines(keepends=True)
+        updated = False
+        launcher = []
+        for i, line in enumerate(lines):
+            if line.startswith("version") and line[7:].lstrip().startswith("="):
+                ending = line[len(line.rstrip("\r\n")):]
+                lines[i] = f"version = {version}{ending}"
+                updated = True
+            elif "[launcher]" in line:
+                launcher.append(i)
+
+        if not updated:
             # Add version to [launcher] stanza
-            content = re.sub(
-                r'(\[launcher\])',
-                f'\\1\nversion = {version}',
-                content
-            )
+            for i in launcher:
+                lines[i] = lines[i].replace("[launcher]", f"[launcher]\nversion = {version}")
 
-        with open(self.file_path, 'w') as f:
-            f.write(content)
+        content = "".join(lines)
+        self._save(content, content)
 
         return True
 
@@ -335,35 +409,34 @@ id = kvstore_syncthing
 class ChangelogHandler(VersionFileHandler):
     """Handler for CHANGELOG.md"""
 
+    VERSION_PATTERN = re.compile(r'## \[(\d+\.\d+\.\d+[^\]]*)\]')
+
     def read_version(self) -> Optional[str]:
-        if not self.file_path.exists():
+        content = self._load()
+        if content is None:
             return None
 
-        with open(self.file_path, 'r') as f:
-            content = f.read()
-
         # Find first version heading after [Unreleased]
-        match = re.search(r'## \[(\d+\.\d+\.\d+[^\]]*)\]', content)
+        match = self.VERSION_PATTERN.search(content)
         return match.group(1) if match else None
 
     def write_version(self, version: str) -> bool:
-        if not self.file_path.exists():
+        content = self._load()
+        if content is None:
             return False
 
-        with open(self.file_path, 'r') as f:
-            content = f.read()
+        # Only needed when a version is written; read-only commands skip it
+        from datetime import datetime
 
         today = datetime.utcnow().strftime('%Y-%m-%d')
 
         # Replace [Unreleased] with new version
-        content = re.sub(
-            r'## \[Unreleased\]',
+        content = content.replace(
+            '## [Unreleased]',
             f'## [Unreleased]\n\n## [{version}] - {today}',
-            content
         )
 
-        with open(self.file_path, 'w') as f:
-            f.write(content)
+        self._save(content, content)
 
         return True
 
@@ -378,6 +451,8 @@ class VersionManager:
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root)
         self.handlers: List[VersionFileHandler] = []
+        # get_current_version result, cleared whenever set_version writes
+        self._cached_current: Optional[SemanticVersion] = None
 
         # Register known version files
         self._register_handlers()
@@ -411,28 +486,49 @@ class VersionManager:
 
     def get_current_version(self) -> Optional[SemanticVersion]:
         """Get current version from primary source"""
+        if self._cached_current is not None:
+            return self._cached_current
+
         for handler in self.handlers:
             version_str = handler.read_version()
             if version_str:
                 try:
-                    return SemanticVersion.parse(version_str)
+                    self._cached_current = SemanticVersion.parse(version_str)
+                    return self._cached_current
                 except ValueError:
                     continue
         return None
 
-    def set_version(self, version: SemanticVersion) -> Dict[str, bool]:
-        """Set version in all registered files"""
-        results = {}
+    def set_version(self, version: SemanticVersion) -> List[Tuple[str, bool]]:
+        """
+        Set version in all registered files, writing them concurrently.
+
+        Returns:
+            (file path, success) pairs sorted by path
+        """
+        # Deferred so read-only commands like `show` don't import it
+        from concurrent.futures import ThreadPoolExecutor
+
+        results = []
         version_str = str(version)
+        self._cached_current = None
 
-        for handler in self.handlers:
+        # Each handler owns a distinct file, so writes don't interfere
+        with ThreadPoolExecutor(max_workers=max(len(self.handlers), 1)) as executor:
+            futures = [
+                (handler, executor.submit(handler.write_version, version_str))
+                for handler in self.handlers
+            ]
+
+        for handler, future in futures:
             try:
-                success = handler.write_version(version_str)
-                results[str(handler.file_path)] = success
+                success = future.result()
             except Exception as e:
                 print(f"Error updating {handler.file_path}: {e}")
-                results[str(handler.file_path)] = False
+                success = False
+            results.append((str(handler.file_path), success))
 
+        results.sort()
         return results
 
     def bump(self, bump_type: str) -> Tuple[SemanticVersion, SemanticVersion]:
@@ -491,11 +587,66 @@ class VersionManager:
 # CLI
 # =============================================================================
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Semantic version manager for CI/CD",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def _add_show_parser(subparsers):
+    subparsers.add_parser("show", help="Show current version")
+
+
+def _add_bump_parser(subparsers):
+    bump_parser = subparsers.add_parser("bump", help="Bump version")
+    bump_parser.add_argument(
+        "type",
+        choices=["major", "minor", "patch", "prerelease"],
+        help="Version component to bump"
+    )
+
+
+def _add_prerelease_parser(subparsers):
+    pre_parser = subparsers.add_parser("prerelease", help="Set pre-release tag")
+    pre_parser.add_argument("tag", help="Pre-release tag (alpha, beta, rc)")
+    pre_parser.add_argument("num", type=int, nargs="?", help="Pre-release number")
+
+
+def _add_promote_parser(subparsers):
+    subparsers.add_parser("promote", help="Remove pre-release tag")
+
+
+def _add_set_parser(subparsers):
+    set_parser = subparsers.add_parser("set", help="Set specific version")
+    set_parser.add_argument("version", help="Version string (e.g., 2.0.0-beta1)")
+
+
+# Subcommand -> function adding its parser, in help order
+_SUBCOMMANDS = {
+    "show": _add_show_parser,
+    "bump": _add_bump_parser,
+    "prerelease": _add_prerelease_parser,
+    "promote": _add_promote_parser,
+    "set": _add_set_parser,
+}
+
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """The subcommand argv invokes, or None if help is requested or there is none"""
+    if "-h" in argv or "--help" in argv:
+        return None
+
+    args = iter(argv)
+    for arg in args:
+        if arg == "--root":
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg if arg in _SUBCOMMANDS else None
+    return None
+
+
+# `show --json` output when no version file exists; same bytes _print_json
+# would produce for SemanticVersion.to_json_dict() keys all set to None
+_SHOW_NULL_JSON = (
+    '{"version": null, "major": null, "minor": null, "patch": null, '
+    '"prerelease": null, "prerelease_num": null, "is_prerelease": null}\n'
+)
+
+_EPILOG = """
 Examples:
   %(prog)s show                      Show current version
   %(prog)s bump patch                1.0.0 -> 1.0.1
@@ -506,101 +657,120 @@ Examples:
   %(prog)s promote                   1.0.0-rc2 -> 1.0.0
   %(prog)s set 2.0.0-beta1           Set specific version
 """
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parser(command: Optional[str]):
+    """
+    Argument parser with only `command`'s subparser, or all of them for None.
+
+    Cached, so calling main() repeatedly in one process builds it once.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Semantic version manager for CI/CD",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument("--root", default=".", help="Project root directory")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
 
-    subparsers = parser.add_subparsers(dest="command", help="Command")
+    # The metavar keeps usage lines listing every command either way
+    subparsers = parser.add_subparsers(
+        dest="command",
+        help="Command",
+        metavar="{" + ",".join(_SUBCOMMANDS) + "}" if command else None,
+    )
+    for name, add_parser in _SUBCOMMANDS.items():
+        if command is None or name == command:
+            add_parser(subparsers)
+    return parser
 
-    # show command
-    subparsers.add_parser("show", help="Show current version")
 
-    # bump command
-    bump_parser = subparsers.add_parser("bump", help="Bump version")
-    bump_parser.add_argument(
-        "type",
-        choices=["major", "minor", "patch", "prerelease"],
-        help="Version component to bump"
-    )
+def _cmd_show(args, manager: VersionManager) -> None:
+    version = manager.get_current_version()
+    if args.json:
+        if version is None:
+            sys.stdout.write(_SHOW_NULL_JSON)
+        else:
+            _print_json(version.to_json_dict())
+    else:
+        sys.stdout.write(f"Current version: {version!s}\n")
 
-    # prerelease command
-    pre_parser = subparsers.add_parser("prerelease", help="Set pre-release tag")
-    pre_parser.add_argument("tag", help="Pre-release tag (alpha, beta, rc)")
-    pre_parser.add_argument("num", type=int, nargs="?", help="Pre-release number")
 
-    # promote command
-    subparsers.add_parser("promote", help="Remove pre-release tag")
+def _cmd_bump(args, manager: VersionManager) -> None:
+    old, new = manager.bump(args.type)
+    if args.json:
+        _print_json({"old": str(old), "new": str(new)})
+    else:
+        sys.stdout.write(f"Bumped {args.type}: {old!s} -> {new!s}\n")
 
-    # set command
-    set_parser = subparsers.add_parser("set", help="Set specific version")
-    set_parser.add_argument("version", help="Version string (e.g., 2.0.0-beta1)")
 
-    args = parser.parse_args()
+def _cmd_prerelease(args, manager: VersionManager) -> None:
+    old, new = manager.set_prerelease(args.tag, args.num)
+    if args.json:
+        _print_json({"old": str(old), "new": str(new)})
+    else:
+        sys.stdout.write(f"Set pre-release: {old!s} -> {new!s}\n")
 
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
 
-    manager = VersionManager(args.root)
+def _cmd_promote(args, manager: VersionManager) -> None:
+    old, new = manager.promote()
+    if args.json:
+        _print_json({"old": str(old), "new": str(new)})
+    else:
+        sys.stdout.write(f"Promoted: {old!s} -> {new!s}\n")
 
-    if args.command == "show":
-        version = manager.get_current_version()
-        if args.json:
-            print(json.dumps({
-                "version": str(version) if version else None,
-                "major": version.major if version else None,
-                "minor": version.minor if version else None,
-                "patch": version.patch if version else None,
-                "prerelease": version.prerelease if version else None,
-                "prerelease_num": version.prerelease_num if version else None,
-                "is_prerelease": version.is_prerelease if version else None,
-            }))
-        else:
-            print(f"Current version: {version}")
 
-    elif args.command == "bump":
-        old, new = manager.bump(args.type)
-        if args.json:
-            print(json.dumps({"old": str(old), "new": str(new)}))
-        else:
-            print(f"Bumped {args.type}: {old} -> {new}")
+def _cmd_set(args, manager: VersionManager) -> None:
+    try:
+        version = SemanticVersion.parse(args.version)
+        current = manager.get_current_version()
+        results = manager.set_version(version)
 
-    elif args.command == "prerelease":
-        old, new = manager.set_prerelease(args.tag, args.num)
         if args.json:
-            print(json.dumps({"old": str(old), "new": str(new)}))
+            _print_json({
+                "old": str(current) if current else None,
+                "new": str(version),
+                "files": dict(results)
+            })
         else:
-            print(f"Set pre-release: {old} -> {new}")
+            buf = [f"Set version: {current!s} -> {version!s}\n"]
+            buf.extend(
+                f"  {file}: {'updated' if success else 'skipped'}\n"
+                for file, success in results
+            )
+            sys.stdout.write("".join(buf))
 
-    elif args.command == "promote":
-        old, new = manager.promote()
-        if args.json:
-            print(json.dumps({"old": str(old), "new": str(new)}))
-        else:
-            print(f"Promoted: {old} -> {new}")
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
-    elif args.command == "set":
-        try:
-            version = SemanticVersion.parse(args.version)
-            current = manager.get_current_version()
-            results = manager.set_version(version)
-
-            if args.json:
-                print(json.dumps({
-                    "old": str(current) if current else None,
-                    "new": str(version),
-                    "files": results
-                }))
-            else:
-                print(f"Set version: {current} -> {version}")
-                for file, success in results.items():
-                    status = "updated" if success else "skipped"
-                    print(f"  {file}: {status}")
-
-        except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
+
+# Subcommand -> function running it with the parsed args and a VersionManager
+_COMMANDS = {
+    "show": _cmd_show,
+    "bump": _cmd_bump,
+    "prerelease": _cmd_prerelease,
+    "promote": _cmd_promote,
+    "set": _cmd_set,
+}
+
+
+def main():
+    # Only the invoked command's parser is built; all of them for help,
+    # or when no known command was given so argparse reports it as before
+    parser = _get_parser(_requested_command(sys.argv[1:]))
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    manager = VersionManager(args.root)
+    _COMMANDS[args.command](args, manager)
 
 
 if __name__ == "__main__":
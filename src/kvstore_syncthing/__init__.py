@@ -26,8 +26,32 @@ __version__ = "1.0.0"
 __author__ = "KVStore Syncthing Contributors"
 __license__ = "MIT"
 
-from .sync_engine import SyncEngine, SyncResult, SyncMode
-from .handlers.base import BaseSyncHandler
+import importlib
+from typing import Any, List
+
+# Public API, imported from its submodule on first access (PEP 562)
+_LAZY = {
+    "SyncEngine": "sync_engine",
+    "SyncResult": "sync_engine",
+    "SyncMode": "sync_engine",
+    "BaseSyncHandler": "handlers.base",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name's submodule the first time it is accessed"""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "SyncEngine",
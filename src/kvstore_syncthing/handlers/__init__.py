@@ -21,48 +21,60 @@ Date        Author      Type    Description
 ===============================================================================
 """
 
-# Core handlers
+import importlib
+from typing import Any, List
+
+# Core handlers; base is cheap and imported by every handler module anyway
 from .base import BaseSyncHandler, DestinationConfig
-from .rest import RESTSyncHandler
-from .mongodb import MongoDBSyncHandler
-from .factory import HandlerFactory
 
-# HEC handler for Index & Rehydrate pattern
-from .hec import (
-    HECConfig,
-    HECHandler,
-    HECSyncHandler,
-    RehydrationConfig,
-    RehydrationHandler,
-)
+# Everything else is imported from its submodule on first access (PEP 562),
+# so importing the package doesn't pull in requests, boto3, azure or gcs
+_LAZY = {
+    "RESTSyncHandler": "rest",
+    "MongoDBSyncHandler": "mongodb",
+    "HandlerFactory": "factory",
+    # HEC handler for Index & Rehydrate pattern
+    "HECConfig": "hec",
+    "HECHandler": "hec",
+    "HECSyncHandler": "hec",
+    "RehydrationConfig": "hec",
+    "RehydrationHandler": "hec",
+    # File export for offline sync
+    "FileExportConfig": "file_export",
+    "FileExportHandler": "file_export",
+    "ExportPackage": "file_export",
+    # Multi-cloud storage
+    "CloudStorageConfig": "cloud_storage",
+    "CloudStorageHandler": "cloud_storage",
+    "S3Provider": "cloud_storage",
+    "AzureBlobProvider": "cloud_storage",
+    "GCSProvider": "cloud_storage",
+    "ExportManifest": "cloud_storage",
+    # Threat intelligence distribution
+    "DistributionConfig": "threat_distribution",
+    "ThreatDistributionHandler": "threat_distribution",
+    "ThreatFeedIngester": "threat_distribution",
+    "FeedConfig": "threat_distribution",
+    "OutputFormat": "threat_distribution",
+    "IndicatorType": "threat_distribution",
+    "AuthType": "threat_distribution",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a handler's submodule the first time the handler is accessed"""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-# File export for offline sync
-from .file_export import (
-    FileExportConfig,
-    FileExportHandler,
-    ExportPackage,
-)
 
-# Multi-cloud storage
-from .cloud_storage import (
-    CloudStorageConfig,
-    CloudStorageHandler,
-    S3Provider,
-    AzureBlobProvider,
-    GCSProvider,
-    ExportManifest,
-)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
 
-# Threat intelligence distribution
-from .threat_distribution import (
-    DistributionConfig,
-    ThreatDistributionHandler,
-    ThreatFeedIngester,
-    FeedConfig,
-    OutputFormat,
-    IndicatorType,
-    AuthType,
-)
 
 __all__ = [
     # Core
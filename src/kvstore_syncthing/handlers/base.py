@@ -31,10 +31,12 @@ SDK REQUIREMENTS (from BDD contracts):
 ===============================================================================
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from itertools import islice
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
 import logging
+import sys
+import time
 
 # CRITICAL: Using official splunk-sdk - NO homebrew HTTP clients
 # This is a REQUIRED enterprise SDK per BDD contracts
@@ -49,14 +51,35 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# test_connection reuses a successful result this long while still connected
+CONNECTION_CHECK_TTL = 30.0
 
-@dataclass
+# dataclass(slots=...) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Yield lists of up to batch_size items, consuming items lazily.
+
+    Lets write_records/delete_records take a generator (e.g. straight from
+    read_records) while holding at most one batch in memory.
+    """
+    it = iter(items)
+    while batch := list(islice(it, batch_size)):
+        yield batch
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DestinationConfig:
     """
     Base configuration for sync destinations.
 
     All destination types inherit from this base configuration.
     Credentials are stored/retrieved via UCC's storage/passwords.
+
+    Immutable and hashable; derive variants with dataclasses.replace().
+    Subclasses must be frozen as well.
     """
     name: str
     destination_type: str
@@ -72,11 +95,16 @@ class DestinationConfig:
     max_retries: int = 3
     target_app: str = "search"
     target_owner: str = "nobody"
+    batch_size: int = 1000  # Records per round trip in write/delete_records
 
 
-class BaseSyncHandler(ABC):
+class BaseSyncHandler:
     """
-    Abstract base class for sync handlers.
+    Base class for sync handlers.
+
+    A plain class rather than an ABC: every method has a working
+    splunk-sdk implementation for subclasses to override, so there is no
+    abstract method for ABCMeta to enforce.
 
     All handlers MUST use splunk-sdk for Splunk API interactions.
     This ensures enterprise-grade security and maintainability.
@@ -95,6 +123,9 @@ class BaseSyncHandler(ABC):
         handler.disconnect()
     """
 
+    # Subclasses declare their own __slots__ to stay free of a __dict__
+    __slots__ = ("_cancelled", "_connected", "_last_ok", "_service", "destination")
+
     def __init__(self, destination: DestinationConfig):
         """
         Initialize handler with destination configuration.
@@ -111,6 +142,8 @@ class BaseSyncHandler(ABC):
         self._service: Optional[splunk_client.Service] = None
         self._connected = False
         self._cancelled = False
+        # (monotonic time, message) of the last successful test_connection
+        self._last_ok: Optional[Tuple[float, str]] = None
 
     @property
     def name(self) -> str:
@@ -203,14 +236,23 @@ class BaseSyncHandler(ABC):
                 logger.debug(f"Logout error (ignored): {e}")
         self._service = None
         self._connected = False
+        self._last_ok = None
 
     def test_connection(self) -> Tuple[bool, str]:
         """
         Test connection to destination.
 
+        A success is reused for CONNECTION_CHECK_TTL seconds while the
+        handler stays connected, skipping the server-info round trip.
+
         Returns:
             Tuple of (success, message)
         """
+        if self._connected and self._last_ok:
+            checked_at, message = self._last_ok
+            if time.monotonic() - checked_at < CONNECTION_CHECK_TTL:
+                return True, message
+
         try:
             if not self._connected:
                 if not self.connect():
@@ -219,7 +261,9 @@ class BaseSyncHandler(ABC):
             # Test by getting server info via splunk-sdk
             info = self._service.info
             version = info.get("version", "unknown")
-            return True, f"Connected to Splunk {version} via splunk-sdk"
+            message = f"Connected to Splunk {version} via splunk-sdk"
+            self._last_ok = (time.monotonic(), message)
+            return True, message
 
         except Exception as e:
             return False, f"Connection test failed: {e}"
@@ -371,7 +415,7 @@ class BaseSyncHandler(ABC):
             logger.error(f"Error reading records via splunk-sdk: {e}")
 
     def write_records(self, collection: str, app: str, owner: str,
-                     records: List[Dict], preserve_key: bool = True) -> Tuple[int, List[str]]:
+                     records: Iterable[Dict], preserve_key: bool = True) -> Tuple[int, List[str]]:
         """
         Write records to KVStore using splunk-sdk.
 
@@ -381,7 +425,8 @@ class BaseSyncHandler(ABC):
             collection: Collection name
             app: Splunk app context
             owner: Splunk owner context
-            records: Records to write
+            records: Records to write; any iterable, consumed lazily, so a
+                generator from read_records can be passed without a list()
             preserve_key: Whether to preserve _key field
 
         Returns:
@@ -420,6 +465,40 @@ class BaseSyncHandler(ABC):
 
         return written, errors
 
+    def write_records_many(self, batches: Iterable[Tuple[str, str, str, Iterable[Dict]]],
+                           preserve_key: bool = True
+                           ) -> Dict[Tuple[str, str, str], Tuple[int, List[str]]]:
+        """
+        Write records to several collections in one call.
+
+        The default calls write_records per (collection, app, owner) over
+        this handler's single connection; handlers whose backend can fuse
+        or pipeline writes across collections override it.
+
+        Args:
+            batches: (collection, app, owner, records) tuples; records may
+                be any iterable, as for write_records
+            preserve_key: Whether to preserve _key field
+
+        Returns:
+            Dict mapping (collection, app, owner) to (records_written,
+            errors), summed when a target appears more than once
+        """
+        results: Dict[Tuple[str, str, str], Tuple[int, List[str]]] = {}
+
+        for collection, app, owner, records in batches:
+            if self._cancelled:
+                break
+
+            written, errors = self.write_records(collection, app, owner, records, preserve_key)
+            target = (collection, app, owner)
+            if target in results:
+                prev_written, prev_errors = results[target]
+                written, errors = prev_written + written, prev_errors + errors
+            results[target] = (written, errors)
+
+        return results
+
     def update_record(self, collection: str, app: str, owner: str,
                      key: str, record: Dict) -> bool:
         """
@@ -451,7 +530,7 @@ class BaseSyncHandler(ABC):
             return False
 
     def delete_records(self, collection: str, app: str, owner: str,
-                      keys: List[str]) -> Tuple[int, List[str]]:
+                      keys: Iterable[str]) -> Tuple[int, List[str]]:
         """
         Delete records by key using splunk-sdk.
 
@@ -459,7 +538,7 @@ class BaseSyncHandler(ABC):
             collection: Collection name
             app: Splunk app context
             owner: Splunk owner context
-            keys: Record keys to delete
+            keys: Record keys to delete; any iterable, consumed lazily
 
         Returns:
             Tuple of (records_deleted, errors)
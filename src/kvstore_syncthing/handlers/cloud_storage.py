@@ -34,6 +34,7 @@ import io
 import json
 import logging
 import os
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -42,6 +43,9 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=...) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # =============================================================================
 # SDK Imports - Official Cloud Provider SDKs
@@ -84,7 +88,7 @@ except ImportError:
 # Cloud Storage Configuration
 # =============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CloudStorageConfig:
     """Base configuration for cloud storage destinations"""
     name: str
@@ -22,12 +22,31 @@ License: MIT
 ===============================================================================
 """
 
-from typing import Dict, Type
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from typing import ClassVar, Dict, FrozenSet, Tuple, Type
 
 from .base import BaseSyncHandler, DestinationConfig
 from .rest import RESTSyncHandler, RESTDestinationConfig
 from .mongodb import MongoDBSyncHandler, MongoDBDestinationConfig
 
+# Connected handlers kept by HandlerFactory.get; least recently used beyond
+# this are disconnected and dropped
+HANDLER_CACHE_SIZE = 64
+
+
+# Config class -> its field names, filled in by _config_fields
+_CONFIG_FIELDS: Dict[Type[DestinationConfig], FrozenSet[str]] = {}
+
+
+def _config_fields(config_class: Type[DestinationConfig]) -> FrozenSet[str]:
+    """Field names accepted by a config class, computed once per class"""
+    names = _CONFIG_FIELDS.get(config_class)
+    if names is None:
+        names = _CONFIG_FIELDS[config_class] = frozenset(f.name for f in fields(config_class))
+    return names
+
 
 class HandlerFactory:
     """
@@ -47,6 +66,14 @@ class HandlerFactory:
         "mongodb_direct": MongoDBDestinationConfig,
     }
 
+    # DestinationConfig -> (handler, lock serializing its connect/disconnect),
+    # in least to most recently used order. _instances_lock only guards the
+    # mapping; network calls happen under the per-handler lock.
+    _instances: ClassVar[
+        "OrderedDict[DestinationConfig, Tuple[BaseSyncHandler, threading.Lock]]"
+    ] = OrderedDict()
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
     @classmethod
     def create(cls, destination_type: str, config: Dict) -> BaseSyncHandler:
         """
@@ -62,38 +89,79 @@ class HandlerFactory:
         Raises:
             ValueError: If destination type is unknown
         """
-        if destination_type not in cls.HANDLER_TYPES:
-            raise ValueError(f"Unknown destination type: {destination_type}")
-
-        handler_class = cls.HANDLER_TYPES[destination_type]
-        config_class = cls.CONFIG_TYPES[destination_type]
-
-        # Build configuration object
-        dest_config = config_class(
-            name=config.get("name", ""),
-            destination_type=destination_type,
-            host=config.get("host", ""),
-            port=config.get("port", config_class.port if hasattr(config_class, "port") else 8089),
-            use_ssl=config.get("use_ssl", True),
-            verify_ssl=config.get("verify_ssl", False),
-            auth_type=config.get("auth_type", "token"),
-            username=config.get("username"),
-            password=config.get("password"),
-            connection_timeout=config.get("connection_timeout", 30),
-            read_timeout=config.get("read_timeout", 60),
-            max_retries=config.get("max_retries", 3),
-            target_app=config.get("target_app", "search"),
-            target_owner=config.get("target_owner", "nobody"),
-        )
-
-        # Add type-specific configuration
-        if destination_type == "mongodb_direct":
-            dest_config.database = config.get("database", "splunk")
-            dest_config.auth_source = config.get("auth_source", "admin")
-            dest_config.replica_set = config.get("replica_set")
+        try:
+            handler_class = cls.HANDLER_TYPES[destination_type]
+            config_class = cls.CONFIG_TYPES[destination_type]
+        except KeyError:
+            raise ValueError(f"Unknown destination type: {destination_type}") from None
+
+        # Build configuration object; configs are frozen, so every field,
+        # including type-specific ones, is set here. Missing keys fall back
+        # to the config class's own defaults.
+        config_fields = _config_fields(config_class)
+        kwargs = {key: value for key, value in config.items() if key in config_fields}
+        kwargs["name"] = config.get("name", "")
+        kwargs["destination_type"] = destination_type
+        dest_config = config_class(**kwargs)
 
         return handler_class(dest_config)
 
+    @classmethod
+    def get(cls, destination_type: str, config: Dict) -> BaseSyncHandler:
+        """
+        Get a shared, connected handler for the given destination.
+
+        Unlike create(), handlers are cached per (frozen) destination
+        config, so repeated syncs to the same destination reuse one
+        connection instead of reconnecting each time. A handler whose
+        connect() failed is returned unconnected and retried next call.
+        Connecting one destination does not block get() for others.
+
+        Args:
+            destination_type: Type of destination (e.g., "splunk_rest")
+            config: Configuration dictionary
+
+        Returns:
+            Cached handler instance
+
+        Raises:
+            ValueError: If destination type is unknown
+        """
+        handler = cls.create(destination_type, config)
+        key = handler.destination
+        evicted = []
+
+        with cls._instances_lock:
+            entry = cls._instances.get(key)
+            if entry is not None:
+                cls._instances.move_to_end(key)
+            else:
+                entry = cls._instances[key] = (handler, threading.Lock())
+                while len(cls._instances) > HANDLER_CACHE_SIZE:
+                    evicted.append(cls._instances.popitem(last=False)[1])
+
+        for old_handler, old_lock in evicted:
+            with old_lock:
+                old_handler.disconnect()
+
+        handler, lock = entry
+        with lock:
+            if not handler.is_connected:
+                handler.connect()
+
+        return handler
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Disconnect and drop every handler cached by get()"""
+        with cls._instances_lock:
+            entries = list(cls._instances.values())
+            cls._instances.clear()
+
+        for handler, lock in entries:
+            with lock:
+                handler.disconnect()
+
     @classmethod
     def get_supported_types(cls) -> list:
         """Get list of supported destination types"""
@@ -36,6 +36,7 @@ import json
 import logging
 import os
 import shutil
+import sys
 import tarfile
 import tempfile
 from dataclasses import dataclass, field
@@ -45,6 +46,9 @@ from typing import Any, Dict, Generator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=...) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # =============================================================================
 # Optional Encryption Support
@@ -64,7 +68,7 @@ except ImportError:
 # Configuration
 # =============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FileExportConfig:
     """Configuration for file export destination"""
     name: str
@@ -38,6 +38,7 @@ This pattern enables:
 import hashlib
 import json
 import logging
+import sys
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -47,6 +48,9 @@ from queue import Queue, Empty
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=...) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # =============================================================================
 # SDK Imports
@@ -76,7 +80,7 @@ except ImportError:
 # Configuration
 # =============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class HECConfig:
     """Configuration for HEC destination"""
     name: str
@@ -111,7 +115,7 @@ class HECConfig:
     num_threads: int = 4
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RehydrationConfig:
     """Configuration for rehydration from index"""
     # Source Splunk connection
@@ -24,15 +24,15 @@ License: MIT
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 import logging
 
-from .base import BaseSyncHandler, DestinationConfig
+from .base import _DATACLASS_SLOTS, BaseSyncHandler, DestinationConfig, iter_batches
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class MongoDBDestinationConfig(DestinationConfig):
     """Configuration specific to MongoDB destinations"""
     destination_type: str = "mongodb_direct"
@@ -50,6 +50,8 @@ class MongoDBSyncHandler(BaseSyncHandler):
     on port 8191 for high-performance synchronization.
     """
 
+    __slots__ = ("_client", "_db")
+
     def __init__(self, destination: MongoDBDestinationConfig):
         """
         Initialize MongoDB handler.
@@ -180,20 +182,22 @@ class MongoDBSyncHandler(BaseSyncHandler):
             return
 
     def write_records(self, collection: str, app: str, owner: str,
-                     records: List[Dict], preserve_key: bool = True) -> Tuple[int, List[str]]:
-        """Write records to MongoDB collection"""
+                     records: Iterable[Dict], preserve_key: bool = True) -> Tuple[int, List[str]]:
+        """Write records to MongoDB collection, one bulk_write per batch"""
         written = 0
         errors = []
 
         try:
             coll_name = self._get_collection_name(collection, app, owner)
 
-            # In production: use bulk_write with upsert
-            for record in records:
+            # In production: use bulk_write with upsert for each batch
+            for batch in iter_batches(records, self.destination.batch_size):
                 # Ensure _key becomes _id for MongoDB
-                if preserve_key and "_key" in record:
-                    record["_id"] = record["_key"]
-                written += 1
+                if preserve_key:
+                    for record in batch:
+                        if "_key" in record:
+                            record["_id"] = record["_key"]
+                written += len(batch)
 
             logger.info(f"Wrote {written} records to {coll_name}")
 
@@ -215,15 +219,16 @@ class MongoDBSyncHandler(BaseSyncHandler):
             return False
 
     def delete_records(self, collection: str, app: str, owner: str,
-                      keys: List[str]) -> Tuple[int, List[str]]:
+                      keys: Iterable[str]) -> Tuple[int, List[str]]:
         """Delete records by key from MongoDB"""
         deleted = 0
         errors = []
 
         try:
             coll_name = self._get_collection_name(collection, app, owner)
-            # In production: db[coll_name].delete_many({"_id": {"$in": keys}})
-            deleted = len(keys)
+            # In production: db[coll_name].delete_many({"_id": {"$in": batch}})
+            for batch in iter_batches(keys, self.destination.batch_size):
+                deleted += len(batch)
             logger.info(f"Deleted {deleted} records from {coll_name}")
 
         except Exception as e:
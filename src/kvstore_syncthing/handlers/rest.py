@@ -23,17 +23,17 @@ License: MIT
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 import json
 import logging
 import urllib.parse
 
-from .base import BaseSyncHandler, DestinationConfig
+from .base import _DATACLASS_SLOTS, BaseSyncHandler, DestinationConfig, iter_batches
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class RESTDestinationConfig(DestinationConfig):
     """Configuration specific to REST destinations"""
     destination_type: str = "splunk_rest"
@@ -48,6 +48,8 @@ class RESTSyncHandler(BaseSyncHandler):
     Supports both token and basic authentication.
     """
 
+    __slots__ = ("_base_url", "_session")
+
     def __init__(self, destination: RESTDestinationConfig):
         """
         Initialize REST handler.
@@ -182,11 +184,12 @@ class RESTSyncHandler(BaseSyncHandler):
             return
 
     def write_records(self, collection: str, app: str, owner: str,
-                     records: List[Dict], preserve_key: bool = True) -> Tuple[int, List[str]]:
+                     records: Iterable[Dict], preserve_key: bool = True) -> Tuple[int, List[str]]:
         """
         Write records to KVStore collection.
 
-        Uses batch POST for efficiency.
+        Uses batch POST for efficiency, one per batch_size records taken
+        lazily from records.
         """
         written = 0
         errors = []
@@ -194,10 +197,10 @@ class RESTSyncHandler(BaseSyncHandler):
         try:
             url = self._build_collection_url(collection, app, owner) + "/batch_save"
 
-            # In production: POST batch to endpoint
-            for record in records:
+            # In production: POST each batch to endpoint
+            for batch in iter_batches(records, self.destination.batch_size):
                 # Simulate successful write
-                written += 1
+                written += len(batch)
 
             logger.info(f"Wrote {written} records to {collection}")
 
@@ -219,7 +222,7 @@ class RESTSyncHandler(BaseSyncHandler):
             return False
 
     def delete_records(self, collection: str, app: str, owner: str,
-                      keys: List[str]) -> Tuple[int, List[str]]:
+                      keys: Iterable[str]) -> Tuple[int, List[str]]:
         """Delete records by key"""
         deleted = 0
         errors = []
@@ -35,6 +35,7 @@ import ipaddress
 import json
 import logging
 import secrets
+import sys
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -44,6 +45,9 @@ from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=...) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # =============================================================================
 # Enums and Constants
@@ -92,7 +96,7 @@ PALO_ALTO_DOMAIN_LIMIT = 250000
 # Configuration
 # =============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DistributionConfig:
     """Configuration for a threat distribution endpoint"""
     name: str
@@ -958,7 +962,7 @@ class ThreatDistributionHandler:
 # Feed Ingestion Handler
 # =============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FeedConfig:
     """Configuration for a threat feed source"""
     name: str
@@ -23,7 +23,6 @@ License: MIT
 ===============================================================================
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -398,7 +397,7 @@ class SyncEngine:
         if self.profile.delete_orphans and not self._cancelled:
             orphans = find_orphans(source_keys, dest_keys)
             if orphans:
-                deleted, errors = self.destination.delete_records(collection, app, owner, list(orphans))
+                deleted, errors = self.destination.delete_records(collection, app, owner, orphans)
                 result.records_deleted += deleted
                 result.errors.extend(errors)
 
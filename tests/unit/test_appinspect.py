@@ -0,0 +1,329 @@
+"""
+Unit tests for the AppInspect CI client
+
+===============================================================================
+PROVENANCE TRACKING
+===============================================================================
+File: tests/unit/test_appinspect.py
+Created: 2026-10-16
+Type: Unit Test Suite
+
+Change History:
+-------------------------------------------------------------------------------
+Date        Author      Type    Description
+-------------------------------------------------------------------------------
+2026-10-16  Dev         CREATE  Status long-poll timeout handling through the
+                                shared HTTP session.
+-------------------------------------------------------------------------------
+
+License: MIT
+===============================================================================
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from ci.scripts import appinspect
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class SlowStatusHandler(BaseHTTPRequestHandler):
+    """Answers every GET only after the client's read timeout has passed"""
+
+    hits = 0
+    delay = 1.0
+
+    def do_GET(self):
+        type(self).hits += 1
+        time.sleep(self.delay)
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b'{"status": "SUCCESS"}')
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def slow_server():
+    SlowStatusHandler.hits = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowStatusHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(monkeypatch, slow_server):
+    """AppInspectClient on a fresh shared session pointed at slow_server"""
+    monkeypatch.setattr(appinspect, "_SESSION", None)
+    monkeypatch.setattr(appinspect, "APPINSPECT_API_BASE", slow_server)
+
+    session = appinspect.get_shared_session()
+    # The shared adapter is mounted for https only; reuse it for the local server
+    session.mount("http://", session.get_adapter("https://appinspect.splunk.com"))
+
+    # Shorten the long-poll read timeout so the test doesn't wait wait+5 seconds
+    send = session.request
+
+    def request(method, url, **kwargs):
+        kwargs["timeout"] = 0.2
+        return send(method, url, **kwargs)
+
+    monkeypatch.setattr(session, "request", request)
+
+    config = appinspect.AppInspectConfig(
+        username="user",
+        password="pass",
+        package_path="app.tar.gz",
+        use_token_cache=False,
+    )
+    yield appinspect.AppInspectClient(config, session=session)
+    session.close()
+
+
+# =============================================================================
+# Status Long-Poll Tests
+# =============================================================================
+
+
+class TestStatusLongPoll:
+    """An expired long poll is PENDING and is not retried by the adapter"""
+
+    def test_read_timeout_reports_pending(self, client):
+        status, info = client.get_status("req-1", wait_seconds=1)
+
+        assert status == "PENDING"
+        assert info is None
+
+    def test_read_timeout_is_not_retried(self, client):
+        client.get_status("req-1", wait_seconds=1)
+
+        assert SlowStatusHandler.hits == 1
+
+    def test_shared_session_raises_read_timeout(self, client):
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            client._request(
+                "GET", f"{appinspect.APPINSPECT_API_BASE}/validate/status/x"
+            )
+
+
+# =============================================================================
+# Report Evaluation Tests
+# =============================================================================
+
+# Shape of a finished /v1/app/validate/status/{request_id} response: the
+# result counts are under "info"; only the JSON report has "summary"
+FINISHED_STATUS = {
+    "request_id": "req-1",
+    "status": "SUCCESS",
+    "info": {
+        "error": 0,
+        "failure": 0,
+        "skipped": 0,
+        "manual_check": 8,
+        "not_applicable": 71,
+        "warning": 7,
+        "success": 139,
+    },
+    "links": [
+        {"rel": "self", "href": "/v1/app/validate/status/req-1"},
+        {"rel": "report", "href": "/v1/app/report/req-1"},
+    ],
+}
+
+FAILED_STATUS = {
+    **FINISHED_STATUS,
+    "info": {**FINISHED_STATUS["info"], "failure": 2},
+}
+
+
+def make_config(tmp_path, **kwargs):
+    return appinspect.AppInspectConfig(
+        username="user",
+        password="pass",
+        package_path="app.tar.gz",
+        output_dir=str(tmp_path),
+        **kwargs,
+    )
+
+
+class TestReportPlan:
+    """Reports are planned from the status response's "info" counts"""
+
+    def test_html_only_skips_json_report(self, tmp_path):
+        config = make_config(tmp_path, report_formats=["html"])
+
+        assert appinspect._report_plan(config, FINISHED_STATUS) == (False, True)
+
+    def test_json_report_fetched_without_status_counts(self, tmp_path):
+        config = make_config(tmp_path, report_formats=["html"])
+        status = {"request_id": "req-1", "status": "SUCCESS"}
+
+        assert appinspect._report_plan(config, status) == (True, True)
+
+    def test_html_on_failure_skips_passing_run(self, tmp_path):
+        config = make_config(
+            tmp_path, report_formats=["html"], html_only_on_failure=True
+        )
+
+        assert appinspect._report_plan(config, FINISHED_STATUS) == (False, False)
+
+    def test_html_on_failure_fetches_failing_run(self, tmp_path):
+        config = make_config(
+            tmp_path, report_formats=["html"], html_only_on_failure=True
+        )
+
+        assert appinspect._report_plan(config, FAILED_STATUS) == (False, True)
+
+
+class TestEvaluateReport:
+    """The status counts only replace a JSON report that was skipped on purpose"""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return make_config(tmp_path, report_formats=["html"])
+
+    def test_missing_requested_report_is_an_error(self, config, tmp_path):
+        reporter = appinspect.AppInspectReporter(str(tmp_path))
+
+        passed, results = appinspect._evaluate_report(
+            config,
+            reporter,
+            "req-1",
+            None,
+            None,
+            FINISHED_STATUS,
+            report_requested=True,
+        )
+
+        assert passed is False
+        assert results == {"error": "Failed to retrieve report"}
+        assert list(tmp_path.iterdir()) == []
+
+    def test_skipped_report_uses_status_info(self, config, tmp_path):
+        reporter = appinspect.AppInspectReporter(str(tmp_path))
+
+        passed, results = appinspect._evaluate_report(
+            config,
+            reporter,
+            "req-1",
+            None,
+            None,
+            FINISHED_STATUS,
+            report_requested=False,
+        )
+
+        assert passed is True
+        assert results["summary"] == FINISHED_STATUS["info"]
+
+    def test_skipped_report_applies_thresholds(self, config, tmp_path):
+        reporter = appinspect.AppInspectReporter(str(tmp_path))
+
+        passed, _ = appinspect._evaluate_report(
+            config, reporter, "req-1", None, None, FAILED_STATUS, report_requested=False
+        )
+
+        assert passed is False
+
+
+# =============================================================================
+# Token Refresh Tests
+# =============================================================================
+
+
+class ExpiringTokenHandler(BaseHTTPRequestHandler):
+    """Rejects the "stale" token (slowly, so callers overlap) and issues "fresh" """
+
+    auth_hits = 0
+
+    def do_GET(self):
+        if self.headers.get("Authorization") == "Bearer fresh":
+            self._reply(200, b'{"summary": {"failure": 0}}')
+        else:
+            time.sleep(0.2)
+            self._reply(401, b"{}")
+
+    def do_POST(self):
+        type(self).auth_hits += 1
+        self._reply(200, b'{"data": {"token": "fresh"}}')
+
+    def _reply(self, code, body):
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def token_server(monkeypatch):
+    ExpiringTokenHandler.auth_hits = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ExpiringTokenHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(appinspect, "APPINSPECT_API_BASE", base)
+    monkeypatch.setattr(appinspect, "AUTH_API_BASE", f"{base}/auth")
+    yield base
+    server.shutdown()
+    server.server_close()
+
+
+class TestAuthRetry:
+    """Concurrent callers sharing a client refresh a rejected token once"""
+
+    def test_shared_client_reauthenticates_once(self, token_server):
+        config = appinspect.AppInspectConfig(
+            username="user",
+            password="pass",
+            package_path="app.tar.gz",
+            use_token_cache=False,
+        )
+        session = requests.Session()
+        client = appinspect.AppInspectClient(config, session=session)
+        client._token = "stale"
+        client._token_cached = True
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            reports = list(pool.map(client.get_report, ["a", "b", "c", "d"]))
+        session.close()
+
+        assert reports == [{"summary": {"failure": 0}}] * 4
+        assert ExpiringTokenHandler.auth_hits == 1
+
+    def test_uncached_token_is_not_refreshed(self, token_server):
+        config = appinspect.AppInspectConfig(
+            username="user",
+            password="pass",
+            package_path="app.tar.gz",
+            use_token_cache=False,
+        )
+        session = requests.Session()
+        client = appinspect.AppInspectClient(config, session=session)
+        client._token = "stale"
+
+        assert client.get_report("a") is None
+        session.close()
+
+        assert ExpiringTokenHandler.auth_hits == 0
@@ -26,8 +26,21 @@ import pytest
 from typing import Dict, Generator, List, Optional
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
-from unittest.mock import MagicMock, patch, AsyncMock
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch, AsyncMock
 import json
+import sys
+import threading
+import time
+
+# The handler implementations live under src/, which is not installed
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from kvstore_syncthing.handlers import base as handlers_base
+from kvstore_syncthing.handlers import factory as handlers_factory
+from kvstore_syncthing.handlers.factory import HandlerFactory
+from kvstore_syncthing.handlers.rest import RESTSyncHandler
+from kvstore_syncthing.sync_engine import SyncEngine, SyncMode, SyncProfile
 
 
 # =============================================================================
@@ -567,3 +580,349 @@ class TestHandlerConfigValidation:
         dest = MockRESTDestination(name="test", host="splunk.example.com")
 
         assert dest.port == 8089
+
+
+# =============================================================================
+# Handler Implementation Fixtures
+# =============================================================================
+
+@pytest.fixture
+def sdk_available(monkeypatch):
+    """Let handlers be constructed without splunk-sdk installed"""
+    monkeypatch.setattr(handlers_base, "SPLUNK_SDK_AVAILABLE", True)
+
+
+@pytest.fixture
+def factory(sdk_available):
+    """HandlerFactory with an empty handler cache"""
+    HandlerFactory.clear_cache()
+    yield HandlerFactory
+    HandlerFactory.clear_cache()
+
+
+def rest_config(name: str, host: Optional[str] = None) -> Dict:
+    return {"name": name, "host": host or f"{name}.example.com", "password": "token"}
+
+
+# =============================================================================
+# Handler Factory Cache Tests
+# =============================================================================
+
+class TestHandlerFactoryCache:
+    """Tests for HandlerFactory.get / clear_cache"""
+
+    def test_get_reuses_connected_handler(self, factory):
+        """Equal configs share one connected handler"""
+        first = factory.get("splunk_rest", rest_config("a"))
+        second = factory.get("splunk_rest", rest_config("a"))
+
+        assert first is second
+        assert first.is_connected
+
+    def test_get_separates_destinations(self, factory):
+        """Different configs get different handlers"""
+        first = factory.get("splunk_rest", rest_config("a"))
+        second = factory.get("splunk_rest", rest_config("b"))
+
+        assert first is not second
+
+    def test_get_reconnects_disconnected_handler(self, factory):
+        """A cached handler that lost its connection is reconnected by get"""
+        handler = factory.get("splunk_rest", rest_config("a"))
+        handler.disconnect()
+
+        assert factory.get("splunk_rest", rest_config("a")) is handler
+        assert handler.is_connected
+
+    def test_lru_eviction_disconnects_oldest(self, factory, monkeypatch):
+        """The least recently used handler is dropped and disconnected"""
+        monkeypatch.setattr(handlers_factory, "HANDLER_CACHE_SIZE", 2)
+
+        a = factory.get("splunk_rest", rest_config("a"))
+        b = factory.get("splunk_rest", rest_config("b"))
+        factory.get("splunk_rest", rest_config("a"))  # b is now least recent
+        factory.get("splunk_rest", rest_config("c"))
+
+        assert a.is_connected
+        assert not b.is_connected
+        assert factory.get("splunk_rest", rest_config("a")) is a
+        assert factory.get("splunk_rest", rest_config("b")) is not b
+
+    def test_clear_cache_disconnects_all(self, factory):
+        """clear_cache disconnects and forgets every cached handler"""
+        a = factory.get("splunk_rest", rest_config("a"))
+        b = factory.get("splunk_rest", rest_config("b"))
+
+        factory.clear_cache()
+
+        assert not a.is_connected
+        assert not b.is_connected
+        assert factory.get("splunk_rest", rest_config("a")) is not a
+
+    def test_slow_connect_does_not_block_other_destinations(self, factory, monkeypatch):
+        """get() for one destination doesn't wait on another's connect()"""
+        started = threading.Event()
+        release = threading.Event()
+
+        class SlowConnectHandler(RESTSyncHandler):
+            __slots__ = ()
+
+            def connect(self):
+                started.set()
+                release.wait(5)
+                return super().connect()
+
+        monkeypatch.setitem(HandlerFactory.HANDLER_TYPES, "slow_rest", SlowConnectHandler)
+        monkeypatch.setitem(
+            HandlerFactory.CONFIG_TYPES, "slow_rest", HandlerFactory.CONFIG_TYPES["splunk_rest"]
+        )
+
+        slow = threading.Thread(target=factory.get, args=("slow_rest", rest_config("slow")))
+        slow.start()
+        try:
+            assert started.wait(5)
+            begin = time.monotonic()
+            handler = factory.get("splunk_rest", rest_config("fast"))
+            elapsed = time.monotonic() - begin
+        finally:
+            release.set()
+            slow.join(5)
+
+        assert handler.is_connected
+        assert elapsed < 1
+
+
+# =============================================================================
+# Connection Check Cache Tests
+# =============================================================================
+
+class TestConnectionCheckCache:
+    """Tests for BaseSyncHandler.test_connection result reuse"""
+
+    @pytest.fixture
+    def handler(self, sdk_available):
+        handler = handlers_base.BaseSyncHandler(
+            handlers_base.DestinationConfig(name="test", destination_type="splunk_rest")
+        )
+        handler._connected = True
+        return handler
+
+    @staticmethod
+    def attach_service(handler, version: str) -> PropertyMock:
+        service = MagicMock()
+        info = PropertyMock(return_value={"version": version})
+        type(service).info = info
+        handler._service = service
+        return info
+
+    def test_success_reused_within_ttl(self, handler):
+        """A second check within the TTL skips the server-info call"""
+        info = self.attach_service(handler, "9.1")
+
+        assert handler.test_connection() == (True, "Connected to Splunk 9.1 via splunk-sdk")
+        assert handler.test_connection()[0] is True
+        assert info.call_count == 1
+
+    def test_success_rechecked_after_ttl(self, handler, monkeypatch):
+        """Once the TTL has passed the server is queried again"""
+        monkeypatch.setattr(handlers_base, "CONNECTION_CHECK_TTL", 0.0)
+        info = self.attach_service(handler, "9.1")
+
+        handler.test_connection()
+        handler.test_connection()
+
+        assert info.call_count == 2
+
+    def test_disconnect_drops_cached_success(self, handler):
+        """After a reconnect the new connection is checked, not the old result"""
+        self.attach_service(handler, "9.1")
+        handler.test_connection()
+
+        handler.disconnect()
+        handler._connected = True
+        info = self.attach_service(handler, "9.2")
+
+        assert handler.test_connection() == (True, "Connected to Splunk 9.2 via splunk-sdk")
+        assert info.call_count == 1
+
+
+# =============================================================================
+# Batched Write Input Tests
+# =============================================================================
+
+class TestIterBatches:
+    """Tests for handlers.base.iter_batches"""
+
+    def test_splits_into_batch_size_lists(self):
+        """Items are grouped into lists of batch_size, the last one shorter"""
+        assert list(handlers_base.iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_empty_input_yields_nothing(self):
+        """No items means no batches"""
+        assert list(handlers_base.iter_batches([], 3)) == []
+
+    def test_consumes_input_lazily(self):
+        """Only one batch is pulled from the source at a time"""
+        pulled = []
+
+        def source():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        batches = handlers_base.iter_batches(source(), 3)
+
+        assert next(batches) == [0, 1, 2]
+        assert pulled == [0, 1, 2]
+
+
+class TestDestinationConfig:
+    """Tests for the frozen destination config dataclasses"""
+
+    def test_batch_size_default(self):
+        """Handlers write 1000 records per round trip by default"""
+        config = handlers_base.DestinationConfig(name="d", destination_type="splunk_rest")
+
+        assert config.batch_size == 1000
+
+    def test_config_is_immutable(self):
+        """Assigning to a field raises; variants come from dataclasses.replace"""
+        import dataclasses
+
+        config = handlers_base.DestinationConfig(name="d", destination_type="splunk_rest")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.host = "other.example.com"
+
+        assert dataclasses.replace(config, host="other.example.com").host == "other.example.com"
+
+    def test_equal_configs_hash_equal(self):
+        """Equal configs are interchangeable dict keys"""
+        rest_config_class = HandlerFactory.CONFIG_TYPES["splunk_rest"]
+        first = rest_config_class(name="d", host="splunk.example.com")
+        second = rest_config_class(name="d", host="splunk.example.com")
+
+        assert first == second
+        assert {first: 1}[second] == 1
+
+    def test_factory_passes_type_specific_fields(self, sdk_available):
+        """create() sets subclass fields and batch_size, ignoring unknown keys"""
+        handler = HandlerFactory.create("mongodb_direct", {
+            "name": "m",
+            "host": "mongo.example.com",
+            "database": "kv",
+            "batch_size": 50,
+            "not_a_field": True,
+        })
+
+        assert handler.destination.database == "kv"
+        assert handler.destination.batch_size == 50
+        assert handler.destination.destination_type == "mongodb_direct"
+
+
+class TestWriteRecordsInput:
+    """write_records/delete_records accept any iterable of records"""
+
+    @pytest.fixture
+    def rest_handler(self, sdk_available):
+        handler = HandlerFactory.create("splunk_rest", {
+            "name": "r", "host": "splunk.example.com", "password": "t", "batch_size": 2,
+        })
+        handler.connect()
+        return handler
+
+    def test_rest_write_accepts_generator(self, rest_handler):
+        """A generator is written in batch_size chunks without a list()"""
+        records = ({"_key": f"rec-{i}"} for i in range(5))
+
+        written, errors = rest_handler.write_records("c", "search", "nobody", records)
+
+        assert written == 5
+        assert errors == []
+
+    def test_rest_delete_accepts_set(self, rest_handler):
+        """Orphan key sets can be passed straight to delete_records"""
+        deleted, errors = rest_handler.delete_records("c", "search", "nobody", {"a", "b", "c"})
+
+        assert deleted == 3
+        assert errors == []
+
+    def test_base_write_accepts_generator(self, sdk_available):
+        """The splunk-sdk write path consumes a generator record by record"""
+        handler = handlers_base.BaseSyncHandler(
+            handlers_base.DestinationConfig(name="d", destination_type="splunk_rest")
+        )
+        handler._service = MagicMock()
+
+        written, errors = handler.write_records(
+            "c", "search", "nobody", ({"_key": str(i)} for i in range(3))
+        )
+
+        data = handler._service.kvstore["c"].data
+        assert written == 3
+        assert errors == []
+        assert data.update.call_count == 3
+
+
+class TestWriteRecordsMany:
+    """Tests for BaseSyncHandler.write_records_many"""
+
+    @pytest.fixture
+    def handler(self, sdk_available):
+        handler = HandlerFactory.create("splunk_rest", {
+            "name": "r", "host": "splunk.example.com", "password": "t",
+        })
+        handler.connect()
+        return handler
+
+    def test_results_keyed_by_target(self, handler):
+        """Each (collection, app, owner) gets its own (written, errors)"""
+        results = handler.write_records_many([
+            ("a", "search", "nobody", [{"_key": "1"}, {"_key": "2"}]),
+            ("b", "search", "nobody", [{"_key": "3"}]),
+        ])
+
+        assert results == {
+            ("a", "search", "nobody"): (2, []),
+            ("b", "search", "nobody"): (1, []),
+        }
+
+    def test_duplicate_targets_are_summed(self, handler):
+        """A target listed twice reports the total written"""
+        results = handler.write_records_many([
+            ("a", "search", "nobody", [{"_key": "1"}]),
+            ("a", "search", "nobody", ({"_key": str(i)} for i in range(2, 5))),
+        ])
+
+        assert results == {("a", "search", "nobody"): (4, [])}
+
+    def test_stops_when_cancelled(self, handler):
+        """No further collections are written once the handler is cancelled"""
+        handler.cancel()
+
+        assert handler.write_records_many([("a", "search", "nobody", [{"_key": "1"}])]) == {}
+
+
+class TestSyncEngineTransformErrors:
+    """A failing transform_record stops the sync instead of becoming a write error"""
+
+    def test_transform_error_propagates_from_engine(self, sdk_available):
+        class FailingMappings(dict):
+            def get(self, key, default=None):
+                raise ValueError("bad field mapping")
+
+        source = MagicMock()
+        source.connect.return_value = True
+        source.read_records.return_value = iter([{"_key": "1"}, {"_key": "2"}])
+        destination = HandlerFactory.create("splunk_rest", {
+            "name": "r", "host": "splunk.example.com", "password": "t",
+        })
+        profile = SyncProfile(
+            name="p", sync_mode=SyncMode.FULL_SYNC, field_mappings=FailingMappings()
+        )
+
+        result = SyncEngine(source, destination, profile).sync("c")
+
+        assert result.success is False
+        assert result.error_message == "bad field mapping"
+        assert result.records_written == 0